@@ -5,6 +5,7 @@ This module demonstrates how to use the new Vertex AI components.
 """
 
 import asyncio
+from bisect import bisect_left
 from typing import List
 
 from psyai.platform.vertexai_integration import (
@@ -20,6 +21,10 @@ from psyai.platform.vertexai_integration import (
     get_vertexai_client,
 )
 
+# Scores above each threshold move up one label
+_CONFIDENCE_THRESHOLDS = (0.5, 0.8)
+_CONFIDENCE_LABELS = ("Low confidence", "Medium confidence", "High confidence")
+
 
 async def example_simple_client():
     """Example: Using the Vertex AI client directly."""
@@ -80,12 +85,7 @@ async def example_function_calling_agent():
 
     def calculate_confidence(score: float) -> str:
         """Calculate confidence level from a score."""
-        if score > 0.8:
-            return "High confidence"
-        elif score > 0.5:
-            return "Medium confidence"
-        else:
-            return "Low confidence"
+        return _CONFIDENCE_LABELS[bisect_left(_CONFIDENCE_THRESHOLDS, score)]
 
     agent = FunctionCallingAgent(
         functions=[get_user_data, calculate_confidence],
@@ -284,28 +284,44 @@ async def main():
     print("Vertex AI Integration Examples for PsyAI")
     print("=" * 60)
 
-    try:
-        await example_simple_client()
-        await example_simple_agent()
-        await example_conversational_agent()
-        await example_function_calling_agent()
-        await example_agent_builder()
-        await example_embeddings()
-        await example_vector_store()
-        await example_evaluation()
-        await example_custom_evaluation()
-        await example_batch_operations()
+    examples = [
+        example_simple_client,
+        example_simple_agent,
+        example_conversational_agent,
+        example_function_calling_agent,
+        example_agent_builder,
+        example_embeddings,
+        example_vector_store,
+        example_evaluation,
+        example_custom_evaluation,
+        example_batch_operations,
+    ]
+
+    # Examples are independent network-bound calls, so run them concurrently
+    results = await asyncio.gather(
+        *(example() for example in examples),
+        return_exceptions=True,
+    )
 
+    failures = [
+        (example.__name__, result)
+        for example, result in zip(examples, results)
+        if isinstance(result, Exception)
+    ]
+
+    if not failures:
         print("\n" + "=" * 60)
         print("All examples completed!")
         print("=" * 60)
+        return
 
-    except Exception as e:
-        print(f"\nError running examples: {e}")
-        print("\nMake sure you have:")
-        print("1. Set GCP_PROJECT_ID in your .env file")
-        print("2. Configured GCP authentication")
-        print("3. Enabled Vertex AI APIs in your GCP project")
+    for name, error in failures:
+        print(f"\nError running {name}: {error}")
+
+    print("\nMake sure you have:")
+    print("1. Set GCP_PROJECT_ID in your .env file")
+    print("2. Configured GCP authentication")
+    print("3. Enabled Vertex AI APIs in your GCP project")
 
 
 if __name__ == "__main__":
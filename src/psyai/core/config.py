@@ -5,12 +5,34 @@ This module provides centralized configuration using Pydantic Settings
 for type-safe environment variable management.
 """
 
-from functools import lru_cache
+import json
+import os
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Allowed values for validated settings
+_APP_ENVS = frozenset(("development", "staging", "production"))
+_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+_VECTOR_DB_TYPES = frozenset(("vertex-vector-search", "chroma", "memory"))
+
+# Path of a validated settings snapshot shared with forked workers
+_SETTINGS_CACHE_ENV = "PSYAI_SETTINGS_CACHE"
+
+# Fields masked by Settings.model_dump_safe
+_SENSITIVE_FIELDS = frozenset(
+    (
+        "secret_key",
+        "gcp_credentials_path",
+        "centaur_api_key",
+        "sentry_dsn",
+        "seed_admin_password",
+        "database_url",
+    )
+)
+
 
 class Settings(BaseSettings):
     """
@@ -73,6 +95,34 @@ class Settings(BaseSettings):
     vertex_max_tokens: int = Field(default=2048, description="Max output tokens")
     vertex_top_p: float = Field(default=0.95, description="Top-p sampling")
     vertex_top_k: int = Field(default=40, description="Top-k sampling")
+    vertex_token_count_cache_size: int = Field(
+        default=10_000,
+        description="Max token counts kept in the in-process LRU cache"
+    )
+    vertex_token_count_redis_cache_enabled: bool = Field(
+        default=False,
+        description="Persist token counts in Redis across restarts and workers"
+    )
+    vertex_response_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse Vertex AI responses for identical prompts (always on at temperature 0)"
+    )
+    vertex_response_cache_size: int = Field(
+        default=1024,
+        description="Max Vertex AI responses kept in the in-process LRU cache"
+    )
+    vertex_batch_max_concurrency: int = Field(
+        default=16,
+        description="Max concurrent generate calls per batch_generate/abatch_generate"
+    )
+    vertex_chat_max_turns: int = Field(
+        default=32,
+        description="Max user/model turns a conversational agent resends (0 = unbounded)"
+    )
+    vertex_chat_cache_buffer_turns: int = Field(
+        default=8,
+        description="Extra turns a conversational agent keeps before trimming back to max turns"
+    )
 
     # Vertex AI Embeddings Configuration
     vertex_embedding_model: str = Field(
@@ -80,6 +130,60 @@ class Settings(BaseSettings):
         description="Vertex AI embedding model"
     )
     vertex_embedding_dimension: int = Field(default=768, description="Embedding dimension")
+    vertex_embedding_batch_size: int = Field(
+        default=250,
+        description="Max texts per embedding request (provider limit)"
+    )
+    vertex_embedding_concurrency: int = Field(
+        default=8,
+        description="Max concurrent embedding requests per embed_documents call"
+    )
+    vertex_embedding_query_batch_size: int = Field(
+        default=64,
+        description="Max concurrent queries coalesced into one Vertex embedding request"
+    )
+    vertex_embedding_query_batch_delay_ms: float = Field(
+        default=10.0,
+        description="How long a Vertex query waits for others to join its batch (ms)"
+    )
+    vertex_embedding_normalize: bool = Field(
+        default=True,
+        description="L2-normalize embeddings so cosine similarity is a dot product"
+    )
+    vertex_embedding_cache_size: int = Field(
+        default=4096,
+        description="Max query embeddings kept in the in-process LRU cache"
+    )
+    vertex_embedding_redis_cache_enabled: bool = Field(
+        default=False,
+        description="Share embeddings across workers through Redis"
+    )
+    vertex_embedding_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Persist embeddings in a local SQLite cache here (used when Redis is off)"
+    )
+    vertex_embedding_cache_quantize: bool = Field(
+        default=False,
+        description="Store disk-cached embeddings as int8 (4x smaller)"
+    )
+    vertex_embedding_warmup_queries: List[str] = Field(
+        default=[],
+        description="Queries embedded at service start and pinned in memory"
+    )
+
+    # Vertex AI Batch Prediction Configuration
+    vertex_batch_mode_enabled: bool = Field(
+        default=False,
+        description="Route large offline embedding workloads through batch prediction"
+    )
+    vertex_batch_min_requests: int = Field(
+        default=50,
+        description="Minimum number of inputs before a batch prediction job is used"
+    )
+    vertex_batch_gcs_prefix: Optional[str] = Field(
+        default=None,
+        description="GCS prefix (gs://bucket/path) for batch prediction input and output"
+    )
 
     # Vertex AI Evaluation Configuration
     vertex_eval_enabled: bool = Field(default=True, description="Enable Vertex AI evaluation")
@@ -87,6 +191,56 @@ class Settings(BaseSettings):
         default=["coherence", "fluency", "safety", "groundedness"],
         description="Vertex AI evaluation metrics"
     )
+    vertex_eval_concurrency: int = Field(
+        default=16,
+        description="Max concurrent evaluations per abatch_evaluate call"
+    )
+    vertex_eval_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse evaluation scores for identical inputs and metrics"
+    )
+    vertex_eval_cache_size: int = Field(
+        default=4096,
+        description="Max evaluation results kept in the in-process LRU cache"
+    )
+
+    # LangChain LLM Client
+    llm_batch_max_concurrency: int = Field(
+        default=10,
+        description="Max concurrent LLM calls per batch_generate/abatch_generate"
+    )
+    llm_token_count_cache_size: int = Field(
+        default=10_000,
+        description="Max token counts kept by LangChainClient.get_num_tokens"
+    )
+    llm_response_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse responses for identical prompts and generation parameters"
+    )
+    llm_response_cache_size: int = Field(
+        default=1024,
+        description="Max responses kept in the in-process LRU cache"
+    )
+    llm_response_redis_cache_enabled: bool = Field(
+        default=False,
+        description="Also keep cached responses in Redis across workers and restarts"
+    )
+    llm_response_cache_ttl: int = Field(
+        default=86400,
+        description="Redis TTL for cached LLM responses (seconds)"
+    )
+    conversation_reply_cache_size: int = Field(
+        default=256,
+        description="Max replies cached per ConversationManager for resent messages"
+    )
+    conversation_max_sessions: int = Field(
+        default=10000,
+        description="Max session histories kept in process; least recently used are dropped"
+    )
+    conversation_session_ttl: Optional[int] = Field(
+        default=None,
+        description="Drop session histories idle for this long (seconds, None = never)"
+    )
 
     # Centaur Model Configuration
     centaur_api_key: Optional[str] = Field(default=None, description="Centaur API key")
@@ -98,16 +252,56 @@ class Settings(BaseSettings):
     # Vector Database Configuration
     vector_db_type: str = Field(
         default="vertex-vector-search",
-        description="Vector DB type: vertex-vector-search, chroma"
+        description="Vector DB type: vertex-vector-search, chroma, memory (in-process)"
+    )
+    vectorstore_flush_threshold: int = Field(
+        default=1024,
+        description="Buffered texts written per vector store call inside bulk_writer()"
+    )
+    memory_store_quantize: bool = Field(
+        default=False,
+        description="Store in-memory vector store vectors as int8 (4x less memory)"
     )
 
     # Vertex AI Vector Search
     vertex_index_id: Optional[str] = Field(default=None, description="Vertex Vector Search index ID")
     vertex_index_endpoint_id: Optional[str] = Field(default=None, description="Vertex Vector Search endpoint ID")
     vertex_deployed_index_id: Optional[str] = Field(default=None, description="Deployed index ID")
+    vertex_upsert_batch_size: int = Field(
+        default=1000,
+        description="Max datapoints per Vector Search upsert_datapoints request"
+    )
+    vertex_upsert_concurrency: int = Field(
+        default=16,
+        description="Max concurrent Vector Search upsert requests per aadd_texts call"
+    )
+    vertex_remove_batch_size: int = Field(
+        default=1000,
+        description="Max datapoint IDs per Vector Search remove_datapoints request"
+    )
+    vertex_remove_concurrency: int = Field(
+        default=8,
+        description="Max concurrent Vector Search remove requests per delete/adelete call"
+    )
+    vertex_vector_search_workers: int = Field(
+        default=32,
+        description="Threads running blocking Vector Search calls for async callers"
+    )
+    vertex_local_index_max_size: int = Field(
+        default=100_000,
+        description="Max vectors held in the in-process index before search falls back to Vector Search"
+    )
+    vertex_local_index_quantize: bool = Field(
+        default=False,
+        description="Store in-process index vectors as int8 (4x less memory)"
+    )
 
     # Chroma (for backward compatibility)
     chroma_persist_directory: str = Field(default="./chroma_db", description="Chroma persistence directory")
+    vector_mmap_mirror: bool = Field(
+        default=False,
+        description="Mirror stored embeddings into a memory-mapped float32 file in the Chroma directory"
+    )
 
     # Embedding Configuration
     embedding_model: str = Field(
@@ -115,6 +309,42 @@ class Settings(BaseSettings):
         description="Embedding model",
     )
     embedding_dimension: int = Field(default=384, description="Embedding dimension")
+    embedding_normalize: bool = Field(
+        default=True,
+        description="L2-normalize embeddings so cosine similarity is a dot product"
+    )
+    embedding_batch_size: int = Field(
+        default=64,
+        description="Max texts per embedding call in aembed_documents"
+    )
+    embedding_max_concurrency: int = Field(
+        default=5,
+        description="Max concurrent embedding calls per aembed_documents call"
+    )
+    embedding_cache_size: int = Field(
+        default=10_000,
+        description="Max embeddings kept in the in-process LRU cache"
+    )
+    embedding_max_batch_size: int = Field(
+        default=64,
+        description="Max concurrent queries coalesced into one embedding call"
+    )
+    embedding_max_batch_delay_ms: float = Field(
+        default=10.0,
+        description="How long a query waits for others to join its batch (ms)"
+    )
+    embedding_workers: int = Field(
+        default=4,
+        description="Threads running local (HuggingFace) embedding models for async callers"
+    )
+    embedding_device: Optional[str] = Field(
+        default=None,
+        description="Device for HuggingFace embedding models (cuda if available when unset)"
+    )
+    embedding_half_precision: bool = Field(
+        default=True,
+        description="Run HuggingFace embedding models in float16 when on a CUDA device"
+    )
 
     # RAG Configuration
     rag_chunk_size: int = Field(default=1000, description="RAG chunk size")
@@ -168,29 +398,29 @@ class Settings(BaseSettings):
     @classmethod
     def validate_app_env(cls, v: str) -> str:
         """Validate application environment."""
-        allowed = ["development", "staging", "production"]
-        if v not in allowed:
-            raise ValueError(f"app_env must be one of {allowed}")
+        if v not in _APP_ENVS:
+            raise ValueError(f"app_env must be one of {', '.join(sorted(_APP_ENVS))}")
         return v
 
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level."""
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v_upper = v.upper()
-        if v_upper not in allowed:
-            raise ValueError(f"log_level must be one of {allowed}")
+        if v_upper not in _LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {', '.join(sorted(_LOG_LEVELS))}")
         return v_upper
 
     @field_validator("vector_db_type")
     @classmethod
     def validate_vector_db_type(cls, v: str) -> str:
         """Validate vector database type."""
-        allowed = ["vertex-vector-search", "chroma"]
-        if v.lower() not in allowed:
-            raise ValueError(f"vector_db_type must be one of {allowed}")
-        return v.lower()
+        v_lower = v.lower()
+        if v_lower not in _VECTOR_DB_TYPES:
+            raise ValueError(
+                f"vector_db_type must be one of {', '.join(sorted(_VECTOR_DB_TYPES))}"
+            )
+        return v_lower
 
     @property
     def is_development(self) -> bool:
@@ -207,9 +437,14 @@ class Settings(BaseSettings):
         """Check if running in staging mode."""
         return self.app_env == "staging"
 
+    @cached_property
+    def database_url_async(self) -> str:
+        """Async database URL for SQLAlchemy (computed once per instance)."""
+        return self.database_url.replace("postgresql://", "postgresql+asyncpg://")
+
     def get_database_url_async(self) -> str:
         """Get async database URL for SQLAlchemy."""
-        return self.database_url.replace("postgresql://", "postgresql+asyncpg://")
+        return self.database_url_async
 
     def model_dump_safe(self) -> Dict[str, Any]:
         """
@@ -221,27 +456,70 @@ class Settings(BaseSettings):
         data = self.model_dump()
 
         # Mask sensitive fields
-        sensitive_fields = [
-            "secret_key",
-            "gcp_credentials_path",
-            "centaur_api_key",
-            "sentry_dsn",
-            "seed_admin_password",
-            "database_url",
-        ]
-
-        for field in sensitive_fields:
-            if field in data and data[field]:
+        for field in _SENSITIVE_FIELDS:
+            if data.get(field):
                 data[field] = "***MASKED***"
 
         return data
 
 
+def _load_settings_snapshot(path: str) -> Optional[Settings]:
+    """
+    Load settings from a snapshot without re-running validation.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        Settings instance, or None if the snapshot is missing, unreadable or
+        was written for a different set of fields
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or set(data) != set(Settings.model_fields):
+        return None
+    return Settings.model_construct(**data)
+
+
+def _write_settings_snapshot(path: str, instance: Settings) -> None:
+    """
+    Write a validated settings snapshot atomically.
+
+    The snapshot holds secrets (secret_key, database_url, API keys), so the
+    file is created readable by the owner only.
+
+    Args:
+        path: Snapshot file path
+        instance: Validated settings
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # O_CREAT leaves the mode of a leftover tmp file unchanged
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(instance.model_dump(mode="json"), f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # A missing snapshot only costs workers a normal settings load
+        pass
+
+
 @lru_cache()
 def get_settings() -> Settings:
     """
     Get cached settings instance.
 
+    When PSYAI_SETTINGS_CACHE names a file, the first process to load
+    settings writes the validated values there (JSON) and later processes,
+    such as forked server workers, build Settings from it with
+    model_construct, skipping .env parsing and validation. Point it at a
+    per-deployment path so a stale snapshot is never picked up.
+
     Returns:
         Settings instance
 
@@ -249,7 +527,17 @@ def get_settings() -> Settings:
         This is cached to avoid reading .env file multiple times.
         In tests, clear the cache with get_settings.cache_clear()
     """
-    return Settings()
+    snapshot_path = os.environ.get(_SETTINGS_CACHE_ENV)
+    if not snapshot_path:
+        return Settings()
+
+    snapshot = _load_settings_snapshot(snapshot_path)
+    if snapshot is not None:
+        return snapshot
+
+    instance = Settings()
+    _write_settings_snapshot(snapshot_path, instance)
+    return instance
 
 
 # Export singleton instance
@@ -169,11 +169,24 @@ class LLMTimeoutError(LLMError):
 
 
 class LLMRateLimitError(LLMError):
-    """Exception raised when LLM rate limit is hit."""
+    """
+    Exception raised when LLM rate limit is hit.
 
-    def __init__(self, message: str = "LLM rate limit exceeded", details: Optional[Dict[str, Any]] = None):
+    Attributes:
+        retry_after: Seconds the provider asked to wait (Retry-After), if known
+    """
+
+    def __init__(
+        self,
+        message: str = "LLM rate limit exceeded",
+        details: Optional[Dict[str, Any]] = None,
+        retry_after: Optional[float] = None,
+    ):
         super().__init__(message, details=details)
         self.code = "LLM_RATE_LIMIT"
+        self.retry_after = retry_after
+        if retry_after is not None:
+            self.details["retry_after"] = retry_after
 
 
 class LLMInvalidResponseError(LLMError):
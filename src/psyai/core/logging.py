@@ -5,6 +5,7 @@ This module provides a structured logging setup using structlog
 for better log analysis and debugging.
 """
 
+import json
 import logging
 import sys
 from typing import Any, Dict, Optional
@@ -14,6 +15,12 @@ from structlog.types import EventDict, Processor
 
 from psyai.core.config import settings
 
+try:
+    # Faster JSON serialization (pip install psyai[fast-json])
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """
@@ -78,6 +85,20 @@ def censor_sensitive_data(logger: Any, method_name: str, event_dict: EventDict)
     return event_dict
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialize a log event with orjson for structlog's JSONRenderer.
+
+    Args:
+        obj: Event dictionary
+        **kwargs: Renderer options (only ``default`` is used)
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
+
 def setup_logging(log_level: Optional[str] = None, json_logs: bool = False) -> None:
     """
     Configure structured logging for the application.
@@ -96,8 +117,9 @@ def setup_logging(log_level: Optional[str] = None, json_logs: bool = False) -> N
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
-    # Define processors
+    # Define processors; events below the level are dropped before any other work
     shared_processors: list[Processor] = [
+        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
@@ -110,7 +132,9 @@ def setup_logging(log_level: Optional[str] = None, json_logs: bool = False) -> N
         # JSON output for production
         processors = shared_processors + [
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps if orjson is not None else json.dumps
+            ),
         ]
     else:
         # Console output for development
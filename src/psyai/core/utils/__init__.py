@@ -2,9 +2,10 @@
 Utility functions for PsyAI.
 
 This module provides various utility functions for retry logic,
-validation, decorators, and time handling.
+validation, decorators, caching, lazy package exports, vector similarity, and time handling.
 """
 
+from psyai.core.utils.cache import LRUCache, make_cache_key
 from psyai.core.utils.decorators import (
     deprecated,
     log_entry_exit,
@@ -13,11 +14,20 @@ from psyai.core.utils.decorators import (
     singleton,
     timer,
 )
+from psyai.core.utils.lazy import lazy_exports
 from psyai.core.utils.retry import (
     exponential_backoff,
     retry_async,
     retry_sync,
 )
+from psyai.core.utils.similarity import (
+    cosine_similarities,
+    cosine_similarity,
+    dequantize_int8,
+    l2_normalize_inplace,
+    quantize_int8,
+    top_k_indices,
+)
 from psyai.core.utils.time_utils import (
     add_time,
     days_between,
@@ -46,6 +56,9 @@ from psyai.core.utils.validators import (
 )
 
 __all__ = [
+    # Cache
+    "LRUCache",
+    "make_cache_key",
     # Decorators
     "deprecated",
     "log_entry_exit",
@@ -53,10 +66,19 @@ __all__ = [
     "rate_limit",
     "singleton",
     "timer",
+    # Lazy exports
+    "lazy_exports",
     # Retry
     "exponential_backoff",
     "retry_async",
     "retry_sync",
+    # Similarity
+    "cosine_similarities",
+    "cosine_similarity",
+    "dequantize_int8",
+    "l2_normalize_inplace",
+    "quantize_int8",
+    "top_k_indices",
     # Time utilities
     "add_time",
     "days_between",
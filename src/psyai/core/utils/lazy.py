@@ -0,0 +1,49 @@
+"""
+Lazy package exports.
+
+Provides the module-level ``__getattr__``/``__dir__`` pair (PEP 562) that lets
+a package list its public names without importing the submodules (and their
+SDKs) that define them until one is first used.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_exports(
+    module_name: str, mapping: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for a package with lazy exports.
+
+    Each exported name is imported from its submodule on first access and
+    then stored on the package, so later lookups skip ``__getattr__``.
+
+    Args:
+        module_name: Name of the package defining the exports (its ``__name__``)
+        mapping: Exported name to the module it is imported from
+
+    Returns:
+        ``(__getattr__, __dir__)`` functions to assign in the package
+
+    Example:
+        >>> _LAZY_IMPORTS = {"VertexAIClient": "psyai.platform.vertexai_integration.client"}
+        >>> __all__ = list(_LAZY_IMPORTS)
+        >>> __getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+    """
+
+    def __getattr__(name: str) -> Any:
+        """Import exported names on first access and cache them on the module."""
+        source = mapping.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(source), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(mapping))
+
+    return __getattr__, __dir__
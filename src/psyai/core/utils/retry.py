@@ -55,6 +55,49 @@ def exponential_backoff(
     return max(0, delay)
 
 
+def _retry_delay(
+    error: Exception,
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    exponential_base: float,
+    jitter: bool,
+    respect_retry_after: bool,
+) -> float:
+    """
+    Compute the delay before the next attempt.
+
+    A ``retry_after`` attribute on the error (e.g. parsed from a Retry-After
+    header) raises the backoff delay to at least that value, capped at
+    max_delay, so retries don't land before the server will accept them.
+
+    Args:
+        error: Exception raised by the failed attempt
+        attempt: Current attempt number (0-indexed)
+        base_delay: Base delay in seconds
+        max_delay: Maximum delay in seconds
+        exponential_base: Base for exponential calculation
+        jitter: Whether to add random jitter
+        respect_retry_after: Whether to honor the error's retry_after
+
+    Returns:
+        Delay in seconds
+    """
+    delay = exponential_backoff(
+        attempt,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        exponential_base=exponential_base,
+        jitter=jitter,
+    )
+
+    retry_after = getattr(error, "retry_after", None) if respect_retry_after else None
+    if retry_after is not None:
+        delay = min(max(delay, float(retry_after)), max_delay)
+
+    return delay
+
+
 def retry_sync(
     max_attempts: int = 3,
     exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
@@ -63,6 +106,7 @@ def retry_sync(
     exponential_base: float = 2.0,
     jitter: bool = True,
     on_retry: Optional[Callable[[Exception, int], None]] = None,
+    respect_retry_after: bool = True,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator to retry a synchronous function with exponential backoff.
@@ -75,6 +119,8 @@ def retry_sync(
         exponential_base: Base for exponential calculation
         jitter: Whether to add random jitter
         on_retry: Optional callback function called on each retry
+        respect_retry_after: Wait at least the exception's ``retry_after``
+            seconds (if set) before retrying
 
     Returns:
         Decorated function
@@ -98,12 +144,14 @@ def retry_sync(
                     last_exception = e
 
                     if attempt < max_attempts - 1:
-                        delay = exponential_backoff(
+                        delay = _retry_delay(
+                            e,
                             attempt,
                             base_delay=base_delay,
                             max_delay=max_delay,
                             exponential_base=exponential_base,
                             jitter=jitter,
+                            respect_retry_after=respect_retry_after,
                         )
 
                         logger.warning(
@@ -143,6 +191,7 @@ def retry_async(
     exponential_base: float = 2.0,
     jitter: bool = True,
     on_retry: Optional[Callable[[Exception, int], None]] = None,
+    respect_retry_after: bool = True,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator to retry an asynchronous function with exponential backoff.
@@ -155,6 +204,8 @@ def retry_async(
         exponential_base: Base for exponential calculation
         jitter: Whether to add random jitter
         on_retry: Optional callback function called on each retry
+        respect_retry_after: Wait at least the exception's ``retry_after``
+            seconds (if set) before retrying
 
     Returns:
         Decorated async function
@@ -178,12 +229,14 @@ def retry_async(
                     last_exception = e
 
                     if attempt < max_attempts - 1:
-                        delay = exponential_backoff(
+                        delay = _retry_delay(
+                            e,
                             attempt,
                             base_delay=base_delay,
                             max_delay=max_delay,
                             exponential_base=exponential_base,
                             jitter=jitter,
+                            respect_retry_after=respect_retry_after,
                         )
 
                         logger.warning(
@@ -0,0 +1,163 @@
+"""
+Vector similarity utilities.
+
+Provides cosine similarity for embeddings that are not known to be
+L2-normalized (normalized embeddings only need a dot product), in-place
+L2 normalization, top-k selection over score arrays, and symmetric int8
+quantization for compact embedding storage.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Compute the cosine similarity of two vectors.
+
+    Uses vdot for both squared norms and a single sqrt, which avoids the
+    dispatch overhead of two np.linalg.norm calls.
+
+    Args:
+        a: First vector
+        b: Second vector
+
+    Returns:
+        Cosine similarity in [-1, 1] (0.0 if either vector is zero)
+
+    Example:
+        >>> cosine_similarity(np.array([1.0, 0.0]), np.array([1.0, 1.0]))
+        0.7071...
+    """
+    denominator = np.sqrt(np.vdot(a, a) * np.vdot(b, b))
+    if denominator == 0:
+        return 0.0
+    return float(np.dot(a, b) / denominator)
+
+
+def cosine_similarities(
+    query: np.ndarray,
+    matrix: np.ndarray,
+    row_norms_sq: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute the cosine similarity of a query against every row of a matrix.
+
+    Callers that score the same matrix repeatedly should compute
+    ``row_norms_sq`` once and pass it in, which saves a full pass over the
+    matrix per query.
+
+    Args:
+        query: Query vector of shape (dimension,)
+        matrix: Matrix of shape (n, dimension)
+        row_norms_sq: Precomputed squared norm of each row, shape (n,)
+
+    Returns:
+        Similarity per row, shape (n,) (0.0 for zero rows)
+
+    Example:
+        >>> cosine_similarities(np.array([1.0, 0.0]), np.eye(2))
+        array([1., 0.])
+    """
+    if row_norms_sq is None:
+        row_norms_sq = np.einsum("ij,ij->i", matrix, matrix)
+    denominator = np.sqrt(np.vdot(query, query) * row_norms_sq)
+    dots = matrix @ query
+    return np.divide(dots, denominator, out=np.zeros_like(dots), where=denominator > 0)
+
+
+def l2_normalize_inplace(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize the rows of a float matrix in place.
+
+    Zero rows are divided by 1 instead of being special-cased, so the whole
+    matrix is normalized in one vectorized pass with no per-row branches or
+    temporary copy of the matrix.
+
+    Args:
+        matrix: Writable float matrix with one vector per row (or a single vector)
+
+    Returns:
+        The same matrix with unit-length rows (zero rows are left unchanged)
+
+    Example:
+        >>> l2_normalize_inplace(np.array([[3.0, 4.0], [0.0, 0.0]]))
+        array([[0.6, 0.8],
+               [0. , 0. ]])
+    """
+    norms = np.sqrt(np.einsum("...i,...i->...", matrix, matrix))[..., None]
+    norms = np.where(norms == 0, 1.0, norms)
+    np.divide(matrix, norms, out=matrix)
+    return matrix
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the indices of the k highest scores, highest first.
+
+    Selects the k best with argpartition in O(n) and sorts only those, instead
+    of sorting all n scores.
+
+    Args:
+        scores: Score per item, shape (n,)
+        k: Number of indices to return
+
+    Returns:
+        Indices of the top min(k, n) scores in descending score order
+
+    Example:
+        >>> top_k_indices(np.array([0.1, 0.9, 0.5, 0.7]), 2)
+        array([1, 3])
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= len(scores):
+        return np.argsort(-scores)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+def quantize_int8(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize rows of a float matrix to int8 with a float32 scale per row.
+
+    Each row is divided by max(|row|) / 127 and rounded, so ``q * scale[:, None]``
+    approximates the input. Cosine similarity is invariant to the per-row
+    scale, so int8 rows can be compared directly with a cosine kernel.
+
+    Args:
+        matrix: Matrix of shape (n, dimension), or a single vector
+
+    Returns:
+        Tuple of (int8 matrix of shape (n, dimension), float32 scales of shape (n,))
+
+    Example:
+        >>> q, scales = quantize_int8(np.array([[0.5, -1.0]]))
+        >>> q
+        array([[  64, -127]], dtype=int8)
+    """
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    scales = np.maximum(np.abs(matrix).max(axis=1), 1e-12) / 127.0
+    quantized = np.rint(matrix / scales[:, None]).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def dequantize_int8(quantized: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """
+    Restore float32 rows from int8 rows and their per-row scales.
+
+    Inverse of quantize_int8, up to rounding error.
+
+    Args:
+        quantized: int8 matrix of shape (n, dimension)
+        scales: float32 scale per row, shape (n,)
+
+    Returns:
+        float32 matrix of shape (n, dimension)
+
+    Example:
+        >>> dequantize_int8(*quantize_int8(np.array([[0.5, -1.0]])))
+        array([[ 0.503937, -1.      ]], dtype=float32)
+    """
+    return quantized.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
@@ -2,45 +2,39 @@
 Platform layer for PsyAI.
 
 This module provides platform services that features depend on.
+
+Importing a single platform subpackage does not load the Vertex AI SDK and
+its gRPC/auth stack; exports are imported on first use.
 """
 
+from psyai.core.utils.lazy import lazy_exports
+
 # Vertex AI integration (primary)
-from psyai.platform.vertexai_integration import (
-    AgentBuilder,
-    AgentResponse,
-    ConversationalAgent,
-    CustomMetricEvaluator,
-    Document,
-    EvaluationResult,
-    FunctionCallingAgent,
-    SimpleAgent,
-    VertexAIClient,
-    VertexEmbeddingService,
-    VertexEvaluator,
-    VertexVectorStoreManager,
-    get_vertex_embedding_service,
-    get_vertex_evaluator,
-    get_vertexai_client,
-)
+_VERTEXAI = "psyai.platform.vertexai_integration"
 
-__all__ = [
+_LAZY_IMPORTS = {
     # Vertex AI - Client
-    "VertexAIClient",
-    "get_vertexai_client",
+    "VertexAIClient": _VERTEXAI,
+    "aget_vertexai_client": _VERTEXAI,
+    "get_vertexai_client": _VERTEXAI,
     # Vertex AI - Agents
-    "AgentBuilder",
-    "AgentResponse",
-    "ConversationalAgent",
-    "FunctionCallingAgent",
-    "SimpleAgent",
+    "AgentBuilder": _VERTEXAI,
+    "AgentResponse": _VERTEXAI,
+    "ConversationalAgent": _VERTEXAI,
+    "FunctionCallingAgent": _VERTEXAI,
+    "SimpleAgent": _VERTEXAI,
     # Vertex AI - RAG
-    "Document",
-    "VertexEmbeddingService",
-    "VertexVectorStoreManager",
-    "get_vertex_embedding_service",
+    "Document": _VERTEXAI,
+    "VertexEmbeddingService": _VERTEXAI,
+    "VertexVectorStoreManager": _VERTEXAI,
+    "get_vertex_embedding_service": _VERTEXAI,
     # Vertex AI - Evaluation
-    "CustomMetricEvaluator",
-    "EvaluationResult",
-    "VertexEvaluator",
-    "get_vertex_evaluator",
-]
+    "CustomMetricEvaluator": _VERTEXAI,
+    "EvaluationResult": _VERTEXAI,
+    "VertexEvaluator": _VERTEXAI,
+    "get_vertex_evaluator": _VERTEXAI,
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
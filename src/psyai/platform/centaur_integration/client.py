@@ -74,10 +74,15 @@ class CentaurClient:
                 message="No Centaur API key configured. Set CENTAUR_API_KEY environment variable.",
             )
 
-        # Create HTTP client
+        # Create HTTP client (keep-alive pool so repeat calls skip the TLS handshake)
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=30.0,
+            ),
             headers={
                 "Authorization": f"Bearer {self.api_key}" if self.api_key else "",
                 "Content-Type": "application/json",
@@ -21,54 +21,41 @@ Example:
     >>> vectorstore = VectorStoreManager()
     >>> await vectorstore.aadd_texts(["PsyAI is awesome!"])
     >>> results = await vectorstore.asimilarity_search("What is PsyAI?")
-"""
 
-# Client
-from psyai.platform.langchain_integration.client import (
-    LangChainClient,
-    get_langchain_client,
-)
+LangChain is not loaded until one of these components is actually used.
+"""
 
-# Chains
-from psyai.platform.langchain_integration.chains import (
-    BaseChainBuilder,
-    ConversationManager,
-    create_chain_with_fallback,
-    create_chain_with_history,
-    create_chat_chain,
-    create_chat_memory,
-    create_conversational_chain,
-    create_map_reduce_chain,
-    create_sequential_chain,
-    create_simple_chain,
-)
+from psyai.core.utils.lazy import lazy_exports
 
-# RAG
-from psyai.platform.langchain_integration.rag import (
-    EmbeddingService,
-    VectorStoreManager,
-    get_embedding_service,
-)
+_CLIENT = "psyai.platform.langchain_integration.client"
+_CHAINS = "psyai.platform.langchain_integration.chains"
+_RAG = "psyai.platform.langchain_integration.rag"
 
-__all__ = [
+_LAZY_IMPORTS = {
     # Client
-    "LangChainClient",
-    "get_langchain_client",
+    "LangChainClient": _CLIENT,
+    "get_langchain_client": _CLIENT,
     # Chains - Base
-    "BaseChainBuilder",
-    "create_chain_with_fallback",
-    "create_chat_chain",
-    "create_map_reduce_chain",
-    "create_sequential_chain",
-    "create_simple_chain",
+    "BaseChainBuilder": _CHAINS,
+    "create_chain_with_fallback": _CHAINS,
+    "create_chat_chain": _CHAINS,
+    "create_map_reduce_chain": _CHAINS,
+    "create_parallel_chain": _CHAINS,
+    "create_sequential_chain": _CHAINS,
+    "create_simple_chain": _CHAINS,
+    "run_map_reduce": _CHAINS,
     # Chains - Conversational
-    "ConversationManager",
-    "create_chain_with_history",
-    "create_chat_memory",
-    "create_conversational_chain",
+    "ConversationManager": _CHAINS,
+    "create_chain_with_history": _CHAINS,
+    "create_chat_memory": _CHAINS,
+    "create_conversational_chain": _CHAINS,
     # RAG - Embeddings
-    "EmbeddingService",
-    "get_embedding_service",
+    "EmbeddingService": _RAG,
+    "get_embedding_service": _RAG,
     # RAG - Vector Stores
-    "VectorStoreManager",
-]
+    "VectorStoreManager": _RAG,
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
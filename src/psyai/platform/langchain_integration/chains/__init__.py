@@ -2,34 +2,45 @@
 Chain templates and builders for LangChain.
 
 This module provides reusable chain templates for common patterns.
+Exports are resolved lazily (PEP 562) on first access.
 """
 
-from psyai.platform.langchain_integration.chains.base import (
-    BaseChainBuilder,
-    create_chain_with_fallback,
-    create_chat_chain,
-    create_map_reduce_chain,
-    create_sequential_chain,
-    create_simple_chain,
-)
-from psyai.platform.langchain_integration.chains.conversational import (
-    ConversationManager,
-    create_chain_with_history,
-    create_chat_memory,
-    create_conversational_chain,
-)
-
-__all__ = [
+import importlib
+from typing import Any, List
+
+_BASE = "psyai.platform.langchain_integration.chains.base"
+_CONVERSATIONAL = "psyai.platform.langchain_integration.chains.conversational"
+
+_LAZY_IMPORTS = {
     # Base chains
-    "BaseChainBuilder",
-    "create_chain_with_fallback",
-    "create_chat_chain",
-    "create_map_reduce_chain",
-    "create_sequential_chain",
-    "create_simple_chain",
+    "BaseChainBuilder": _BASE,
+    "create_chain_with_fallback": _BASE,
+    "create_chat_chain": _BASE,
+    "create_map_reduce_chain": _BASE,
+    "create_parallel_chain": _BASE,
+    "create_sequential_chain": _BASE,
+    "create_simple_chain": _BASE,
+    "run_map_reduce": _BASE,
     # Conversational chains
-    "ConversationManager",
-    "create_chain_with_history",
-    "create_chat_memory",
-    "create_conversational_chain",
-]
+    "ConversationManager": _CONVERSATIONAL,
+    "create_chain_with_history": _CONVERSATIONAL,
+    "create_chat_memory": _CONVERSATIONAL,
+    "create_conversational_chain": _CONVERSATIONAL,
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access and cache them on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
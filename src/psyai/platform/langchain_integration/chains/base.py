@@ -4,18 +4,75 @@ Base chain templates and builders.
 This module provides reusable chain templates for common LangChain patterns.
 """
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
-from langchain_core.runnables import Runnable, RunnablePassthrough
+from langchain_core.runnables import (
+    Runnable,
+    RunnableLambda,
+    RunnableParallel,
+    RunnablePassthrough,
+)
 
 from psyai.core.logging import get_logger
-from psyai.platform.langchain_integration.client import get_langchain_client
+from psyai.platform.langchain_integration.client import (
+    LangChainClient,
+    get_langchain_client,
+)
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _str_parser() -> StrOutputParser:
+    """Return the shared (stateless) string output parser."""
+    return StrOutputParser()
+
+
+# Prompts depend only on their templates, so they are shared across models
+@lru_cache(maxsize=512)
+def _simple_prompt(template: str, input_variables: Tuple[str, ...]) -> PromptTemplate:
+    """Build (once per template) a prompt template."""
+    return PromptTemplate(
+        template=template,
+        input_variables=list(input_variables),
+    )
+
+
+@lru_cache(maxsize=512)
+def _chat_prompt(system_message: str, human_message_template: str) -> ChatPromptTemplate:
+    """Build (once per template pair) a system + human chat prompt."""
+    return ChatPromptTemplate.from_messages([
+        ("system", system_message),
+        ("human", human_message_template),
+    ])
+
+
+# Chains are pure functions of their template and client; keying on the client
+# instance means a replaced client (force_new) never serves stale chains.
+@lru_cache(maxsize=256)
+def _build_simple_chain(
+    template: str,
+    input_variables: Tuple[str, ...],
+    client: LangChainClient,
+) -> Runnable:
+    """Build (once per arguments) a prompt | llm | parser chain."""
+    return _simple_prompt(template, input_variables) | client.llm | _str_parser()
+
+
+@lru_cache(maxsize=256)
+def _build_chat_chain(
+    system_message: str,
+    human_message_template: str,
+    client: LangChainClient,
+) -> Runnable:
+    """Build (once per arguments) a system + human chat chain."""
+    prompt = _chat_prompt(system_message, human_message_template)
+    return prompt | client.llm | _str_parser()
+
+
 def create_simple_chain(
     template: str,
     input_variables: Optional[List[str]] = None,
@@ -24,6 +81,8 @@ def create_simple_chain(
     """
     Create a simple LLM chain with a prompt template.
 
+    Identical arguments return the same (cached) chain instance.
+
     Args:
         template: Prompt template string
         input_variables: List of input variable names (auto-detected if not provided)
@@ -38,12 +97,7 @@ def create_simple_chain(
     """
     client = get_langchain_client(model_name=model_name)
 
-    prompt = PromptTemplate(
-        template=template,
-        input_variables=input_variables or [],
-    )
-
-    chain = prompt | client.llm | StrOutputParser()
+    chain = _build_simple_chain(template, tuple(input_variables or ()), client)
 
     logger.debug("simple_chain_created", template_length=len(template))
 
@@ -58,6 +112,8 @@ def create_chat_chain(
     """
     Create a chat chain with system and human messages.
 
+    Identical arguments return the same (cached) chain instance.
+
     Args:
         system_message: System message (context/instructions)
         human_message_template: Human message template
@@ -75,12 +131,7 @@ def create_chat_chain(
     """
     client = get_langchain_client(model_name=model_name)
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", system_message),
-        ("human", human_message_template),
-    ])
-
-    chain = prompt | client.llm | StrOutputParser()
+    chain = _build_chat_chain(system_message, human_message_template, client)
 
     logger.debug("chat_chain_created")
 
@@ -94,6 +145,10 @@ def create_sequential_chain(
     """
     Create a sequential chain that runs multiple chains in sequence.
 
+    Each chain receives the previous chain's output, so every step waits
+    for the one before it. Only use this when outputs actually feed the next
+    step; independent steps should use create_parallel_chain.
+
     Args:
         chains: List of chains to run sequentially
         chain_names: Optional names for each chain
@@ -104,7 +159,7 @@ def create_sequential_chain(
     Example:
         >>> chain1 = create_simple_chain("Summarize: {text}")
         >>> chain2 = create_simple_chain("Translate to Spanish: {text}")
-        >>> sequential = create_sequential_chain([chain1, chain2])
+        >>> sequential = create_sequential_chain([chain1, {"text": RunnablePassthrough()} | chain2])
     """
     if not chains:
         raise ValueError("At least one chain is required")
@@ -141,6 +196,7 @@ def create_map_reduce_chain(
         ...     reduce_template="Combine these summaries: {summaries}"
         ... )
         >>> # Use chains['map'] for each chunk, then chains['reduce'] for final result
+        >>> # (or run both with run_map_reduce)
     """
     map_chain = create_simple_chain(map_template, model_name=model_name)
     reduce_chain = create_simple_chain(reduce_template, model_name=model_name)
@@ -153,6 +209,94 @@ def create_map_reduce_chain(
     }
 
 
+async def run_map_reduce(
+    chains: Dict[str, Runnable],
+    inputs: List[Dict[str, Any]],
+    max_concurrency: int = 10,
+    reduce_key: str = "summaries",
+) -> Any:
+    """
+    Run a map-reduce chain pair with the map step fanned out concurrently.
+
+    All map inputs are sent as one abatch capped at max_concurrency
+    in-flight calls, so wall-clock time tracks the slowest call rather than
+    the sum of all calls. The map outputs are joined and reduced once.
+
+    Args:
+        chains: Dictionary with 'map' and 'reduce' chains (see create_map_reduce_chain)
+        inputs: Input dict for each map call
+        max_concurrency: Max concurrent map calls (keep under provider rate limits)
+        reduce_key: Reduce template variable receiving the joined map outputs
+
+    Returns:
+        Reduce chain output
+
+    Example:
+        >>> chains = create_map_reduce_chain(
+        ...     map_template="Summarize this chunk: {text}",
+        ...     reduce_template="Combine these summaries: {summaries}"
+        ... )
+        >>> summary = await run_map_reduce(chains, [{"text": c} for c in chunks])
+    """
+    mapped = await chains["map"].abatch(inputs, config={"max_concurrency": max_concurrency})
+
+    logger.debug("map_reduce_map_complete", count=len(mapped))
+
+    return await chains["reduce"].ainvoke({reduce_key: "\n\n".join(mapped)})
+
+
+def create_parallel_chain(
+    chains: Union[Dict[str, Runnable], List[Runnable]],
+    combine: Optional[Callable[[Any], Any]] = None,
+) -> Runnable:
+    """
+    Create a chain that runs independent chains concurrently on the same input.
+
+    Use instead of create_sequential_chain when the steps do not depend on
+    each other's output: all branches are dispatched at once (asyncio.gather
+    under ainvoke, a thread pool under invoke), so latency is that of the
+    slowest branch rather than the sum.
+
+    Args:
+        chains: Output key to chain mapping, or a list of chains
+        combine: Optional function applied to the branch outputs (the dict,
+            or for a list of chains, the outputs in list order)
+
+    Returns:
+        Chain returning the branch outputs, or combine's result
+
+    Raises:
+        ValueError: If no chains are given
+
+    Example:
+        >>> chain = create_parallel_chain({
+        ...     "summary": create_simple_chain("Summarize: {text}"),
+        ...     "keywords": create_simple_chain("List keywords in: {text}"),
+        ... })
+        >>> result = await chain.ainvoke({"text": document})
+        >>> result["summary"], result["keywords"]
+        >>>
+        >>> joined = create_parallel_chain([chain_a, chain_b], combine="\n".join)
+    """
+    if not chains:
+        raise ValueError("At least one chain is required")
+
+    if isinstance(chains, dict):
+        chain = RunnableParallel(chains)
+    else:
+        keys = [f"r{i}" for i in range(len(chains))]
+        chain = RunnableParallel(dict(zip(keys, chains))) | RunnableLambda(
+            lambda outputs: [outputs[key] for key in keys]
+        )
+
+    if combine is not None:
+        chain = chain | RunnableLambda(combine)
+
+    logger.debug("parallel_chain_created", chain_count=len(chains))
+
+    return chain
+
+
 def create_chain_with_fallback(
     primary_chain: Runnable,
     fallback_chain: Runnable,
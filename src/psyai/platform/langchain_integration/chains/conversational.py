@@ -4,94 +4,253 @@ Conversational chains with memory support.
 This module provides chains for multi-turn conversations with context.
 """
 
-from typing import Any, Dict, List, Optional
-
-try:
-    from langchain.chains import ConversationChain
-    from langchain.memory import (
-        ConversationBufferMemory,
-        ConversationBufferWindowMemory,
-        ConversationSummaryMemory,
-    )
-except ImportError:
-    # For newer LangChain versions
-    ConversationChain = None  # type: ignore
-    ConversationBufferMemory = None  # type: ignore
-    ConversationBufferWindowMemory = None  # type: ignore
-    ConversationSummaryMemory = None  # type: ignore
-
-from langchain_community.chat_message_histories import ChatMessageHistory
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+import hashlib
+import json
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+
+from langchain_core.messages import BaseMessage, SystemMessage, get_buffer_string
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.runnables import Runnable, RunnableWithMessageHistory
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder, PromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda, RunnablePassthrough
 
+from psyai.core.config import settings
 from psyai.core.logging import get_logger
+from psyai.core.utils.cache import LRUCache
 from psyai.platform.langchain_integration.client import get_langchain_client
 
+if TYPE_CHECKING:
+    from langchain_community.chat_message_histories import ChatMessageHistory
+    from langchain_core.runnables import RunnableWithMessageHistory
+
 logger = get_logger(__name__)
 
 
+class _LangChainImports(NamedTuple):
+    """Heavy LangChain symbols, imported on first use."""
+
+    ChatMessageHistory: Any
+    RunnableWithMessageHistory: Any
+
+
+@lru_cache(maxsize=None)
+def _lc_imports() -> _LangChainImports:
+    """
+    Import the message history classes once.
+
+    langchain_community is only loaded when a conversation history is
+    actually created, keeping it off the import path of processes that
+    never use one.
+
+    Returns:
+        The imported symbols
+    """
+    from langchain_community.chat_message_histories import ChatMessageHistory
+    from langchain_core.runnables import RunnableWithMessageHistory
+
+    return _LangChainImports(
+        ChatMessageHistory=ChatMessageHistory,
+        RunnableWithMessageHistory=RunnableWithMessageHistory,
+    )
+
+
+# Exchanges kept by window memory when no limit is given
+_DEFAULT_WINDOW_TURNS = 20
+
+_MEMORY_TYPES = ("window", "buffer", "summary")
+
+_SUMMARY_PROMPT = PromptTemplate.from_template(
+    "Progressively summarize the lines of conversation provided, adding onto "
+    "the previous summary and returning a new summary.\n\n"
+    "Current summary:\n{summary}\n\n"
+    "New lines of conversation:\n{new_lines}\n\n"
+    "New summary:"
+)
+
+# Per-session histories shared by every conversational chain in the process. Bounded
+# so long-running servers don't keep every session forever; an evicted session
+# starts over with an empty history.
+_session_histories = LRUCache(
+    max_size=settings.conversation_max_sessions, ttl=settings.conversation_session_ttl
+)
+_session_histories_lock = threading.Lock()
+
+
+def _get_session_history(session_id: str) -> "ChatMessageHistory":
+    """Get (creating on first use) the stored history for a session."""
+    history = _session_histories.get(session_id)
+    if history is None:
+        with _session_histories_lock:
+            history = _session_histories.get(session_id)
+            if history is None:
+                history = create_chat_memory(session_id)
+                _session_histories.set(session_id, history)
+    return history
+
+
+def _build_conversation_prompt(
+    system_message: str,
+    pinned_context: Optional[List[str]] = None,
+) -> ChatPromptTemplate:
+    """
+    Build the conversation prompt with a stable prefix.
+
+    The system message and pinned context come first and are literal
+    messages (never templated), so the prefix is byte-identical on every
+    turn and provider-side prompt caching can reuse it.
+
+    Args:
+        system_message: System message for context
+        pinned_context: Context notes kept right after the system message
+
+    Returns:
+        Prompt with "history" and "input" variables
+    """
+    prefix: List[Any] = [SystemMessage(content=system_message)]
+    if pinned_context:
+        prefix.append(SystemMessage(content="\n\n".join(pinned_context)))
+
+    return ChatPromptTemplate.from_messages([
+        *prefix,
+        MessagesPlaceholder(variable_name="history"),
+        ("human", "{input}"),
+    ])
+
+
+def _split_summary(messages: List[BaseMessage]) -> Tuple[str, List[BaseMessage]]:
+    """Split a leading summary (a SystemMessage in the history) from the turns."""
+    if messages and isinstance(messages[0], SystemMessage):
+        return messages[0].content, messages[1:]
+    return "", messages
+
+
+def _window(messages: List[BaseMessage], max_messages: int) -> List[BaseMessage]:
+    """Keep the last max_messages exchanges, plus a leading summary if present."""
+    summary, turns = _split_summary(messages)
+    recent = turns[-2 * max_messages:]
+    return [messages[0], *recent] if summary else recent
+
+
+def _build_history_selector(memory_type: str, max_messages: int, llm: Any) -> Runnable:
+    """
+    Build the step that selects which stored messages are sent to the LLM.
+
+    Args:
+        memory_type: Type of memory ("window", "buffer", "summary")
+        max_messages: Exchanges sent verbatim for "window" and "summary"
+        llm: LLM used to summarize older turns for "summary"
+
+    Returns:
+        Runnable replacing the "history" input
+    """
+    if memory_type == "buffer":
+        return RunnablePassthrough()
+
+    if memory_type == "window":
+        return RunnablePassthrough.assign(history=lambda x: _window(x["history"], max_messages))
+
+    summarizer = _SUMMARY_PROMPT | llm | StrOutputParser()
+    limit = 2 * max_messages
+
+    def compact(
+        config: Dict[str, Any], summary: str, recent: List[BaseMessage]
+    ) -> List[BaseMessage]:
+        # Store the compacted history so later turns only fold in what leaves the window
+        messages = [SystemMessage(content=summary), *recent]
+        history = config.get("configurable", {}).get("message_history")
+        if history is not None:
+            history.clear()
+            history.add_messages(messages)
+        return messages
+
+    def summarize(inputs: Dict[str, Any], config: Dict[str, Any]) -> List[BaseMessage]:
+        summary, turns = _split_summary(inputs["history"])
+        if len(turns) <= limit:
+            return inputs["history"]
+        summary = summarizer.invoke({
+            "summary": summary,
+            "new_lines": get_buffer_string(turns[:-limit]),
+        })
+        return compact(config, summary, turns[-limit:])
+
+    async def asummarize(inputs: Dict[str, Any], config: Dict[str, Any]) -> List[BaseMessage]:
+        summary, turns = _split_summary(inputs["history"])
+        if len(turns) <= limit:
+            return inputs["history"]
+        summary = await summarizer.ainvoke({
+            "summary": summary,
+            "new_lines": get_buffer_string(turns[:-limit]),
+        })
+        return compact(config, summary, turns[-limit:])
+
+    return RunnablePassthrough.assign(history=RunnableLambda(summarize, afunc=asummarize))
+
+
+def _build_conversational_runnable(
+    prompt: ChatPromptTemplate,
+    llm: Any,
+    memory_type: str,
+    max_messages: int,
+) -> "RunnableWithMessageHistory":
+    """Compose history selection, prompt, LLM and parser, wrapped with session history."""
+    chain = (
+        _build_history_selector(memory_type, max_messages, llm)
+        | prompt
+        | llm
+        | StrOutputParser()
+    )
+    return create_chain_with_history(chain, _get_session_history)
+
+
 def create_conversational_chain(
     system_message: str = "You are a helpful AI assistant.",
-    memory_type: str = "buffer",
+    memory_type: str = "window",
     max_messages: Optional[int] = None,
     model_name: Optional[str] = None,
-) -> Runnable:
+) -> "RunnableWithMessageHistory":
     """
     Create a conversational chain with memory.
 
+    The chain is an LCEL runnable wrapped with per-session message history,
+    so it supports ainvoke, astream and abatch. Histories are kept in
+    process per session_id, up to conversation_max_sessions sessions (least
+    recently used are dropped) and conversation_session_ttl idle seconds.
+
+    The default "window" memory resends only the last max_messages
+    exchanges, so per-turn prompt size stays bounded; "buffer" keeps the
+    whole conversation and is opt-in; "summary" sends the last max_messages
+    exchanges verbatim and folds older ones into a summary.
+
     Args:
         system_message: System message for context
-        memory_type: Type of memory ("buffer", "window", "summary")
-        max_messages: Max messages to keep (for "window" memory)
+        memory_type: Type of memory ("window", "buffer", "summary")
+        max_messages: Max exchanges sent verbatim (default 20)
         model_name: Optional model name override
 
     Returns:
         Conversational chain with memory
 
+    Raises:
+        ValueError: If memory_type is not supported
+
     Example:
         >>> chain = create_conversational_chain()
-        >>> response1 = await chain.ainvoke({"input": "My name is Alice"})
-        >>> response2 = await chain.ainvoke({"input": "What's my name?"})
+        >>> config = {"configurable": {"session_id": "user-123"}}
+        >>> response1 = await chain.ainvoke({"input": "My name is Alice"}, config=config)
+        >>> response2 = await chain.ainvoke({"input": "What's my name?"}, config=config)
         >>> # response2 will remember "Alice"
     """
-    client = get_langchain_client(model_name=model_name)
-
-    # Create memory based on type
-    if memory_type == "buffer":
-        memory = ConversationBufferMemory(
-            return_messages=True,
-            memory_key="history",
-        )
-    elif memory_type == "window":
-        memory = ConversationBufferWindowMemory(
-            return_messages=True,
-            memory_key="history",
-            k=max_messages or 10,
-        )
-    elif memory_type == "summary":
-        memory = ConversationSummaryMemory(
-            llm=client.llm,
-            return_messages=True,
-            memory_key="history",
-        )
-    else:
+    if memory_type not in _MEMORY_TYPES:
         raise ValueError(f"Invalid memory type: {memory_type}")
 
-    # Create prompt with memory placeholder
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", system_message),
-        MessagesPlaceholder(variable_name="history"),
-        ("human", "{input}"),
-    ])
+    client = get_langchain_client(model_name=model_name)
 
-    # Create chain
-    chain = ConversationChain(
-        llm=client.llm,
-        memory=memory,
-        prompt=prompt,
-        verbose=False,
+    chain = _build_conversational_runnable(
+        _build_conversation_prompt(system_message),
+        client.llm,
+        memory_type,
+        max_messages or _DEFAULT_WINDOW_TURNS,
     )
 
     logger.debug(
@@ -106,7 +265,7 @@ def create_conversational_chain(
 def create_chat_memory(
     session_id: str,
     messages: Optional[List[BaseMessage]] = None,
-) -> ChatMessageHistory:
+) -> "ChatMessageHistory":
     """
     Create a chat message history for a session.
 
@@ -122,7 +281,7 @@ def create_chat_memory(
         >>> memory.add_user_message("Hello!")
         >>> memory.add_ai_message("Hi there!")
     """
-    history = ChatMessageHistory(messages=messages or [])
+    history = _lc_imports().ChatMessageHistory(messages=messages or [])
 
     logger.debug("chat_memory_created", session_id=session_id)
 
@@ -134,7 +293,7 @@ def create_chain_with_history(
     get_session_history: callable,
     input_messages_key: str = "input",
     history_messages_key: str = "history",
-) -> RunnableWithMessageHistory:
+) -> "RunnableWithMessageHistory":
     """
     Wrap a chain with message history management.
 
@@ -158,7 +317,7 @@ def create_chain_with_history(
         ...     config={"configurable": {"session_id": "abc123"}}
         ... )
     """
-    wrapped_chain = RunnableWithMessageHistory(
+    wrapped_chain = _lc_imports().RunnableWithMessageHistory(
         chain,
         get_session_history,
         input_messages_key=input_messages_key,
@@ -174,6 +333,19 @@ class ConversationManager:
     """
     Manager for handling multi-turn conversations.
 
+    Only the last max_messages exchanges are resent each turn. With
+    summary_threshold set, once the stored history exceeds that many
+    messages it is compacted into a running summary, so older turns are
+    compressed instead of being dropped.
+
+    Context added with add_context is pinned right after the system
+    message rather than interleaved with the history, so it never slides
+    out of the window and the prompt prefix stays stable across turns.
+
+    Replies are cached per session by the prompt and the history the turn
+    left behind, so resending the last message (a retry) returns the earlier
+    reply without calling the LLM or adding a duplicate turn.
+
     Example:
         >>> manager = ConversationManager(session_id="user-123")
         >>> response1 = await manager.send_message("Hello!")
@@ -187,6 +359,7 @@ class ConversationManager:
         system_message: str = "You are a helpful AI assistant.",
         max_messages: Optional[int] = None,
         model_name: Optional[str] = None,
+        summary_threshold: Optional[int] = None,
     ):
         """
         Initialize conversation manager.
@@ -194,23 +367,29 @@ class ConversationManager:
         Args:
             session_id: Unique session identifier
             system_message: System message for context
-            max_messages: Max messages to keep in memory
+            max_messages: Max exchanges to keep in memory (default 20)
             model_name: Optional model name override
+            summary_threshold: Compact the history into a summary once it
+                holds more than this many messages (None = never)
         """
         self.session_id = session_id
         self.system_message = system_message
-        self.max_messages = max_messages
-
-        # Create chain with memory
-        self.chain = create_conversational_chain(
-            system_message=system_message,
-            memory_type="window" if max_messages else "buffer",
-            max_messages=max_messages,
-            model_name=model_name,
-        )
+        self.max_messages = max_messages or _DEFAULT_WINDOW_TURNS
+        self.summary_threshold = summary_threshold
+        self.pinned_context: List[str] = []
+        self._reply_cache = LRUCache(max_size=settings.conversation_reply_cache_size)
+        self._config = {"configurable": {"session_id": session_id}}
+
+        self.llm = get_langchain_client(model_name=model_name).llm
+        self.prompt = _build_conversation_prompt(system_message)
+        self.chain = self._build_chain()
 
         logger.info("conversation_manager_created", session_id=session_id)
 
+    def _build_chain(self) -> "RunnableWithMessageHistory":
+        """Build the window-memory chain for the current prompt."""
+        return _build_conversational_runnable(self.prompt, self.llm, "window", self.max_messages)
+
     async def send_message(self, message: str) -> str:
         """
         Send a message and get response.
@@ -230,13 +409,16 @@ class ConversationManager:
             message_length=len(message),
         )
 
-        response = await self.chain.ainvoke({"input": message})
+        cached = self._reply_cache.get(self._reply_cache_key(message))
+        if cached is not None:
+            logger.debug("conversation_cache_hit", session_id=self.session_id)
+            return cached
+
+        result = await self.chain.ainvoke({"input": message}, config=self._config)
+        await self._maybe_summarize()
 
-        # Extract response text
-        if isinstance(response, dict):
-            result = response.get("response", str(response))
-        else:
-            result = str(response)
+        # Keyed on the history after this turn, which is what a retry will see
+        self._reply_cache.set(self._reply_cache_key(message), result)
 
         logger.info(
             "conversation_message_received",
@@ -246,6 +428,78 @@ class ConversationManager:
 
         return result
 
+    async def stream_message(self, message: str) -> AsyncIterator[str]:
+        """
+        Send a message and stream the response as it is generated.
+
+        The full response is saved to the session history once the stream
+        ends.
+
+        Args:
+            message: User message
+
+        Yields:
+            Response text chunks
+
+        Example:
+            >>> async for chunk in manager.stream_message("Hello!"):
+            ...     print(chunk, end="")
+        """
+        logger.debug(
+            "conversation_message_sent",
+            session_id=self.session_id,
+            message_length=len(message),
+            streaming=True,
+        )
+
+        response_length = 0
+        async for chunk in self.chain.astream({"input": message}, config=self._config):
+            if chunk:
+                response_length += len(chunk)
+                yield chunk
+
+        await self._maybe_summarize()
+
+        logger.info(
+            "conversation_message_received",
+            session_id=self.session_id,
+            response_length=response_length,
+            streaming=True,
+        )
+
+    def _reply_cache_key(self, message: str) -> str:
+        """Hash the system message, pinned context, history and new message."""
+        payload = json.dumps([
+            self.system_message,
+            self.pinned_context,
+            [m.content for m in self.get_history()],
+            message,
+        ])
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    async def _maybe_summarize(self) -> None:
+        """Compact the history into a summary once it exceeds summary_threshold."""
+        history = _get_session_history(self.session_id)
+        if self.summary_threshold is None or len(history.messages) <= self.summary_threshold:
+            return
+
+        # One summarization call over the turns since the last compaction
+        summary, turns = _split_summary(history.messages)
+        summarizer = _SUMMARY_PROMPT | self.llm | StrOutputParser()
+        summary = await summarizer.ainvoke({
+            "summary": summary,
+            "new_lines": get_buffer_string(turns),
+        })
+
+        history.clear()
+        history.add_message(SystemMessage(content=summary))
+
+        logger.info(
+            "conversation_memory_summarized",
+            session_id=self.session_id,
+            message_count=len(turns),
+        )
+
     def get_history(self) -> List[BaseMessage]:
         """
         Get conversation history.
@@ -258,8 +512,7 @@ class ConversationManager:
             >>> for msg in history:
             ...     print(f"{msg.type}: {msg.content}")
         """
-        memory = self.chain.memory
-        return memory.chat_memory.messages
+        return _get_session_history(self.session_id).messages
 
     def clear_history(self) -> None:
         """
@@ -268,13 +521,33 @@ class ConversationManager:
         Example:
             >>> manager.clear_history()
         """
-        self.chain.memory.clear()
+        _get_session_history(self.session_id).clear()
+        if self.pinned_context:
+            self.pinned_context.clear()
+            self.prompt = _build_conversation_prompt(self.system_message)
+            self.chain = self._build_chain()
+        # Cached replies belong to the discarded conversation
+        self._reply_cache.clear()
 
         logger.info("conversation_history_cleared", session_id=self.session_id)
 
+    def clear_reply_cache(self) -> None:
+        """
+        Clear cached replies so the next message always calls the LLM.
+
+        Example:
+            >>> manager.clear_reply_cache()
+        """
+        self._reply_cache.clear()
+
+        logger.debug("conversation_reply_cache_cleared", session_id=self.session_id)
+
     def add_context(self, context: str) -> None:
         """
-        Add context to the conversation as a system message.
+        Pin context to the conversation after the system message.
+
+        Adding context changes the prompt prefix once; it is then identical
+        on every later turn.
 
         Args:
             context: Context to add
@@ -282,9 +555,9 @@ class ConversationManager:
         Example:
             >>> manager.add_context("The user prefers technical explanations")
         """
-        self.chain.memory.chat_memory.add_message(
-            SystemMessage(content=context)
-        )
+        self.pinned_context.append(context)
+        self.prompt = _build_conversation_prompt(self.system_message, self.pinned_context)
+        self.chain = self._build_chain()
 
         logger.debug(
             "conversation_context_added",
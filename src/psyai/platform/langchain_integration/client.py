@@ -5,20 +5,113 @@ This module provides a centralized client for interacting with LangChain
 LLMs with proper error handling, retry logic, and configuration.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import json
+import re
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
+from openai import APITimeoutError, RateLimitError
 
 from psyai.core.config import settings
 from psyai.core.exceptions import LLMError, LLMRateLimitError, LLMTimeoutError
 from psyai.core.logging import get_logger
-from psyai.core.utils import retry_async, retry_sync
+from psyai.core.utils import LRUCache, make_cache_key, retry_async, retry_sync
+
+if TYPE_CHECKING:
+    from psyai.platform.storage_layer.cache import RedisClient
 
 logger = get_logger(__name__)
 
 
+# Fallback classification for provider errors that are not typed
+_RATE_LIMIT_PATTERN = re.compile(r"rate limit|quota", re.IGNORECASE)
+_TIMEOUT_PATTERN = re.compile(r"timeout|timed out", re.IGNORECASE)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After header from a provider error, if present.
+
+    Args:
+        error: Exception raised by the provider SDK
+
+    Returns:
+        Seconds to wait, or None if the header is missing or not numeric
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        # HTTP-date form; fall back to normal backoff
+        return None
+
+
+def _translate_error(error: Exception, event: str, message: str) -> LLMError:
+    """
+    Map a provider error to the matching LLMError subclass.
+
+    Args:
+        error: Exception raised by the provider SDK
+        event: Log event for errors that are not retryable
+        message: Message prefix for errors that are not retryable
+
+    Returns:
+        LLMRateLimitError (with retry_after), LLMTimeoutError or LLMError
+    """
+    error_msg = str(error)
+
+    # SDK exception types first; message matching only for untyped providers
+    if isinstance(error, RateLimitError):
+        rate_limited = True
+    elif isinstance(error, (APITimeoutError, asyncio.TimeoutError)):
+        rate_limited = False
+    elif _RATE_LIMIT_PATTERN.search(error_msg):
+        rate_limited = True
+    elif _TIMEOUT_PATTERN.search(error_msg):
+        rate_limited = False
+    else:
+        logger.error(event, error=error_msg)
+        return LLMError(f"{message}: {error_msg}")
+
+    if rate_limited:
+        logger.warning("llm_rate_limit", error=error_msg)
+        return LLMRateLimitError(error_msg, retry_after=_retry_after(error))
+
+    logger.warning("llm_timeout", error=error_msg)
+    return LLMTimeoutError(error_msg)
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model_name: str) -> Optional[Any]:
+    """
+    Get the process-wide tiktoken encoding for a model.
+
+    Args:
+        model_name: OpenAI model name
+
+    Returns:
+        Encoding instance, or None if tiktoken does not know the model
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model(model_name)
+    except Exception as e:
+        logger.info("llm_tokenizer_unavailable", model=model_name, error=str(e))
+        return None
+
+
 class LangChainClient:
     """
     Wrapper for LangChain LLM client with error handling and retry logic.
@@ -26,6 +119,10 @@ class LangChainClient:
     This class provides a centralized interface for interacting with LLMs
     through LangChain, with automatic retry, error handling, and logging.
 
+    With response caching enabled, repeated prompts with the same model,
+    temperature, max_tokens, stop sequences and extra arguments are answered
+    from an in-process LRU (and optionally Redis) instead of the API.
+
     Example:
         >>> client = LangChainClient()
         >>> response = await client.agenerate("What is PsyAI?")
@@ -38,6 +135,9 @@ class LangChainClient:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         callbacks: Optional[List[BaseCallbackHandler]] = None,
+        cache_responses: Optional[bool] = None,
+        streaming: bool = False,
+        max_concurrency: Optional[int] = None,
         **kwargs: Any,
     ):
         """
@@ -48,21 +148,43 @@ class LangChainClient:
             temperature: Model temperature (defaults to settings.openai_temperature)
             max_tokens: Max tokens (defaults to settings.openai_max_tokens)
             callbacks: Optional callback handlers
+            cache_responses: Cache responses for repeated prompts
+                (defaults to settings.llm_response_cache_enabled)
+            streaming: Stream tokens from the LLM by default (callbacks
+                receive tokens as they arrive)
+            max_concurrency: Max concurrent calls per batch
+                (defaults to settings.llm_batch_max_concurrency)
             **kwargs: Additional arguments passed to the LLM
         """
         self.model_name = model_name or settings.openai_model
         self.temperature = temperature or settings.openai_temperature
         self.max_tokens = max_tokens or settings.openai_max_tokens
         self.callbacks = callbacks or []
+        self.streaming = streaming
+        self.max_concurrency = max_concurrency or settings.llm_batch_max_concurrency
+        self._token_counts = LRUCache(max_size=settings.llm_token_count_cache_size)
 
         # Initialize the LLM
         self._llm = self._create_llm(**kwargs)
 
+        if cache_responses is None:
+            cache_responses = settings.llm_response_cache_enabled
+        self._response_cache: Optional[LRUCache] = (
+            LRUCache(max_size=settings.llm_response_cache_size) if cache_responses else None
+        )
+        self._response_store: Optional["RedisClient"] = None
+        if cache_responses and settings.llm_response_redis_cache_enabled:
+            # Imported lazily: the storage layer pulls in the database models
+            from psyai.platform.storage_layer.cache import RedisClient
+
+            self._response_store = RedisClient()
+
         logger.info(
             "langchain_client_initialized",
             model=self.model_name,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
+            response_cache_enabled=cache_responses,
         )
 
     def _create_llm(self, **kwargs: Any) -> BaseChatModel:
@@ -85,6 +207,7 @@ class LangChainClient:
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
                 callbacks=self.callbacks,
+                streaming=self.streaming,
                 **kwargs,
             )
             return llm
@@ -97,6 +220,138 @@ class LangChainClient:
         """Get the underlying LLM instance."""
         return self._llm
 
+    def _response_cache_key(
+        self,
+        prompt: str,
+        stop: Optional[List[str]],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Build the response cache key for a call.
+
+        Args:
+            prompt: Input prompt
+            stop: Stop sequences
+            kwargs: Additional call arguments
+
+        Returns:
+            Cache key string
+        """
+        return make_cache_key(
+            self.model_name,
+            self.temperature,
+            self.max_tokens,
+            prompt,
+            json.dumps(stop),
+            # Runnable config (concurrency, callbacks) does not affect the output
+            json.dumps(
+                {k: v for k, v in kwargs.items() if k != "config"},
+                sort_keys=True,
+                default=str,
+            ),
+        )
+
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response (LRU first, then Redis).
+
+        Args:
+            key: Response cache key
+
+        Returns:
+            Cached response or None
+        """
+        if self._response_cache is None:
+            return None
+
+        cached = self._response_cache.get(key)
+        if cached is None and self._response_store is not None:
+            try:
+                cached = self._response_store.get(f"llm:{key}")
+            except Exception as e:
+                logger.warning("llm_response_cache_get_failed", error=str(e))
+            if cached is not None:
+                self._response_cache.set(key, cached)
+
+        if cached is not None:
+            logger.debug("llm_response_cache_hit")
+        return cached
+
+    async def _aget_cached_response(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response asynchronously (LRU first, then Redis).
+
+        Args:
+            key: Response cache key
+
+        Returns:
+            Cached response or None
+        """
+        if self._response_cache is None:
+            return None
+
+        cached = self._response_cache.get(key)
+        if cached is None and self._response_store is not None:
+            try:
+                cached = await self._response_store.aget(f"llm:{key}")
+            except Exception as e:
+                logger.warning("llm_response_cache_get_failed", error=str(e))
+            if cached is not None:
+                self._response_cache.set(key, cached)
+
+        if cached is not None:
+            logger.debug("llm_response_cache_hit")
+        return cached
+
+    def _cache_response(self, key: str, response: str) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Response cache key
+            response: Generated response
+        """
+        if self._response_cache is None:
+            return
+
+        self._response_cache.set(key, response)
+        if self._response_store is not None:
+            try:
+                self._response_store.set(
+                    f"llm:{key}", response, ttl=settings.llm_response_cache_ttl
+                )
+            except Exception as e:
+                logger.warning("llm_response_cache_set_failed", error=str(e))
+
+    async def _acache_response(self, key: str, response: str) -> None:
+        """
+        Store a response in the cache asynchronously.
+
+        Args:
+            key: Response cache key
+            response: Generated response
+        """
+        if self._response_cache is None:
+            return
+
+        self._response_cache.set(key, response)
+        if self._response_store is not None:
+            try:
+                await self._response_store.aset(
+                    f"llm:{key}", response, ttl=settings.llm_response_cache_ttl
+                )
+            except Exception as e:
+                logger.warning("llm_response_cache_set_failed", error=str(e))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses and hit_rate (empty if disabled)
+        """
+        return self._response_cache.stats() if self._response_cache is not None else {}
+
     @retry_sync(
         max_attempts=3,
         exceptions=(LLMRateLimitError, LLMTimeoutError),
@@ -124,13 +379,19 @@ class LangChainClient:
             LLMRateLimitError: If rate limit is hit
             LLMTimeoutError: If request times out
         """
+        cache_key = self._response_cache_key(prompt, stop, kwargs)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             logger.debug("llm_generate_start", prompt_length=len(prompt))
 
-            messages = [{"role": "user", "content": prompt}]
+            messages = [HumanMessage(content=prompt)]
             response = self._llm.invoke(messages, stop=stop, **kwargs)
 
             result = response.content
+            self._cache_response(cache_key, result)
 
             logger.info(
                 "llm_generate_complete",
@@ -141,17 +402,7 @@ class LangChainClient:
             return result
 
         except Exception as e:
-            error_msg = str(e).lower()
-
-            if "rate limit" in error_msg or "quota" in error_msg:
-                logger.warning("llm_rate_limit", error=str(e))
-                raise LLMRateLimitError(str(e))
-            elif "timeout" in error_msg or "timed out" in error_msg:
-                logger.warning("llm_timeout", error=str(e))
-                raise LLMTimeoutError(str(e))
-            else:
-                logger.error("llm_generate_error", error=str(e))
-                raise LLMError(f"LLM generation failed: {str(e)}")
+            raise _translate_error(e, "llm_generate_error", "LLM generation failed")
 
     @retry_async(
         max_attempts=3,
@@ -180,13 +431,19 @@ class LangChainClient:
             LLMRateLimitError: If rate limit is hit
             LLMTimeoutError: If request times out
         """
+        cache_key = self._response_cache_key(prompt, stop, kwargs)
+        cached = await self._aget_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             logger.debug("llm_agenerate_start", prompt_length=len(prompt))
 
-            messages = [{"role": "user", "content": prompt}]
+            messages = [HumanMessage(content=prompt)]
             response = await self._llm.ainvoke(messages, stop=stop, **kwargs)
 
             result = response.content
+            await self._acache_response(cache_key, result)
 
             logger.info(
                 "llm_agenerate_complete",
@@ -197,17 +454,64 @@ class LangChainClient:
             return result
 
         except Exception as e:
-            error_msg = str(e).lower()
-
-            if "rate limit" in error_msg or "quota" in error_msg:
-                logger.warning("llm_rate_limit", error=str(e))
-                raise LLMRateLimitError(str(e))
-            elif "timeout" in error_msg or "timed out" in error_msg:
-                logger.warning("llm_timeout", error=str(e))
-                raise LLMTimeoutError(str(e))
-            else:
-                logger.error("llm_agenerate_error", error=str(e))
-                raise LLMError(f"LLM generation failed: {str(e)}")
+            raise _translate_error(e, "llm_agenerate_error", "LLM generation failed")
+
+    async def astream(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response asynchronously, chunk by chunk.
+
+        The first chunk arrives after time-to-first-token instead of after
+        the whole completion. A cached response is yielded as one chunk, and
+        the assembled response is cached at end of stream.
+
+        Args:
+            prompt: Input prompt
+            stop: Stop sequences
+            **kwargs: Additional arguments
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            LLMError: If generation fails
+            LLMRateLimitError: If rate limit is hit
+            LLMTimeoutError: If request times out
+
+        Example:
+            >>> async for chunk in client.astream("Tell me about PsyAI"):
+            ...     print(chunk, end="")
+        """
+        cache_key = self._response_cache_key(prompt, stop, kwargs)
+        cached = await self._aget_cached_response(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        logger.debug("llm_astream_start", prompt_length=len(prompt))
+
+        parts: List[str] = []
+        try:
+            messages = [HumanMessage(content=prompt)]
+            async for chunk in self._llm.astream(messages, stop=stop, **kwargs):
+                if chunk.content:
+                    parts.append(chunk.content)
+                    yield chunk.content
+        except Exception as e:
+            raise _translate_error(e, "llm_astream_error", "LLM streaming failed")
+
+        result = "".join(parts)
+        await self._acache_response(cache_key, result)
+
+        logger.info(
+            "llm_astream_complete",
+            prompt_length=len(prompt),
+            response_length=len(result),
+        )
 
     def batch_generate(
         self,
@@ -217,6 +521,12 @@ class LangChainClient:
         """
         Generate responses for multiple prompts in batch.
 
+        Only prompts missing from the response cache are sent to the LLM,
+        and each distinct prompt is sent once; results are returned in input
+        order. Calls run on a thread pool with at most max_concurrency in
+        flight. This blocks the calling thread, so async code should use
+        abatch_generate instead.
+
         Args:
             prompts: List of input prompts
             **kwargs: Additional arguments
@@ -227,18 +537,31 @@ class LangChainClient:
         Raises:
             LLMError: If batch generation fails
         """
+        kwargs.setdefault("config", {"max_concurrency": self.max_concurrency})
         try:
             logger.info("llm_batch_generate_start", batch_size=len(prompts))
 
-            messages_list = [[{"role": "user", "content": p}] for p in prompts]
-            responses = self._llm.batch(messages_list, **kwargs)
-
-            results = [r.content for r in responses]
+            keys = [self._response_cache_key(p, None, kwargs) for p in prompts]
+            results: List[Optional[str]] = [self._get_cached_response(k) for k in keys]
+            # Distinct uncached prompt -> every position it appears at
+            pending: Dict[str, List[int]] = {}
+            for i, result in enumerate(results):
+                if result is None:
+                    pending.setdefault(prompts[i], []).append(i)
+
+            if pending:
+                messages_list = [[HumanMessage(content=p)] for p in pending]
+                responses = self._llm.batch(messages_list, **kwargs)
+                for positions, response in zip(pending.values(), responses):
+                    for i in positions:
+                        results[i] = response.content
+                    self._cache_response(keys[positions[0]], response.content)
 
             logger.info(
                 "llm_batch_generate_complete",
                 batch_size=len(prompts),
                 results_count=len(results),
+                generated=len(pending),
             )
 
             return results
@@ -255,6 +578,11 @@ class LangChainClient:
         """
         Generate responses for multiple prompts in batch asynchronously.
 
+        Only prompts missing from the response cache are sent to the LLM,
+        and each distinct prompt is sent once; results are returned in input
+        order. Requests are issued concurrently with at most max_concurrency
+        in flight.
+
         Args:
             prompts: List of input prompts
             **kwargs: Additional arguments
@@ -265,18 +593,31 @@ class LangChainClient:
         Raises:
             LLMError: If batch generation fails
         """
+        kwargs.setdefault("config", {"max_concurrency": self.max_concurrency})
         try:
             logger.info("llm_abatch_generate_start", batch_size=len(prompts))
 
-            messages_list = [[{"role": "user", "content": p}] for p in prompts]
-            responses = await self._llm.abatch(messages_list, **kwargs)
-
-            results = [r.content for r in responses]
+            keys = [self._response_cache_key(p, None, kwargs) for p in prompts]
+            results: List[Optional[str]] = [await self._aget_cached_response(k) for k in keys]
+            # Distinct uncached prompt -> every position it appears at
+            pending: Dict[str, List[int]] = {}
+            for i, result in enumerate(results):
+                if result is None:
+                    pending.setdefault(prompts[i], []).append(i)
+
+            if pending:
+                messages_list = [[HumanMessage(content=p)] for p in pending]
+                responses = await self._llm.abatch(messages_list, **kwargs)
+                for positions, response in zip(pending.values(), responses):
+                    for i in positions:
+                        results[i] = response.content
+                    await self._acache_response(keys[positions[0]], response.content)
 
             logger.info(
                 "llm_abatch_generate_complete",
                 batch_size=len(prompts),
                 results_count=len(results),
+                generated=len(pending),
             )
 
             return results
@@ -289,6 +630,10 @@ class LangChainClient:
         """
         Get the number of tokens in a text.
 
+        Uses the shared tiktoken encoding for the model when available and
+        falls back to the LLM's own counter. Counts are cached, so repeated
+        system messages and templates are tokenized once.
+
         Args:
             text: Input text
 
@@ -298,12 +643,23 @@ class LangChainClient:
         Raises:
             LLMError: If token counting fails
         """
+        cached = self._token_counts.get(text)
+        if cached is not None:
+            return cached
+
         try:
-            return self._llm.get_num_tokens(text)
+            encoding = _get_encoding(self.model_name)
+            if encoding is not None:
+                count = len(encoding.encode(text))
+            else:
+                count = self._llm.get_num_tokens(text)
         except Exception as e:
             logger.error("token_count_error", error=str(e))
             raise LLMError(f"Token counting failed: {str(e)}")
 
+        self._token_counts.set(text, count)
+        return count
+
     def with_structured_output(self, schema: Dict[str, Any]) -> BaseChatModel:
         """
         Get LLM configured for structured output.
@@ -317,8 +673,9 @@ class LangChainClient:
         return self._llm.with_structured_output(schema)
 
 
-# Singleton instance
-_client: Optional[LangChainClient] = None
+# One shared instance per (model_name, temperature, max_tokens)
+_clients: Dict[Tuple[Optional[str], Optional[float], Optional[int]], LangChainClient] = {}
+_clients_lock = threading.Lock()
 
 
 def get_langchain_client(
@@ -330,7 +687,8 @@ def get_langchain_client(
     """
     Get or create a LangChain client instance.
 
-    By default, returns a singleton instance. Set force_new=True to create a new instance.
+    Returns the shared instance for the requested configuration, creating it
+    on first use. Set force_new=True to replace it with a new instance.
 
     Args:
         model_name: Model name (defaults to settings.openai_model)
@@ -345,13 +703,16 @@ def get_langchain_client(
         >>> client = get_langchain_client()
         >>> response = await client.agenerate("Hello!")
     """
-    global _client
-
-    if force_new or _client is None:
-        _client = LangChainClient(
-            model_name=model_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+    key = (model_name, temperature, max_tokens)
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if force_new or client is None:
+            client = LangChainClient(
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            _clients[key] = client
 
-    return _client
+    return client
@@ -4,8 +4,17 @@ Embedding service for RAG.
 This module provides embedding generation for vector similarity search.
 """
 
-from typing import List, Optional
-
+import asyncio
+import atexit
+import functools
+import importlib.util
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+import numpy as np
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
@@ -13,9 +22,162 @@ from langchain_openai import OpenAIEmbeddings
 from psyai.core.config import settings
 from psyai.core.exceptions import LLMError
 from psyai.core.logging import get_logger
+from psyai.core.utils.cache import LRUCache, make_cache_key
+from psyai.core.utils.similarity import l2_normalize_inplace, quantize_int8
 
 logger = get_logger(__name__)
 
+# Provider models shared by every EmbeddingService with the same (provider, model)
+_embeddings_models: Dict[Tuple[str, str], Embeddings] = {}
+_embeddings_models_lock = threading.Lock()
+
+# Dimensions learned per (provider, model), so each model is probed at most once
+_embedding_dimensions: Dict[Tuple[str, str], int] = {}
+
+# Dimensions of well-known models, used without calling the model
+_KNOWN_DIMENSIONS: Dict[str, int] = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "sentence-transformers/all-MiniLM-L12-v2": 384,
+    "sentence-transformers/all-mpnet-base-v2": 768,
+    "BAAI/bge-small-en-v1.5": 384,
+    "BAAI/bge-base-en-v1.5": 768,
+    "BAAI/bge-large-en-v1.5": 1024,
+}
+
+
+# Connection pools shared by every OpenAIEmbeddings instance, created on first use
+_http_clients: Optional[Tuple[httpx.Client, httpx.AsyncClient]] = None
+
+
+def _get_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Get the shared sync and async HTTP clients for OpenAI embeddings.
+
+    Keep-alive pools let repeat calls skip the TCP and TLS handshakes, and
+    HTTP/2 (when the h2 package is installed) multiplexes concurrent
+    requests over one connection.
+
+    Returns:
+        Tuple of (httpx.Client, httpx.AsyncClient)
+    """
+    global _http_clients
+
+    if _http_clients is None:
+        http2 = importlib.util.find_spec("h2") is not None
+        limits = httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=30.0,
+        )
+        _http_clients = (
+            httpx.Client(http2=http2, limits=limits),
+            httpx.AsyncClient(http2=http2, limits=limits),
+        )
+        atexit.register(_close_http_clients)
+        logger.debug("embedding_http_clients_created", http2=http2)
+
+    return _http_clients
+
+
+def _close_http_clients() -> None:
+    """Close the shared HTTP clients (registered with atexit)."""
+    global _http_clients
+
+    if _http_clients is None:
+        return
+    sync_client, async_client = _http_clients
+    _http_clients = None
+    sync_client.close()
+    try:
+        asyncio.run(async_client.aclose())
+    except Exception as e:
+        # Connections bound to a loop that has already closed are dropped at exit anyway
+        logger.debug("embedding_http_client_close_failed", error=str(e))
+
+
+def _resolve_device() -> str:
+    """
+    Pick the device for HuggingFace embedding models.
+
+    Returns:
+        settings.embedding_device if set, otherwise "cuda" when torch reports
+        a GPU and "cpu" when it does not (or torch is not installed)
+    """
+    if settings.embedding_device:
+        return settings.embedding_device
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _load_sentence_transformer(model_name: str, device: str) -> Optional[Any]:
+    """
+    Load a SentenceTransformer model onto a device.
+
+    On CUDA the weights are cast to float16 (unless
+    settings.embedding_half_precision is off) to run on tensor cores.
+
+    Args:
+        model_name: Model name or path
+        device: Torch device string
+
+    Returns:
+        SentenceTransformer instance, or None if sentence-transformers is not installed
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+
+    model = SentenceTransformer(model_name, device=device)
+    if device.startswith("cuda") and settings.embedding_half_precision:
+        model = model.half()
+    return model
+
+
+class _SentenceTransformerEmbeddings(Embeddings):
+    """
+    LangChain embeddings that call SentenceTransformer.encode directly.
+
+    Tokenization, the forward pass and pooling run in one batched encode
+    call that returns a numpy matrix, skipping the per-call overhead of the
+    HuggingFaceEmbeddings wrapper.
+    """
+
+    def __init__(self, model: Any, batch_size: int):
+        """
+        Initialize embeddings.
+
+        Args:
+            model: SentenceTransformer instance
+            batch_size: Texts per forward pass
+        """
+        self.model = model
+        self.batch_size = batch_size
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into a float32 matrix of shape (len(texts), dimension)."""
+        return self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=False,
+            show_progress_bar=False,
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents."""
+        return self.encode(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query."""
+        return self.encode([text])[0].tolist()
+
 
 class EmbeddingService:
     """
@@ -23,6 +185,21 @@ class EmbeddingService:
 
     Supports multiple embedding providers (OpenAI, HuggingFace).
 
+    Concurrent aembed_query calls are coalesced: queries arriving within
+    max_batch_delay_ms of each other are embedded together in one
+    aembed_documents call (up to max_batch_size), so N concurrent queries
+    cost one model pass or HTTP request instead of N.
+
+    Embeddings are cached in memory by text, so repeated queries and
+    duplicate documents skip the provider entirely.
+
+    The *_array methods return read-only float32 numpy arrays; the list
+    methods convert them for LangChain compatibility.
+
+    Embeddings are L2-normalized once when they are computed (unless
+    EMBEDDING_NORMALIZE is off), so cosine similarity is a plain dot product
+    and vector stores can use an inner-product metric without renormalizing.
+
     Example:
         >>> service = EmbeddingService()
         >>> embeddings = await service.aembed_documents(["Hello world", "Goodbye"])
@@ -33,6 +210,11 @@ class EmbeddingService:
         self,
         provider: str = "huggingface",
         model_name: Optional[str] = None,
+        max_batch_size: Optional[int] = None,
+        max_batch_delay_ms: Optional[float] = None,
+        cache_embeddings: bool = True,
+        cache_size: Optional[int] = None,
+        normalize: Optional[bool] = None,
     ):
         """
         Initialize embedding service.
@@ -40,24 +222,60 @@ class EmbeddingService:
         Args:
             provider: Embedding provider ("openai" or "huggingface")
             model_name: Optional model name override
+            max_batch_size: Max queries coalesced into one call (1 disables batching)
+            max_batch_delay_ms: How long a query waits for others to join its batch
+            cache_embeddings: Whether to cache embeddings in memory
+            cache_size: Max cached embeddings (defaults to settings)
+            normalize: L2-normalize embeddings (defaults to settings)
 
         Raises:
             LLMError: If provider is invalid or initialization fails
         """
         self.provider = provider.lower()
         self.model_name = model_name
+        self.max_batch_size = max_batch_size or settings.embedding_max_batch_size
+        self.max_batch_delay_ms = (
+            max_batch_delay_ms
+            if max_batch_delay_ms is not None
+            else settings.embedding_max_batch_delay_ms
+        )
+
+        self.cache_embeddings = cache_embeddings
+        self.normalize = settings.embedding_normalize if normalize is None else normalize
+        self._cache = LRUCache(max_size=cache_size or settings.embedding_cache_size)
+
+        # Known once any embedding has been computed
+        self._dimension: Optional[int] = None
 
         self._embeddings = self._create_embeddings()
 
+        # Query batcher, started on first aembed_query in the running loop
+        self._query_queue: Optional[asyncio.Queue] = None
+        self._query_worker: Optional[asyncio.Task] = None
+
+        # Runs local models for async callers, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         logger.info(
             "embedding_service_initialized",
             provider=self.provider,
             model=self.model_name or "default",
         )
 
+    def _model_key(self) -> Tuple[str, str]:
+        """Get (provider, resolved model name) for this service."""
+        if self.provider == "openai":
+            return self.provider, self.model_name or "text-embedding-ada-002"
+        return self.provider, self.model_name or settings.embedding_model
+
     def _create_embeddings(self) -> Embeddings:
         """
-        Create embeddings instance based on provider.
+        Get the embeddings instance for this provider and model.
+
+        Instances are shared across EmbeddingService objects with the same
+        provider and model, so a HuggingFace model is only loaded into memory
+        once per process. HuggingFace models are run through
+        sentence-transformers directly when it is installed.
 
         Returns:
             Embeddings instance
@@ -65,118 +283,402 @@ class EmbeddingService:
         Raises:
             LLMError: If provider is invalid or creation fails
         """
-        try:
-            if self.provider == "openai":
-                return OpenAIEmbeddings(
-                    model=self.model_name or "text-embedding-ada-002",
-                )
-            elif self.provider == "huggingface":
-                return HuggingFaceEmbeddings(
-                    model_name=self.model_name or settings.embedding_model,
-                )
-            else:
-                raise ValueError(f"Invalid embedding provider: {self.provider}")
-
-        except Exception as e:
-            logger.error("embedding_creation_failed", error=str(e))
-            raise LLMError(f"Failed to create embeddings: {str(e)}")
+        key = self._model_key()
+        model = key[1]
+
+        with _embeddings_models_lock:
+            embeddings = _embeddings_models.get(key)
+            if embeddings is not None:
+                return embeddings
+
+            try:
+                if self.provider == "openai":
+                    http_client, http_async_client = _get_http_clients()
+                    embeddings = OpenAIEmbeddings(
+                        model=model,
+                        http_client=http_client,
+                        http_async_client=http_async_client,
+                    )
+                elif self.provider == "huggingface":
+                    device = _resolve_device()
+                    st_model = _load_sentence_transformer(model, device)
+                    if st_model is not None:
+                        embeddings = _SentenceTransformerEmbeddings(
+                            st_model, batch_size=settings.embedding_batch_size
+                        )
+                    else:
+                        embeddings = HuggingFaceEmbeddings(
+                            model_name=model,
+                            model_kwargs={"device": device},
+                            encode_kwargs={"batch_size": settings.embedding_batch_size},
+                        )
+                    logger.debug("embedding_model_device", model=model, device=device)
+                else:
+                    raise ValueError(f"Invalid embedding provider: {self.provider}")
+
+            except Exception as e:
+                logger.error("embedding_creation_failed", error=str(e))
+                raise LLMError(f"Failed to create embeddings: {str(e)}")
+
+            _embeddings_models[key] = embeddings
+            return embeddings
 
     @property
     def embeddings(self) -> Embeddings:
         """Get the underlying embeddings instance."""
         return self._embeddings
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+    def _get_cache_key(self, text: str) -> str:
         """
-        Generate embeddings for multiple documents.
+        Generate cache key for a text.
+
+        Args:
+            text: Query or document text
+
+        Returns:
+            Cache key string
+        """
+        return make_cache_key(self.provider, self.model_name, text)
+
+    def _encode(self, texts: List[str]) -> Union[np.ndarray, List[List[float]]]:
+        """Embed texts with the provider, as a matrix when it can return one."""
+        if isinstance(self._embeddings, _SentenceTransformerEmbeddings):
+            return self._embeddings.encode(texts)
+        return self._embeddings.embed_documents(texts)
+
+    async def _run_in_executor(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking provider call on the service's worker pool.
+
+        Args:
+            func: Blocking function
+            *args: Positional arguments for func
+
+        Returns:
+            The function's return value
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.embedding_workers,
+                thread_name_prefix="psyai-embedding",
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def _aencode(self, texts: List[str]) -> Union[np.ndarray, List[List[float]]]:
+        """Embed texts with the provider asynchronously."""
+        if isinstance(self._embeddings, _SentenceTransformerEmbeddings):
+            # encode is CPU/GPU-bound, so keep it off the event loop
+            return await self._run_in_executor(self._embeddings.encode, texts)
+        if self._lacks_async("aembed_documents"):
+            return await self._run_in_executor(self._embeddings.embed_documents, texts)
+        return await self._embeddings.aembed_documents(texts)
+
+    async def _aencode_query(self, text: str) -> List[float]:
+        """Embed a query with the provider asynchronously."""
+        if self._lacks_async("aembed_query"):
+            return await self._run_in_executor(self._embeddings.embed_query, text)
+        return await self._embeddings.aembed_query(text)
+
+    def _lacks_async(self, method: str) -> bool:
+        """Check whether the provider only inherits LangChain's default-executor async method."""
+        return getattr(type(self._embeddings), method, None) is getattr(Embeddings, method)
+
+    def _to_array(self, vectors: Union[np.ndarray, List[List[float]]]) -> np.ndarray:
+        """
+        Convert provider output to a read-only (normalized) float32 matrix.
+
+        Args:
+            vectors: Embedding vectors as returned by the provider
+
+        Returns:
+            Array of shape (len(vectors), dimension)
+        """
+        matrix = np.array(vectors, dtype=np.float32)
+        if matrix.size:
+            self._dimension = matrix.shape[1]
+            if self.normalize:
+                l2_normalize_inplace(matrix)
+        # Rows are shared with the cache, so callers must not mutate them
+        matrix.setflags(write=False)
+        return matrix
+
+    def _stack(self, rows: List[np.ndarray]) -> np.ndarray:
+        """Stack embedding rows into one (n, dimension) matrix."""
+        if not rows:
+            return np.empty((0, self._dimension or 0), dtype=np.float32)
+        matrix = np.stack(rows)
+        matrix.setflags(write=False)
+        return matrix
+
+    def _get_cached_embeddings(
+        self, texts: List[str]
+    ) -> Tuple[List[Optional[np.ndarray]], Dict[str, List[int]]]:
+        """
+        Look up cached embeddings for texts.
+
+        Args:
+            texts: Query or document texts
+
+        Returns:
+            Per-text cached embedding (or None), and each distinct uncached
+            text mapped to its positions in texts (in first-seen order), so
+            repeated texts are embedded once
+        """
+        if self.cache_embeddings:
+            found = [self._cache.get(self._get_cache_key(text)) for text in texts]
+        else:
+            found = [None] * len(texts)
+
+        missing: Dict[str, List[int]] = {}
+        for i, embedding in enumerate(found):
+            if embedding is None:
+                missing.setdefault(texts[i], []).append(i)
+
+        if len(missing) < sum(map(len, missing.values())):
+            logger.debug(
+                "embedding_duplicates_skipped",
+                count=len(texts),
+                unique_uncached=len(missing),
+            )
+        return found, missing
+
+    @staticmethod
+    def _scatter(
+        embeddings: List[Optional[np.ndarray]],
+        missing: Dict[str, List[int]],
+        uncached: List[str],
+        computed: np.ndarray,
+    ) -> None:
+        """Write each computed embedding to every position of its text."""
+        for text, embedding in zip(uncached, computed):
+            for i in missing[text]:
+                embeddings[i] = embedding
+
+    def _cache_embeddings(self, texts: List[str], embeddings: np.ndarray) -> None:
+        """
+        Cache embeddings for texts.
+
+        Args:
+            texts: Query or document texts
+            embeddings: Embedding matrix with one row per text
+        """
+        if self.cache_embeddings:
+            for text, embedding in zip(texts, embeddings):
+                self._cache.set(self._get_cache_key(text), embedding)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get embedding cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses and hit_rate
+        """
+        return self._cache.stats()
+
+    def clear_cache(self) -> None:
+        """Clear the embedding cache."""
+        self._cache.clear()
+        logger.info("embedding_cache_cleared")
+
+    def close(self) -> None:
+        """Shut down the worker pool used for local models."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            logger.debug("embedding_executor_closed")
+
+    def __enter__(self) -> "EmbeddingService":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for multiple documents as a float32 matrix.
 
         Args:
             texts: List of document texts
 
         Returns:
-            List of embedding vectors
+            Read-only array of shape (len(texts), dimension)
 
         Raises:
             LLMError: If embedding generation fails
 
         Example:
-            >>> embeddings = service.embed_documents(["doc1", "doc2"])
-            >>> print(len(embeddings))  # 2
-            >>> print(len(embeddings[0]))  # embedding dimension
+            >>> matrix = service.embed_documents_array(["doc1", "doc2"])
+            >>> matrix.shape  # (2, dimension)
         """
         try:
             logger.debug("embedding_documents", count=len(texts))
 
-            embeddings = self._embeddings.embed_documents(texts)
+            embeddings, missing = self._get_cached_embeddings(texts)
+            if missing:
+                uncached = list(missing)
+                computed = self._to_array(self._encode(uncached))
+                self._cache_embeddings(uncached, computed)
+                self._scatter(embeddings, missing, uncached, computed)
+
+            matrix = self._stack(embeddings)
 
             logger.info(
                 "embeddings_generated",
                 count=len(texts),
-                dimension=len(embeddings[0]) if embeddings else 0,
+                dimension=matrix.shape[1],
             )
 
-            return embeddings
+            return matrix
 
         except Exception as e:
             logger.error("embedding_documents_failed", error=str(e))
             raise LLMError(f"Failed to embed documents: {str(e)}")
 
-    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+    async def aembed_documents_array(self, texts: List[str]) -> np.ndarray:
         """
-        Generate embeddings for multiple documents asynchronously.
+        Generate embeddings for multiple documents asynchronously as a float32 matrix.
+
+        Texts are split into sub-batches of settings.embedding_batch_size,
+        embedded concurrently (at most settings.embedding_max_concurrency in
+        flight) and returned in input order. For HuggingFace models, which pad
+        each batch to its longest text, texts are bucketed by length first so
+        short texts are not padded to the length of a long outlier.
 
         Args:
             texts: List of document texts
 
         Returns:
-            List of embedding vectors
+            Read-only array of shape (len(texts), dimension)
 
         Raises:
             LLMError: If embedding generation fails
 
         Example:
-            >>> embeddings = await service.aembed_documents(["doc1", "doc2"])
+            >>> matrix = await service.aembed_documents_array(["doc1", "doc2"])
         """
         try:
             logger.debug("embedding_documents_async", count=len(texts))
 
-            embeddings = await self._embeddings.aembed_documents(texts)
+            embeddings, missing = self._get_cached_embeddings(texts)
+            uncached = list(missing)
+            if self.provider == "huggingface":
+                # Results are scattered back by text, so dispatch order is free
+                uncached.sort(key=len)
+
+            batch_size = settings.embedding_batch_size
+            chunks = [uncached[i : i + batch_size] for i in range(0, len(uncached), batch_size)]
+            semaphore = asyncio.Semaphore(settings.embedding_max_concurrency)
+
+            async def embed_chunk(chunk: List[str]) -> Union[np.ndarray, List[List[float]]]:
+                async with semaphore:
+                    return await self._aencode(chunk)
+
+            if chunks:
+                results = await asyncio.gather(*[embed_chunk(chunk) for chunk in chunks])
+                computed = self._to_array(list(itertools.chain.from_iterable(results)))
+                self._cache_embeddings(uncached, computed)
+                self._scatter(embeddings, missing, uncached, computed)
+
+            matrix = self._stack(embeddings)
 
             logger.info(
                 "embeddings_generated_async",
                 count=len(texts),
-                dimension=len(embeddings[0]) if embeddings else 0,
+                dimension=matrix.shape[1],
             )
 
-            return embeddings
+            return matrix
 
         except Exception as e:
             logger.error("embedding_documents_async_failed", error=str(e))
             raise LLMError(f"Failed to embed documents: {str(e)}")
 
-    def embed_query(self, text: str) -> List[float]:
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """
-        Generate embedding for a single query.
+        Generate embeddings for multiple documents.
+
+        Args:
+            texts: List of document texts
+
+        Returns:
+            List of embedding vectors
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> embeddings = service.embed_documents(["doc1", "doc2"])
+            >>> print(len(embeddings))  # 2
+            >>> print(len(embeddings[0]))  # embedding dimension
+        """
+        return self.embed_documents_array(texts).tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple documents asynchronously.
+
+        Args:
+            texts: List of document texts
+
+        Returns:
+            List of embedding vectors
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> embeddings = await service.aembed_documents(["doc1", "doc2"])
+        """
+        return (await self.aembed_documents_array(texts)).tolist()
+
+    def embed_and_quantize(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate document embeddings quantized to int8.
+
+        Args:
+            texts: List of document texts
+
+        Returns:
+            Tuple of (int8 matrix of shape (len(texts), dimension), float32
+            per-row scales); ``q * scales[:, None]`` approximates the embeddings
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> q, scales = service.embed_and_quantize(["doc1", "doc2"])
+            >>> q.dtype  # int8
+        """
+        return quantize_int8(self.embed_documents_array(texts))
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        """
+        Generate embedding for a single query as a float32 vector.
 
         Args:
             text: Query text
 
         Returns:
-            Embedding vector
+            Read-only array of shape (dimension,)
 
         Raises:
             LLMError: If embedding generation fails
 
         Example:
-            >>> embedding = service.embed_query("What is PsyAI?")
-            >>> print(len(embedding))  # embedding dimension
+            >>> vector = service.embed_query_array("What is PsyAI?")
         """
         try:
             logger.debug("embedding_query", text_length=len(text))
 
-            embedding = self._embeddings.embed_query(text)
+            (embedding,), missing = self._get_cached_embeddings([text])
+            if missing:
+                embedding = self._to_array([self._embeddings.embed_query(text)])[0]
+                self._cache_embeddings([text], [embedding])
 
-            logger.info("query_embedded", dimension=len(embedding))
+            logger.info("query_embedded", dimension=embedding.shape[0])
 
             return embedding
 
@@ -184,28 +686,36 @@ class EmbeddingService:
             logger.error("embedding_query_failed", error=str(e))
             raise LLMError(f"Failed to embed query: {str(e)}")
 
-    async def aembed_query(self, text: str) -> List[float]:
+    async def aembed_query_array(self, text: str) -> np.ndarray:
         """
-        Generate embedding for a single query asynchronously.
+        Generate embedding for a single query asynchronously as a float32 vector.
 
         Args:
             text: Query text
 
         Returns:
-            Embedding vector
+            Read-only array of shape (dimension,)
 
         Raises:
             LLMError: If embedding generation fails
 
         Example:
-            >>> embedding = await service.aembed_query("What is PsyAI?")
+            >>> vector = await service.aembed_query_array("What is PsyAI?")
         """
         try:
             logger.debug("embedding_query_async", text_length=len(text))
 
-            embedding = await self._embeddings.aembed_query(text)
+            (embedding,), missing = self._get_cached_embeddings([text])
+            if missing and self.max_batch_size > 1:
+                # The batcher caches what it computes
+                future = asyncio.get_running_loop().create_future()
+                await self._get_query_queue().put((text, future))
+                embedding = await future
+            elif missing:
+                embedding = self._to_array([await self._aencode_query(text)])[0]
+                self._cache_embeddings([text], [embedding])
 
-            logger.info("query_embedded_async", dimension=len(embedding))
+            logger.info("query_embedded_async", dimension=embedding.shape[0])
 
             return embedding
 
@@ -213,10 +723,96 @@ class EmbeddingService:
             logger.error("embedding_query_async_failed", error=str(e))
             raise LLMError(f"Failed to embed query: {str(e)}")
 
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Generate embedding for a single query.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> embedding = service.embed_query("What is PsyAI?")
+            >>> print(len(embedding))  # embedding dimension
+        """
+        return self.embed_query_array(text).tolist()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """
+        Generate embedding for a single query asynchronously.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> embedding = await service.aembed_query("What is PsyAI?")
+        """
+        return (await self.aembed_query_array(text)).tolist()
+
+    def _get_query_queue(self) -> asyncio.Queue:
+        """Get the query queue, starting its worker in the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        # Restart if the worker died or belongs to a previous loop (e.g. a second asyncio.run)
+        if (
+            self._query_worker is None
+            or self._query_worker.done()
+            or self._query_worker.get_loop() is not loop
+        ):
+            self._query_queue = asyncio.Queue()
+            self._query_worker = loop.create_task(self._run_query_batcher(self._query_queue))
+        return self._query_queue
+
+    async def _run_query_batcher(self, queue: asyncio.Queue) -> None:
+        """Collect queued queries into batches and embed each batch in one call."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await queue.get()]
+            deadline = loop.time() + self.max_batch_delay_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = self._to_array(await self._aencode(texts))
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            logger.debug("query_batch_embedded", batch_size=len(batch))
+
+            self._cache_embeddings(texts, vectors)
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
     def get_embedding_dimension(self) -> int:
         """
         Get the dimension of the embeddings.
 
+        The dimension is looked up (in order) from embeddings already computed
+        by this service, earlier lookups for the same provider and model, a
+        table of well-known models and the sentence-transformers model config;
+        only unknown models are probed with a test embedding.
+
         Returns:
             Embedding dimension
 
@@ -224,17 +820,28 @@ class EmbeddingService:
             >>> dimension = service.get_embedding_dimension()
             >>> print(dimension)  # e.g., 384 for MiniLM, 1536 for Ada
         """
-        # Generate a test embedding to get dimension
-        try:
-            test_embedding = self.embed_query("test")
-            return len(test_embedding)
-        except Exception as e:
-            logger.warning("embedding_dimension_check_failed", error=str(e))
-            # Return default based on provider
-            if self.provider == "openai":
-                return 1536  # text-embedding-ada-002
-            else:
-                return settings.embedding_dimension
+        if self._dimension is not None:
+            return self._dimension
+
+        key = self._model_key()
+        dimension = _embedding_dimensions.get(key) or _KNOWN_DIMENSIONS.get(key[1])
+        if dimension is None and isinstance(self._embeddings, _SentenceTransformerEmbeddings):
+            dimension = self._embeddings.model.get_sentence_embedding_dimension()
+        if dimension is None:
+            # Unknown model: embed a probe text once per process
+            try:
+                dimension = self.embed_query_array("test").shape[0]
+            except Exception as e:
+                logger.warning("embedding_dimension_check_failed", error=str(e))
+                # Return default based on provider
+                if self.provider == "openai":
+                    return 1536  # text-embedding-ada-002
+                else:
+                    return settings.embedding_dimension
+
+        _embedding_dimensions[key] = dimension
+        self._dimension = dimension
+        return dimension
 
 
 # Singleton instance
@@ -249,7 +856,8 @@ def get_embedding_service(
     """
     Get or create an embedding service instance.
 
-    By default, returns a singleton instance. Set force_new=True to create a new instance.
+    By default, returns a singleton instance. Set force_new=True to create a new instance
+    (the underlying provider model is still shared with other instances).
 
     Args:
         provider: Embedding provider ("openai" or "huggingface")
@@ -0,0 +1,195 @@
+"""
+Memory-mapped mirror of vector store embeddings.
+
+This module keeps a float32 copy of every stored embedding in a flat
+``numpy.memmap`` on disk, so brute-force scans and analytics can read the
+vectors directly instead of pulling them back through the vector database.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from psyai.core.logging import get_logger
+from psyai.core.utils.similarity import l2_normalize_inplace, top_k_indices
+
+try:
+    # SIMD distance kernels (pip install psyai[vector-kernels])
+    import simsimd
+except ImportError:
+    simsimd = None  # type: ignore
+
+logger = get_logger(__name__)
+
+# The backing file grows by this many rows at a time
+_GROW_ROWS = 65_536
+
+
+class MemmapVectorMirror:
+    """
+    Append-only float32 embedding matrix backed by a memory-mapped file.
+
+    Rows are L2-normalized on insert, so a scan is one matrix-vector product
+    over the mapped pages, and the OS page cache keeps hot vectors in memory.
+    Row IDs are kept in a JSON sidecar file, so a mirror reopened from the
+    same path resumes where it left off. Re-adding an ID overwrites its row,
+    matching the vector store's upsert, so scans never return an ID twice.
+
+    Example:
+        >>> mirror = MemmapVectorMirror("./chroma_db/psyai")
+        >>> mirror.add(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        >>> mirror.search([1.0, 0.1], k=1)
+        [('a', 0.995...)]
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a mirror.
+
+        Args:
+            path: Path prefix; vectors go to ``<path>.f32`` and IDs to ``<path>.ids.json``
+        """
+        self.vectors_path = f"{path}.f32"
+        self.ids_path = f"{path}.ids.json"
+        self.dimension: Optional[int] = None
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional[np.memmap] = None
+
+        if os.path.exists(self.ids_path) and os.path.exists(self.vectors_path):
+            with open(self.ids_path) as f:
+                state = json.load(f)
+            self.dimension = state["dimension"]
+            self._ids = state["ids"]
+            self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}
+            self._map()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _map(self) -> None:
+        """Map the backing file at its current size."""
+        rows = os.path.getsize(self.vectors_path) // (4 * self.dimension)
+        self._matrix = np.memmap(
+            self.vectors_path, dtype=np.float32, mode="r+", shape=(rows, self.dimension)
+        )
+
+    def _reserve(self, rows: int) -> None:
+        """
+        Grow the backing file so it can hold at least the given number of rows.
+
+        Args:
+            rows: Required row capacity
+        """
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if rows <= capacity:
+            return
+
+        new_capacity = -(-rows // _GROW_ROWS) * _GROW_ROWS
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+        os.makedirs(os.path.dirname(self.vectors_path) or ".", exist_ok=True)
+        with open(self.vectors_path, "ab") as f:
+            f.truncate(new_capacity * self.dimension * 4)
+        self._map()
+
+    def _save_ids(self) -> None:
+        """Persist row IDs next to the vectors."""
+        with open(self.ids_path, "w") as f:
+            json.dump({"dimension": self.dimension, "ids": self._ids}, f)
+
+    def add(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """
+        Add vectors to the mirror, overwriting the rows of IDs already present.
+
+        Args:
+            ids: Document IDs
+            embeddings: Embedding vectors (one per ID)
+
+        Raises:
+            ValueError: If the embedding dimension does not match
+        """
+        if not ids:
+            return
+
+        # Copy so the caller's embeddings are not normalized in place
+        vectors = np.array(embeddings, dtype=np.float32).reshape(len(ids), -1)
+        if self.dimension is None:
+            self.dimension = vectors.shape[1]
+        if vectors.shape[1] != self.dimension:
+            raise ValueError(
+                f"Expected embeddings of dimension {self.dimension}, got {vectors.shape[1]}"
+            )
+        l2_normalize_inplace(vectors)
+
+        rows = np.empty(len(ids), dtype=np.intp)
+        new_ids: Dict[str, int] = {}
+        for i, doc_id in enumerate(ids):
+            row = self._rows.get(doc_id)
+            if row is None:
+                row = new_ids.setdefault(doc_id, len(self._ids) + len(new_ids))
+            rows[i] = row
+
+        self._reserve(len(self._ids) + len(new_ids))
+        self._matrix[rows] = vectors
+        self._matrix.flush()
+
+        self._ids.extend(new_ids)
+        self._rows.update(new_ids)
+        self._save_ids()
+
+        logger.debug("mmap_mirror_added", count=len(ids), size=len(self))
+
+    def search(self, embedding: Sequence[float], k: int = 4) -> List[Tuple[str, float]]:
+        """
+        Find the k most similar vectors by a full scan.
+
+        Args:
+            embedding: Query embedding
+            k: Number of results to return
+
+        Returns:
+            List of (id, cosine similarity), most similar first
+        """
+        if not self._ids:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32)
+        query = query / max(float(np.sqrt(np.vdot(query, query))), 1e-12)
+        live = self._matrix[: len(self)]
+        if simsimd is not None:
+            scores = 1.0 - np.asarray(simsimd.cdist(query[None], live, metric="cos"))[0]
+        else:
+            scores = live @ query
+
+        top = top_k_indices(scores, k)
+        return [(self._ids[i], float(scores[i])) for i in top]
+
+    def remove(self, ids: Sequence[str]) -> int:
+        """
+        Remove vectors by ID, compacting the live rows in place.
+
+        Args:
+            ids: Document IDs to remove
+
+        Returns:
+            Number of vectors removed
+        """
+        to_remove = set(ids)
+        keep = np.array([doc_id not in to_remove for doc_id in self._ids], dtype=bool)
+        removed = int((~keep).sum()) if len(keep) else 0
+        if not removed:
+            return 0
+
+        kept = self._matrix[: len(self)][keep]
+        self._matrix[: len(kept)] = kept
+        self._matrix.flush()
+        self._ids = [doc_id for doc_id, k in zip(self._ids, keep) if k]
+        self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}
+        self._save_ids()
+
+        logger.debug("mmap_mirror_removed", count=removed, size=len(self))
+        return removed
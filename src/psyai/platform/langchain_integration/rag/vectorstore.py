@@ -1,23 +1,182 @@
 """
 Vector store abstraction for RAG.
 
-This module provides a unified interface for vector stores (Chroma, Pinecone, Weaviate).
+This module provides a unified interface for vector stores (Chroma, Pinecone, Weaviate,
+and an in-process store for small collections).
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import os
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 from langchain_community.vectorstores import Chroma, Weaviate
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
 
 from psyai.core.config import settings
 from psyai.core.exceptions import VectorStoreError
 from psyai.core.logging import get_logger
 from psyai.platform.langchain_integration.rag.embeddings import get_embedding_service
+from psyai.platform.langchain_integration.rag.mmap_mirror import MemmapVectorMirror
 
 logger = get_logger(__name__)
 
 
+class _InMemoryVectorStore(VectorStore):
+    """
+    LangChain vector store over an in-process exact cosine index.
+
+    For collections that fit in memory, searching a local float32 matrix is
+    much cheaper than a round trip to a vector database. Embeddings come
+    from the EmbeddingService array API, so vectors never pass through
+    Python lists. With ``quantize=True`` vectors are held as int8 with a
+    per-row scale, a quarter of the float32 footprint.
+    """
+
+    def __init__(self, embedding_service: Any, quantize: bool = False):
+        """
+        Initialize the store.
+
+        Args:
+            embedding_service: EmbeddingService used to embed texts and queries
+            quantize: Store vectors as int8 with a per-row scale
+        """
+        # Imported lazily: only the memory store needs it
+        from psyai.platform.vertexai_integration.rag.local_index import LocalVectorIndex
+
+        self._service = embedding_service
+        self._index = LocalVectorIndex(quantize=quantize)
+
+    @property
+    def embeddings(self) -> Embeddings:
+        """Get the underlying embeddings instance."""
+        return self._service.embeddings
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Embed texts and add them to the index."""
+        texts = list(texts)
+        if not texts:
+            return []
+        ids = list(ids) if ids else [str(uuid.uuid4()) for _ in texts]
+        self._index.add(ids, self._service.embed_documents_array(texts), texts, metadatas)
+        return ids
+
+    async def aadd_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Embed texts asynchronously and add them to the index."""
+        texts = list(texts)
+        if not texts:
+            return []
+        ids = list(ids) if ids else [str(uuid.uuid4()) for _ in texts]
+        embeddings = await self._service.aembed_documents_array(texts)
+        self._index.add(ids, embeddings, texts, metadatas)
+        return ids
+
+    def _search(
+        self,
+        query_embedding: Any,
+        k: int,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[Document, float]]:
+        """Rank indexed documents against a query embedding."""
+        where = (
+            (lambda metadata: all(metadata.get(key) == value for key, value in filter.items()))
+            if filter
+            else None
+        )
+        hits = self._index.search(query_embedding, k, where=where)
+        return [
+            (Document(page_content=text, metadata=metadata, id=doc_id), score)
+            for doc_id, score, text, metadata in hits
+        ]
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        """Search with cosine similarity scores (higher is more similar)."""
+        return self._search(self._service.embed_query_array(query), k, filter)
+
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        """Search for the k most similar documents."""
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
+
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        """Search for the k most similar documents asynchronously."""
+        query_embedding = await self._service.aembed_query_array(query)
+        return [doc for doc, _ in self._search(query_embedding, k, filter)]
+
+    def similarity_search_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        """Search for the k documents most similar to an embedding."""
+        return [doc for doc, _ in self._search(embedding, k, filter)]
+
+    async def asimilarity_search_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        """Search by embedding; an in-process scan needs no executor hop."""
+        return self.similarity_search_by_vector(embedding, k, filter)
+
+    def _select_relevance_score_fn(self) -> Any:
+        """Scores are already cosine similarities."""
+        return lambda score: score
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        """Remove documents by ID."""
+        return self._index.remove(ids or []) > 0
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Any,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> "_InMemoryVectorStore":
+        """Create a store from texts (embedding must be an EmbeddingService)."""
+        store = cls(embedding, quantize=kwargs.get("quantize", False))
+        store.add_texts(texts, metadatas=metadatas, ids=kwargs.get("ids"))
+        return store
+
+
 class VectorStoreManager:
     """
     Manager for vector store operations.
@@ -37,20 +196,27 @@ class VectorStoreManager:
         store_type: Optional[str] = None,
         collection_name: str = "psyai",
         embedding_service: Optional[Any] = None,
+        quantize: Optional[bool] = None,
+        mmap_mirror: Optional[bool] = None,
     ):
         """
         Initialize vector store manager.
 
         Args:
-            store_type: Type of vector store ("chroma", "pinecone", "weaviate")
+            store_type: Type of vector store ("chroma", "pinecone", "weaviate",
+                or "memory" for an in-process index suited to small collections)
             collection_name: Name of the collection/index
             embedding_service: Optional embedding service (creates default if None)
+            quantize: Store "memory" vectors as int8 (uses settings if None)
+            mmap_mirror: Also write embeddings to a memory-mapped float32 file
+                for direct scans (uses settings if None)
 
         Raises:
             VectorStoreError: If initialization fails
         """
         self.store_type = (store_type or settings.vector_db_type).lower()
         self.collection_name = collection_name
+        self.quantize = settings.memory_store_quantize if quantize is None else quantize
 
         # Get embedding service
         if embedding_service is None:
@@ -58,9 +224,21 @@ class VectorStoreManager:
 
         self.embedding_service = embedding_service
 
+        if settings.vector_mmap_mirror if mmap_mirror is None else mmap_mirror:
+            self._mirror: Optional[MemmapVectorMirror] = MemmapVectorMirror(
+                os.path.join(settings.chroma_persist_directory, collection_name)
+            )
+        else:
+            self._mirror = None
+
         # Create vector store
         self._vectorstore = self._create_vectorstore()
 
+        # Write-behind buffer of (text, metadata, id), used inside bulk_writer()
+        self.flush_threshold = settings.vectorstore_flush_threshold
+        self._write_buffer: List[Tuple[str, Dict[str, Any], str]] = []
+        self._buffering = False
+
         logger.info(
             "vectorstore_manager_initialized",
             store_type=self.store_type,
@@ -79,6 +257,9 @@ class VectorStoreManager:
         """
         try:
             embeddings = self.embedding_service.embeddings
+            if self._mirror is not None:
+                # The mirror embeds texts first, so the store gets them from the service cache
+                embeddings = self.embedding_service
 
             if self.store_type == "chroma":
                 return Chroma(
@@ -95,6 +276,9 @@ class VectorStoreManager:
                     by_text=False,
                 )
 
+            elif self.store_type == "memory":
+                return _InMemoryVectorStore(self.embedding_service, quantize=self.quantize)
+
             elif self.store_type == "pinecone":
                 # Note: Pinecone requires additional setup
                 # This is a placeholder - actual implementation needs pinecone-client
@@ -141,15 +325,28 @@ class VectorStoreManager:
             ...     metadatas=[{"source": "doc1"}, {"source": "doc2"}]
             ... )
         """
+        if self._buffering:
+            ids = self._buffer_texts(texts, metadatas, ids)
+            if len(self._write_buffer) >= self.flush_threshold:
+                self.flush()
+            return ids
+
         try:
             logger.debug("vectorstore_adding_texts", count=len(texts))
 
+            if self._mirror is not None:
+                ids = ids or [str(uuid.uuid4()) for _ in texts]
+                embeddings = self.embedding_service.embed_documents_array(texts)
+
             ids = self._vectorstore.add_texts(
                 texts=texts,
                 metadatas=metadatas,
                 ids=ids,
             )
 
+            if self._mirror is not None:
+                self._mirror.add(ids, embeddings)
+
             logger.info("vectorstore_texts_added", count=len(texts))
 
             return ids
@@ -178,15 +375,28 @@ class VectorStoreManager:
         Raises:
             VectorStoreError: If adding texts fails
         """
+        if self._buffering:
+            ids = self._buffer_texts(texts, metadatas, ids)
+            if len(self._write_buffer) >= self.flush_threshold:
+                await self.aflush()
+            return ids
+
         try:
             logger.debug("vectorstore_adding_texts_async", count=len(texts))
 
+            if self._mirror is not None:
+                ids = ids or [str(uuid.uuid4()) for _ in texts]
+                embeddings = await self.embedding_service.aembed_documents_array(texts)
+
             ids = await self._vectorstore.aadd_texts(
                 texts=texts,
                 metadatas=metadatas,
                 ids=ids,
             )
 
+            if self._mirror is not None:
+                self._mirror.add(ids, embeddings)
+
             logger.info("vectorstore_texts_added_async", count=len(texts))
 
             return ids
@@ -220,11 +430,27 @@ class VectorStoreManager:
             ... ]
             >>> ids = manager.add_documents(docs)
         """
+        if self._buffering:
+            return self.add_texts(
+                [doc.page_content for doc in documents],
+                [doc.metadata for doc in documents],
+                ids or [doc.id or str(uuid.uuid4()) for doc in documents],
+            )
+
         try:
             logger.debug("vectorstore_adding_documents", count=len(documents))
 
+            if self._mirror is not None:
+                ids = ids or [doc.id or str(uuid.uuid4()) for doc in documents]
+                embeddings = self.embedding_service.embed_documents_array(
+                    [doc.page_content for doc in documents]
+                )
+
             ids = self._vectorstore.add_documents(documents=documents, ids=ids)
 
+            if self._mirror is not None:
+                self._mirror.add(ids, embeddings)
+
             logger.info("vectorstore_documents_added", count=len(documents))
 
             return ids
@@ -251,11 +477,27 @@ class VectorStoreManager:
         Raises:
             VectorStoreError: If adding documents fails
         """
+        if self._buffering:
+            return await self.aadd_texts(
+                [doc.page_content for doc in documents],
+                [doc.metadata for doc in documents],
+                ids or [doc.id or str(uuid.uuid4()) for doc in documents],
+            )
+
         try:
             logger.debug("vectorstore_adding_documents_async", count=len(documents))
 
+            if self._mirror is not None:
+                ids = ids or [doc.id or str(uuid.uuid4()) for doc in documents]
+                embeddings = await self.embedding_service.aembed_documents_array(
+                    [doc.page_content for doc in documents]
+                )
+
             ids = await self._vectorstore.aadd_documents(documents=documents, ids=ids)
 
+            if self._mirror is not None:
+                self._mirror.add(ids, embeddings)
+
             logger.info("vectorstore_documents_added_async", count=len(documents))
 
             return ids
@@ -264,6 +506,109 @@ class VectorStoreManager:
             logger.error("vectorstore_add_documents_async_failed", error=str(e))
             raise VectorStoreError(f"Failed to add documents: {str(e)}")
 
+    def _buffer_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]],
+        ids: Optional[List[str]],
+    ) -> List[str]:
+        """
+        Queue texts in the write-behind buffer.
+
+        Args:
+            texts: Texts to add
+            metadatas: Optional metadata dicts (one per text)
+            ids: Optional IDs (generated if None)
+
+        Returns:
+            IDs the texts will be stored under
+        """
+        ids = list(ids) if ids else [str(uuid.uuid4()) for _ in texts]
+        metadatas = metadatas or [{} for _ in texts]
+        self._write_buffer.extend(zip(texts, metadatas, ids))
+        return ids
+
+    def _unzip_buffer(self) -> Tuple[List[str], List[Dict[str, Any]], List[str]]:
+        """Split the write-behind buffer into (texts, metadatas, ids)."""
+        texts, metadatas, ids = (list(column) for column in zip(*self._write_buffer))
+        return texts, metadatas, ids
+
+    def flush(self) -> int:
+        """
+        Write buffered texts to the vector store in one call.
+
+        Returns:
+            Number of texts written
+
+        Raises:
+            VectorStoreError: If adding texts fails
+        """
+        if not self._write_buffer:
+            return 0
+
+        texts, metadatas, ids = self._unzip_buffer()
+        buffering, self._buffering = self._buffering, False
+        try:
+            self.add_texts(texts, metadatas, ids)
+        finally:
+            self._buffering = buffering
+        # Cleared only once written, so a failed flush can be retried
+        self._write_buffer = []
+
+        logger.debug("vectorstore_buffer_flushed", count=len(texts))
+        return len(texts)
+
+    async def aflush(self) -> int:
+        """
+        Write buffered texts to the vector store in one call asynchronously.
+
+        Returns:
+            Number of texts written
+
+        Raises:
+            VectorStoreError: If adding texts fails
+        """
+        if not self._write_buffer:
+            return 0
+
+        texts, metadatas, ids = self._unzip_buffer()
+        buffering, self._buffering = self._buffering, False
+        try:
+            await self.aadd_texts(texts, metadatas, ids)
+        finally:
+            self._buffering = buffering
+        # Cleared only once written, so a failed flush can be retried
+        self._write_buffer = []
+
+        logger.debug("vectorstore_buffer_flushed_async", count=len(texts))
+        return len(texts)
+
+    @asynccontextmanager
+    async def bulk_writer(self) -> AsyncIterator["VectorStoreManager"]:
+        """
+        Buffer writes and send them to the store in large batches.
+
+        Inside the context, add_texts/add_documents (and their async
+        variants) only queue texts and return their IDs; the buffer is
+        written in one call whenever it reaches flush_threshold texts and
+        when the context exits. Queued texts are not searchable and are lost
+        if the process dies before they are flushed.
+
+        Yields:
+            This manager
+
+        Example:
+            >>> async with manager.bulk_writer():
+            ...     for chunk in stream_of_chunks:
+            ...         await manager.aadd_texts(chunk)
+        """
+        self._buffering = True
+        try:
+            yield self
+        finally:
+            self._buffering = False
+            await self.aflush()
+
     def similarity_search(
         self,
         query: str,
@@ -349,6 +694,60 @@ class VectorStoreManager:
             logger.error("vectorstore_search_async_failed", error=str(e))
             raise VectorStoreError(f"Similarity search failed: {str(e)}")
 
+    async def abatch_similarity_search(
+        self,
+        queries: List[str],
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Document]]:
+        """
+        Search for similar documents for several queries at once.
+
+        All queries are embedded in one batched call, then the searches run
+        concurrently by vector, so store round trips overlap instead of
+        running one query after another.
+
+        Args:
+            queries: Query texts
+            k: Number of results to return per query
+            filter: Optional metadata filter applied to every query
+
+        Returns:
+            One list of similar documents per query, in query order
+
+        Raises:
+            VectorStoreError: If search fails
+
+        Example:
+            >>> results = await manager.abatch_similarity_search(
+            ...     ["What is PsyAI?", "How are scores computed?"], k=5
+            ... )
+        """
+        try:
+            logger.debug("vectorstore_batch_search_async", queries=len(queries), k=k)
+
+            embeddings = await self.embedding_service.aembed_documents_array(queries)
+            results = await asyncio.gather(
+                *[
+                    self._vectorstore.asimilarity_search_by_vector(
+                        embedding.tolist(), k=k, filter=filter
+                    )
+                    for embedding in embeddings
+                ]
+            )
+
+            logger.info(
+                "vectorstore_batch_search_complete_async",
+                queries=len(queries),
+                results_count=sum(len(docs) for docs in results),
+            )
+
+            return list(results)
+
+        except Exception as e:
+            logger.error("vectorstore_batch_search_async_failed", error=str(e))
+            raise VectorStoreError(f"Batch similarity search failed: {str(e)}")
+
     def similarity_search_with_score(
         self,
         query: str,
@@ -391,6 +790,62 @@ class VectorStoreManager:
             logger.error("vectorstore_search_with_score_failed", error=str(e))
             raise VectorStoreError(f"Similarity search with score failed: {str(e)}")
 
+    def mirror_similarity_search(self, query: str, k: int = 4) -> List[Tuple[str, float]]:
+        """
+        Scan the memory-mapped embedding mirror for the most similar documents.
+
+        The query is compared against every mirrored vector without going
+        through the vector store, so no metadata filtering is applied.
+
+        Args:
+            query: Query text
+            k: Number of results to return
+
+        Returns:
+            List of (document ID, cosine similarity), most similar first
+
+        Raises:
+            VectorStoreError: If the mirror is disabled or the search fails
+
+        Example:
+            >>> manager = VectorStoreManager(mmap_mirror=True)
+            >>> manager.mirror_similarity_search("What is PsyAI?", k=5)
+        """
+        if self._mirror is None:
+            raise VectorStoreError("Embedding mirror is not enabled for this vector store")
+
+        try:
+            return self._mirror.search(self.embedding_service.embed_query_array(query), k)
+
+        except Exception as e:
+            logger.error("vectorstore_mirror_search_failed", error=str(e))
+            raise VectorStoreError(f"Mirror similarity search failed: {str(e)}")
+
+    async def amirror_similarity_search(self, query: str, k: int = 4) -> List[Tuple[str, float]]:
+        """
+        Scan the memory-mapped embedding mirror asynchronously.
+
+        Args:
+            query: Query text
+            k: Number of results to return
+
+        Returns:
+            List of (document ID, cosine similarity), most similar first
+
+        Raises:
+            VectorStoreError: If the mirror is disabled or the search fails
+        """
+        if self._mirror is None:
+            raise VectorStoreError("Embedding mirror is not enabled for this vector store")
+
+        try:
+            query_embedding = await self.embedding_service.aembed_query_array(query)
+            return self._mirror.search(query_embedding, k)
+
+        except Exception as e:
+            logger.error("vectorstore_mirror_search_async_failed", error=str(e))
+            raise VectorStoreError(f"Mirror similarity search failed: {str(e)}")
+
     def delete(self, ids: List[str]) -> None:
         """
         Delete documents by IDs.
@@ -408,6 +863,8 @@ class VectorStoreManager:
             logger.debug("vectorstore_deleting", count=len(ids))
 
             self._vectorstore.delete(ids=ids)
+            if self._mirror is not None:
+                self._mirror.remove(ids)
 
             logger.info("vectorstore_deleted", count=len(ids))
 
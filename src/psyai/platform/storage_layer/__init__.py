@@ -59,7 +59,11 @@ from psyai.platform.storage_layer.database import (
 )
 
 # Cache
-from psyai.platform.storage_layer.cache import RedisClient, get_redis_client
+from psyai.platform.storage_layer.cache import (
+    RedisClient,
+    RedisEmbeddingCache,
+    get_redis_client,
+)
 
 # Repositories
 from psyai.platform.storage_layer.repositories import (
@@ -99,6 +103,7 @@ __all__ = [
     "close_db",
     # Cache
     "RedisClient",
+    "RedisEmbeddingCache",
     "get_redis_client",
     # Repositories
     "BaseRepository",
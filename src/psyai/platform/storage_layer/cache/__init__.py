@@ -1,15 +1,19 @@
 """
 Cache module for PsyAI storage layer.
 
-This module provides Redis caching functionality.
+This module provides Redis and local disk caching functionality.
 """
 
+from psyai.platform.storage_layer.cache.disk_embedding_cache import DiskEmbeddingCache
+from psyai.platform.storage_layer.cache.embedding_cache import RedisEmbeddingCache
 from psyai.platform.storage_layer.cache.redis_client import (
     RedisClient,
     get_redis_client,
 )
 
 __all__ = [
+    "DiskEmbeddingCache",
     "RedisClient",
+    "RedisEmbeddingCache",
     "get_redis_client",
 ]
@@ -0,0 +1,176 @@
+"""
+Redis-backed embedding cache.
+
+This module stores embedding vectors in Redis so they survive restarts and
+are shared between workers.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from psyai.core.config import get_settings
+from psyai.core.logging import get_logger
+from psyai.core.utils.cache import make_cache_key
+from psyai.platform.storage_layer.cache.redis_client import RedisClient
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class RedisEmbeddingCache:
+    """
+    Shared embedding cache backed by Redis.
+
+    Vectors are stored as packed float32 bytes (about a third of the size of
+    JSON) under ``emb:{model}:{sha256(text)}`` and decoded zero-copy into
+    read-only float32 arrays. Redis failures are logged and treated as misses
+    so an outage only costs extra embedding calls.
+
+    Example:
+        >>> cache = RedisEmbeddingCache(model_name="text-embedding-004")
+        >>> await cache.aset_many({"hello": [0.1, 0.2]})
+        >>> await cache.aget_many(["hello", "bye"])
+        {'hello': array([0.1, 0.2], dtype=float32)}
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        redis_client: Optional[RedisClient] = None,
+        ttl: Optional[int] = None,
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            model_name: Embedding model name (part of every key)
+            redis_client: Optional Redis client (must not decode responses)
+            ttl: Time to live in seconds (defaults to settings)
+        """
+        self.model_name = model_name
+        self.ttl = ttl or settings.confidence_cache_ttl
+        self._redis = redis_client or RedisClient(decode_responses=False)
+
+    def _key(self, text: str) -> str:
+        """
+        Build the Redis key for a text.
+
+        Args:
+            text: Embedded text
+
+        Returns:
+            Redis key
+        """
+        return f"emb:{self.model_name}:{make_cache_key(text)}"
+
+    @staticmethod
+    def _encode(embedding: Sequence[float]) -> bytes:
+        """Pack an embedding as float32 bytes."""
+        return np.asarray(embedding, dtype=np.float32).tobytes()
+
+    @staticmethod
+    def _decode(raw: bytes) -> np.ndarray:
+        """View float32 bytes as a read-only embedding without copying."""
+        return np.frombuffer(raw, dtype=np.float32)
+
+    def _collect(
+        self,
+        texts: Sequence[str],
+        raw_values: Sequence[Optional[bytes]],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Map texts to decoded embeddings, skipping misses.
+
+        Args:
+            texts: Looked-up texts
+            raw_values: MGET result aligned with texts
+
+        Returns:
+            Dictionary of text to embedding for cache hits
+        """
+        found = {text: self._decode(raw) for text, raw in zip(texts, raw_values) if raw is not None}
+        logger.debug("embedding_cache_lookup", requested=len(texts), hits=len(found))
+        return found
+
+    # Synchronous methods
+
+    def get_many(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up embeddings for several texts with one MGET.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Dictionary of text to embedding for cache hits
+        """
+        if not texts:
+            return {}
+
+        try:
+            raw_values = self._redis.sync_client.mget([self._key(text) for text in texts])
+        except Exception as e:
+            logger.warning("embedding_cache_get_failed", error=str(e))
+            return {}
+
+        return self._collect(texts, raw_values)
+
+    def set_many(self, embeddings: Dict[str, Sequence[float]]) -> None:
+        """
+        Store several embeddings in one pipelined round trip.
+
+        Args:
+            embeddings: Dictionary of text to embedding
+        """
+        if not embeddings:
+            return
+
+        try:
+            pipe = self._redis.sync_client.pipeline(transaction=False)
+            for text, embedding in embeddings.items():
+                pipe.set(self._key(text), self._encode(embedding), ex=self.ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("embedding_cache_set_failed", error=str(e))
+
+    # Asynchronous methods
+
+    async def aget_many(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Async: Look up embeddings for several texts with one MGET.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Dictionary of text to embedding for cache hits
+        """
+        if not texts:
+            return {}
+
+        try:
+            raw_values = await self._redis.async_client.mget([self._key(text) for text in texts])
+        except Exception as e:
+            logger.warning("embedding_cache_get_failed", error=str(e))
+            return {}
+
+        return self._collect(texts, raw_values)
+
+    async def aset_many(self, embeddings: Dict[str, Sequence[float]]) -> None:
+        """
+        Async: Store several embeddings in one pipelined round trip.
+
+        Args:
+            embeddings: Dictionary of text to embedding
+        """
+        if not embeddings:
+            return
+
+        try:
+            pipe = self._redis.async_client.pipeline(transaction=False)
+            for text, embedding in embeddings.items():
+                pipe.set(self._key(text), self._encode(embedding), ex=self.ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("embedding_cache_set_failed", error=str(e))
@@ -29,58 +29,42 @@ Example:
     ...     response="AI is artificial intelligence",
     ...     metrics=["coherence", "fluency"]
     ... )
-"""
-
-# Client
-from psyai.platform.vertexai_integration.client import (
-    VertexAIClient,
-    get_vertexai_client,
-)
 
-# Agents
-from psyai.platform.vertexai_integration.agents import (
-    AgentBuilder,
-    AgentResponse,
-    ConversationalAgent,
-    FunctionCallingAgent,
-    SimpleAgent,
-)
+Importing one subpackage (e.g. the RAG vector store) does not load every
+Vertex AI SDK module.
+"""
 
-# RAG
-from psyai.platform.vertexai_integration.rag import (
-    Document,
-    VertexEmbeddingService,
-    VertexVectorStoreManager,
-    get_vertex_embedding_service,
-)
+from psyai.core.utils.lazy import lazy_exports
 
-# Evaluation
-from psyai.platform.vertexai_integration.evaluation import (
-    CustomMetricEvaluator,
-    EvaluationResult,
-    VertexEvaluator,
-    get_vertex_evaluator,
-)
+_CLIENT = "psyai.platform.vertexai_integration.client"
+_AGENTS = "psyai.platform.vertexai_integration.agents"
+_RAG = "psyai.platform.vertexai_integration.rag"
+_EVALUATION = "psyai.platform.vertexai_integration.evaluation"
 
-__all__ = [
+_LAZY_IMPORTS = {
     # Client
-    "VertexAIClient",
-    "get_vertexai_client",
+    "VertexAIClient": _CLIENT,
+    "aget_vertexai_client": _CLIENT,
+    "get_vertexai_client": _CLIENT,
     # Agents
-    "AgentBuilder",
-    "AgentResponse",
-    "ConversationalAgent",
-    "FunctionCallingAgent",
-    "SimpleAgent",
+    "AgentBuilder": _AGENTS,
+    "AgentResponse": _AGENTS,
+    "ConversationalAgent": _AGENTS,
+    "FunctionCallingAgent": _AGENTS,
+    "SimpleAgent": _AGENTS,
     # RAG - Embeddings
-    "VertexEmbeddingService",
-    "get_vertex_embedding_service",
+    "VertexEmbeddingService": _RAG,
+    "get_vertex_embedding_service": _RAG,
     # RAG - Vector Stores
-    "Document",
-    "VertexVectorStoreManager",
+    "Document": _RAG,
+    "VertexVectorStoreManager": _RAG,
     # Evaluation
-    "CustomMetricEvaluator",
-    "EvaluationResult",
-    "VertexEvaluator",
-    "get_vertex_evaluator",
-]
+    "CustomMetricEvaluator": _EVALUATION,
+    "EvaluationResult": _EVALUATION,
+    "VertexEvaluator": _EVALUATION,
+    "get_vertex_evaluator": _EVALUATION,
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
@@ -4,29 +4,142 @@ Base agent templates and builders for Vertex AI.
 This module provides reusable agent patterns using Vertex AI Gemini models.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import inspect
+import typing
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
 
-from vertexai.generative_models import ChatSession, Content, Part
+from vertexai.generative_models import ChatSession, Content, FunctionDeclaration, Part, Tool
 
+from psyai.core.config import settings
 from psyai.core.logging import get_logger
-from psyai.platform.vertexai_integration.client import get_vertexai_client
+from psyai.platform.vertexai_integration.client import get_vertexai_client, iter_stream_text
 
 logger = get_logger(__name__)
 
 
+# JSON schema types for annotated parameter types (anything else is a string)
+_SCHEMA_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+
+# Model/function round trips allowed per run before giving up on a final answer
+_MAX_FUNCTION_ROUNDS = 5
+
+
+def _schema_for(annotation: Any) -> Dict[str, Any]:
+    """
+    Build the JSON schema for a parameter annotation.
+
+    Args:
+        annotation: Type hint (Optional[X] is treated as X)
+
+    Returns:
+        JSON schema dict
+    """
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if origin is typing.Union and len(args) == 1:
+        return _schema_for(args[0])
+
+    schema_type = _SCHEMA_TYPES.get(origin or annotation, "string")
+    schema: Dict[str, Any] = {"type": schema_type}
+    if schema_type == "array":
+        schema["items"] = _schema_for(args[0]) if args else {"type": "string"}
+    return schema
+
+
+@lru_cache(maxsize=256)
+def _declare_function(func: Callable) -> FunctionDeclaration:
+    """
+    Build the Gemini function declaration for a function.
+
+    Reflection is cached per function, so agents sharing tools pay it once.
+
+    Args:
+        func: Callable exposed to the agent
+
+    Returns:
+        FunctionDeclaration with a JSON schema built from the signature
+    """
+    try:
+        hints = typing.get_type_hints(func)
+    except Exception:
+        hints = {}
+
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    for name, param in inspect.signature(func).parameters.items():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        properties[name] = _schema_for(hints.get(name, str))
+        if param.default is param.empty:
+            required.append(name)
+
+    declaration = FunctionDeclaration(
+        name=func.__name__,
+        description=(func.__doc__ or "No description").strip(),
+        parameters={"type": "object", "properties": properties, "required": required},
+    )
+    if not properties:
+        # Vertex rejects an OBJECT schema without properties; the SDK requires
+        # parameters, so the field is cleared on the underlying message
+        del declaration._raw_function_declaration.parameters
+    return declaration
+
+
+def _response_text(response: Any) -> str:
+    """
+    Get the text of a response, or an empty string if it has none.
+
+    Args:
+        response: GenerationResponse
+
+    Returns:
+        Response text
+    """
+    try:
+        return response.text
+    except (ValueError, AttributeError):
+        return ""
+
+
+def _to_message(content: Content) -> Dict[str, str]:
+    """
+    Convert a chat Content into a message dictionary.
+
+    Args:
+        content: Chat history entry
+
+    Returns:
+        Dictionary with role and concatenated text
+    """
+    return {
+        "role": content.role,
+        "content": "".join(getattr(part, "text", "") for part in content.parts),
+    }
+
+
+@dataclass(slots=True)
 class AgentResponse:
-    """Response from an agent."""
+    """
+    Response from an agent.
 
-    def __init__(self, content: str, metadata: Optional[Dict[str, Any]] = None):
-        """
-        Initialize agent response.
+    Attributes:
+        content: Response content
+        metadata: Optional metadata
+    """
 
-        Args:
-            content: Response content
-            metadata: Optional metadata
-        """
-        self.content = content
-        self.metadata = metadata or {}
+    content: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __str__(self) -> str:
         return self.content
@@ -56,6 +169,8 @@ class SimpleAgent:
         """
         self.system_instruction = system_instruction
         self.client = get_vertexai_client(model_name=model_name)
+        # Built once so every prompt starts with the same bytes
+        self._prefix = f"{system_instruction}\n\n" if system_instruction else ""
 
         logger.debug("simple_agent_created")
 
@@ -70,11 +185,7 @@ class SimpleAgent:
         Returns:
             AgentResponse
         """
-        full_prompt = prompt
-        if self.system_instruction:
-            full_prompt = f"{self.system_instruction}\n\n{prompt}"
-
-        result = self.client.generate(full_prompt, **kwargs)
+        result = self.client.generate(self._prefix + prompt, **kwargs)
         return AgentResponse(content=result)
 
     async def arun(self, prompt: str, **kwargs: Any) -> AgentResponse:
@@ -88,11 +199,7 @@ class SimpleAgent:
         Returns:
             AgentResponse
         """
-        full_prompt = prompt
-        if self.system_instruction:
-            full_prompt = f"{self.system_instruction}\n\n{prompt}"
-
-        result = await self.client.agenerate(full_prompt, **kwargs)
+        result = await self.client.agenerate(self._prefix + prompt, **kwargs)
         return AgentResponse(content=result)
 
 
@@ -100,6 +207,16 @@ class ConversationalAgent:
     """
     Agent with conversation memory.
 
+    The system instruction is bound to the model as its system field, and
+    the agent owns the history list resent with every message and only ever
+    appends to it, so consecutive requests share an identical prefix and can
+    hit provider-side prompt caching. Once more than ``max_turns`` plus
+    ``cache_buffer`` user/model exchanges accumulate, the oldest exchanges
+    are dropped in one step back down to ``max_turns``, so the prefix
+    changes once per ``cache_buffer`` turns instead of on every turn.
+    Per-request context (retrieved memories, RAG hits) added with
+    ``add_context`` travels in the next user message, after that prefix.
+
     Example:
         >>> agent = ConversationalAgent(system_instruction="You are helpful")
         >>> response1 = await agent.arun("My name is Alice")
@@ -110,6 +227,8 @@ class ConversationalAgent:
         self,
         system_instruction: Optional[str] = None,
         model_name: Optional[str] = None,
+        max_turns: Optional[int] = None,
+        cache_buffer: Optional[int] = None,
     ):
         """
         Initialize conversational agent.
@@ -117,33 +236,77 @@ class ConversationalAgent:
         Args:
             system_instruction: System instruction for the agent
             model_name: Optional model name override
+            max_turns: Max exchanges to keep (defaults to settings, 0 = unbounded)
+            cache_buffer: Extra exchanges allowed before trimming (defaults to settings)
         """
         self.system_instruction = system_instruction
+        self.max_turns = settings.vertex_chat_max_turns if max_turns is None else max_turns
+        self.cache_buffer = (
+            settings.vertex_chat_cache_buffer_turns if cache_buffer is None else cache_buffer
+        )
         self.client = get_vertexai_client(model_name=model_name)
         self.chat: Optional[ChatSession] = None
-        self._initialize_chat()
+        self._history: List[Content] = []
+        # Message dicts mirroring _history, converted once per message
+        self._messages: Deque[Dict[str, str]] = deque()
+        self._pending_context: List[str] = []
+        # The chat session is started on the first message
 
         logger.debug("conversational_agent_created")
 
     def _initialize_chat(self) -> None:
         """Initialize the chat session."""
-        history = []
-        if self.system_instruction:
-            # Add system instruction as first message
-            history.append(
-                Content(
-                    role="user",
-                    parts=[Part.from_text(f"System: {self.system_instruction}")],
-                )
-            )
-            history.append(
-                Content(
-                    role="model",
-                    parts=[Part.from_text("Understood. I'm ready to help.")],
-                )
-            )
+        self.chat = self.client.start_chat(system_instruction=self.system_instruction)
+        # The session appends each exchange to this same list
+        self._history = self.chat.history
+        self._messages.clear()
+
+    def add_context(self, text: str) -> None:
+        """
+        Attach dynamic context to the next message.
+
+        The text is sent as a separate part of the next user message, so the
+        system instruction and earlier turns stay a cacheable prefix.
+
+        Args:
+            text: Context text (e.g. retrieved memories or documents)
+        """
+        self._pending_context.append(text)
+
+    def _build_message(self, message: str) -> Any:
+        """
+        Combine pending context and the user message into one request.
 
-        self.chat = self.client.start_chat(history=history)
+        Args:
+            message: User message
+
+        Returns:
+            The message, or a list of parts when context is pending
+        """
+        if not self._pending_context:
+            return message
+
+        parts = [Part.from_text(text) for text in self._pending_context]
+        parts.append(Part.from_text(message))
+        self._pending_context = []
+        return parts
+
+    def _on_turn(self) -> None:
+        """Record a completed exchange, trimming once the buffer is exhausted."""
+        history = self._history
+        for content in history[len(self._messages) :]:
+            self._messages.append(_to_message(content))
+        if not self.max_turns:
+            return
+
+        turns = len(history) // 2
+        if turns > self.max_turns + self.cache_buffer:
+            overflow = 2 * (turns - self.max_turns)
+            # Trim in place: ChatSession resends this exact list
+            del history[:overflow]
+            for _ in range(overflow):
+                self._messages.popleft()
+            logger.debug("conversation_history_trimmed", dropped_turns=overflow // 2)
 
     def run(self, message: str, **kwargs: Any) -> AgentResponse:
         """
@@ -159,7 +322,8 @@ class ConversationalAgent:
         if not self.chat:
             self._initialize_chat()
 
-        response = self.chat.send_message(message, **kwargs)
+        response = self.chat.send_message(self._build_message(message), **kwargs)
+        self._on_turn()
         return AgentResponse(content=response.text)
 
     async def arun(self, message: str, **kwargs: Any) -> AgentResponse:
@@ -174,40 +338,70 @@ class ConversationalAgent:
             AgentResponse
         """
         if not self.chat:
-            self._initialize_chat()
+            # Starting a session may initialize the client, which reads credentials
+            await asyncio.to_thread(self._initialize_chat)
 
-        response = await self.chat.send_message_async(message, **kwargs)
+        response = await self.chat.send_message_async(self._build_message(message), **kwargs)
+        self._on_turn()
         return AgentResponse(content=response.text)
 
+    async def astream(self, message: str, **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Send a message and stream the response chunk by chunk.
+
+        The exchange is added to the history once the stream is consumed.
+
+        Args:
+            message: User message
+            **kwargs: Additional generation arguments
+
+        Yields:
+            Response text chunks
+        """
+        if not self.chat:
+            await asyncio.to_thread(self._initialize_chat)
+
+        stream = await self.chat.send_message_async(
+            self._build_message(message), stream=True, **kwargs
+        )
+        async for text in iter_stream_text(stream):
+            yield text
+        self._on_turn()
+
     def clear_history(self) -> None:
         """Clear conversation history."""
-        self._initialize_chat()
+        self._history.clear()
+        self._messages.clear()
+        self._pending_context = []
         logger.debug("conversation_history_cleared")
 
     def get_history(self) -> List[Dict[str, str]]:
         """
         Get conversation history.
 
+        Each message is converted once, when its exchange completes.
+
         Returns:
             List of message dictionaries
         """
         if not self.chat:
             return []
 
-        history = []
-        for content in self.chat.history:
-            history.append({
-                "role": content.role,
-                "content": "".join([part.text for part in content.parts if hasattr(part, "text")]),
-            })
-
-        return history
+        return list(self._messages)
 
 
 class FunctionCallingAgent:
     """
     Agent with function calling capabilities.
 
+    Functions are declared to Gemini through its native function-calling
+    API: a schema is built from each signature once, at construction, and
+    sent as a tool rather than pasted into the prompt. When the model calls
+    functions they are run locally and their results sent back until the
+    model answers in text. A call that fails (unknown function, bad
+    arguments, or an exception in the function) is sent back as an error
+    so the model can recover.
+
     Example:
         >>> def get_weather(location: str) -> str:
         ...     return f"Weather in {location}: Sunny"
@@ -217,6 +411,8 @@ class FunctionCallingAgent:
         ...     system_instruction="You help with weather queries"
         ... )
         >>> response = await agent.arun("What's the weather in NYC?")
+        >>> response.metadata["function_calls"]
+        [{'name': 'get_weather', 'args': {'location': 'NYC'}, 'result': 'Weather in NYC: Sunny'}]
     """
 
     def __init__(
@@ -236,6 +432,13 @@ class FunctionCallingAgent:
         self.functions = {func.__name__: func for func in functions}
         self.system_instruction = system_instruction
         self.client = get_vertexai_client(model_name=model_name)
+        # The function set is fixed, so the tool and prompt prefix are built once
+        self._tools = (
+            [Tool(function_declarations=[_declare_function(func) for func in functions])]
+            if functions
+            else None
+        )
+        self._prefix = f"{system_instruction}\n\n" if system_instruction else ""
 
         logger.debug("function_calling_agent_created", function_count=len(functions))
 
@@ -248,20 +451,17 @@ class FunctionCallingAgent:
             **kwargs: Additional generation arguments
 
         Returns:
-            AgentResponse
+            AgentResponse (metadata["function_calls"] lists the calls made;
+            metadata["truncated"] is set if the model was still calling
+            functions when the round limit was reached)
         """
-        # Build full prompt with system instruction
-        full_prompt = prompt
-        if self.system_instruction:
-            full_prompt = f"{self.system_instruction}\n\n{prompt}"
-
-        # Add function descriptions to prompt
-        func_descriptions = self._build_function_descriptions()
-        if func_descriptions:
-            full_prompt += f"\n\nAvailable functions:\n{func_descriptions}"
-
-        result = self.client.generate(full_prompt, **kwargs)
-        return AgentResponse(content=result)
+        contents = [Content(role="user", parts=[Part.from_text(self._prefix + prompt)])]
+        calls: List[Dict[str, Any]] = []
+        for _ in range(_MAX_FUNCTION_ROUNDS):
+            response = self.client.generate_response(contents, tools=self._tools, **kwargs)
+            if not self._handle_function_calls(response, contents, calls):
+                return self._final_response(response, calls)
+        return self._final_response(response, calls, truncated=True)
 
     async def arun(self, prompt: str, **kwargs: Any) -> AgentResponse:
         """
@@ -272,34 +472,104 @@ class FunctionCallingAgent:
             **kwargs: Additional generation arguments
 
         Returns:
-            AgentResponse
+            AgentResponse (metadata["function_calls"] lists the calls made;
+            metadata["truncated"] is set if the model was still calling
+            functions when the round limit was reached)
+        """
+        contents = [Content(role="user", parts=[Part.from_text(self._prefix + prompt)])]
+        calls: List[Dict[str, Any]] = []
+        for _ in range(_MAX_FUNCTION_ROUNDS):
+            response = await self.client.agenerate_response(contents, tools=self._tools, **kwargs)
+            if not self._handle_function_calls(response, contents, calls):
+                return self._final_response(response, calls)
+        return self._final_response(response, calls, truncated=True)
+
+    @staticmethod
+    def _final_response(
+        response: Any, calls: List[Dict[str, Any]], truncated: bool = False
+    ) -> AgentResponse:
         """
-        # Build full prompt with system instruction
-        full_prompt = prompt
-        if self.system_instruction:
-            full_prompt = f"{self.system_instruction}\n\n{prompt}"
+        Build the agent response from the model's last response.
 
-        # Add function descriptions to prompt
-        func_descriptions = self._build_function_descriptions()
-        if func_descriptions:
-            full_prompt += f"\n\nAvailable functions:\n{func_descriptions}"
+        Args:
+            response: Last model response
+            calls: Record of calls made
+            truncated: The round limit was reached while the model was still
+                calling functions, so there is no text answer
 
-        result = await self.client.agenerate(full_prompt, **kwargs)
-        return AgentResponse(content=result)
+        Returns:
+            AgentResponse
+        """
+        metadata: Dict[str, Any] = {"function_calls": calls}
+        if truncated:
+            logger.warning(
+                "function_calling_rounds_exhausted",
+                max_rounds=_MAX_FUNCTION_ROUNDS,
+                function_call_count=len(calls),
+            )
+            metadata["truncated"] = True
+        return AgentResponse(content=_response_text(response), metadata=metadata)
 
-    def _build_function_descriptions(self) -> str:
+    def _handle_function_calls(
+        self,
+        response: Any,
+        contents: List[Content],
+        calls: List[Dict[str, Any]],
+    ) -> bool:
         """
-        Build function descriptions for the prompt.
+        Run the functions a response calls and append the exchange to the request.
+
+        Args:
+            response: Model response
+            contents: Request contents, extended in place with the model's
+                call turn and the function results
+            calls: Record of calls made (with "result" or "error"), extended in place
 
         Returns:
-            String with function descriptions
+            True if functions were called (the model must be asked again)
+        """
+        if not response.candidates or not response.candidates[0].function_calls:
+            return False
+
+        candidate = response.candidates[0]
+        result_parts = []
+        for function_call in candidate.function_calls:
+            args = dict(function_call.args)
+            try:
+                result = self.call_function(function_call.name, **args)
+            except Exception as e:
+                logger.warning("function_call_failed", function=function_call.name, error=str(e))
+                calls.append({"name": function_call.name, "args": args, "error": str(e)})
+                response = {"error": str(e)}
+            else:
+                calls.append({"name": function_call.name, "args": args, "result": result})
+                response = {"content": result}
+            result_parts.append(
+                Part.from_function_response(name=function_call.name, response=response)
+            )
+
+        contents.append(candidate.content)
+        contents.append(Content(role="user", parts=result_parts))
+        return True
+
+    def call_function(self, name: str, **kwargs: Any) -> Any:
         """
-        descriptions = []
-        for name, func in self.functions.items():
-            doc = func.__doc__ or "No description"
-            descriptions.append(f"- {name}: {doc.strip()}")
+        Invoke a registered function by name.
 
-        return "\n".join(descriptions)
+        Args:
+            name: Function name chosen by the model
+            **kwargs: Function arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            ValueError: If no function with that name is registered
+        """
+        func = self.functions.get(name)
+        if func is None:
+            raise ValueError(f"Unknown function: {name}")
+        return func(**kwargs)
 
 
 class AgentBuilder:
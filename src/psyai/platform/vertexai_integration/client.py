@@ -5,19 +5,183 @@ This module provides a centralized client for interacting with Vertex AI
 Gemini models with proper error handling, retry logic, and configuration.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import vertexai
+from google.api_core import exceptions as google_exceptions
 from google.cloud import aiplatform
-from vertexai.generative_models import GenerativeModel, GenerationConfig, ChatSession
+from vertexai.generative_models import (
+    ChatSession,
+    Content,
+    GenerationConfig,
+    GenerationResponse,
+    GenerativeModel,
+    Tool,
+)
 
 from psyai.core.config import settings
 from psyai.core.exceptions import LLMError, LLMRateLimitError, LLMTimeoutError
 from psyai.core.logging import get_logger
-from psyai.core.utils import retry_async, retry_sync
+from psyai.core.utils import LRUCache, make_cache_key, retry_async, retry_sync
+
+if TYPE_CHECKING:
+    from psyai.platform.storage_layer.cache import RedisClient
 
 logger = get_logger(__name__)
 
+# Token counts are deterministic per model; the TTL only bounds Redis growth
+_TOKEN_COUNT_TTL = 30 * 24 * 3600
+
+# Provider errors retried as rate limits (ResourceExhausted is a TooManyRequests)
+_RATE_LIMIT_ERRORS = (google_exceptions.TooManyRequests,)
+# Provider errors retried as timeouts
+_TIMEOUT_ERRORS = (
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.ServiceUnavailable,
+    TimeoutError,
+)
+
+
+def _translate_error(error: Exception, event: str) -> LLMError:
+    """
+    Map a Vertex AI exception to the matching PsyAI LLM error.
+
+    Args:
+        error: Exception raised by the SDK
+        event: Log event name for errors that are not retried
+
+    Returns:
+        LLMRateLimitError, LLMTimeoutError, or LLMError
+    """
+    if isinstance(error, _RATE_LIMIT_ERRORS):
+        logger.warning("vertexai_rate_limit", error=str(error))
+        return LLMRateLimitError(str(error))
+    if isinstance(error, _TIMEOUT_ERRORS):
+        logger.warning("vertexai_timeout", error=str(error))
+        return LLMTimeoutError(str(error))
+    logger.error(event, error=str(error))
+    return LLMError(f"Vertex AI generation failed: {str(error)}")
+
+
+@lru_cache(maxsize=8)
+def _get_tokenizer(model_name: str) -> Optional[Any]:
+    """
+    Get the process-wide local tokenizer for a model.
+
+    Loading a tokenizer fetches and parses its vocabulary, so each one is
+    built once and shared by every client.
+
+    Args:
+        model_name: Gemini model name
+
+    Returns:
+        Tokenizer instance, or None if local tokenization is unavailable
+        (sentencepiece not installed or model not supported)
+    """
+    try:
+        from vertexai.preview.tokenization import get_tokenizer_for_model
+
+        return get_tokenizer_for_model(model_name)
+    except Exception as e:
+        logger.info("vertexai_local_tokenizer_unavailable", model=model_name, error=str(e))
+        return None
+
+
+async def iter_stream_text(stream: Any) -> AsyncIterator[str]:
+    """
+    Yield the text of each chunk in a streamed Gemini response.
+
+    Chunks without text (e.g. a final chunk that only carries usage
+    metadata) are skipped.
+
+    Args:
+        stream: Async iterable of GenerationResponse chunks
+
+    Yields:
+        Non-empty text chunks
+    """
+    async for chunk in stream:
+        if chunk.candidates and chunk.candidates[0].content.parts:
+            text = chunk.text
+            if text:
+                yield text
+
+
+# Per-call keyword arguments that override GenerationConfig fields
+_GENERATION_OVERRIDES = {
+    "temperature": "temperature",
+    "max_tokens": "max_output_tokens",
+    "top_p": "top_p",
+    "top_k": "top_k",
+}
+
+
+def _config_key(config: Any) -> str:
+    """
+    Serialize a generation config for use in a cache key.
+
+    Args:
+        config: GenerationConfig or dict
+
+    Returns:
+        Canonical JSON string
+    """
+    if isinstance(config, GenerationConfig):
+        config = config.to_dict()
+    return json.dumps(config, sort_keys=True, default=str)
+
+
+@lru_cache(maxsize=1)
+def _get_token_count_cache() -> LRUCache:
+    """
+    Get the process-wide token count cache.
+
+    Counts depend only on the model and text, so every client shares one
+    cache keyed by both.
+
+    Returns:
+        LRUCache of token counts
+    """
+    return LRUCache(max_size=settings.vertex_token_count_cache_size)
+
+
+# (project_id, location) the Vertex AI SDK was last initialized with
+_sdk_config: Optional[Tuple[Optional[str], Optional[str]]] = None
+_sdk_config_lock = threading.Lock()
+
+
+def init_vertexai(project_id: Optional[str], location: Optional[str]) -> None:
+    """
+    Initialize the Vertex AI SDK unless it is already set up for this project and location.
+
+    The SDK configuration is process-global (``vertexai.init`` and
+    ``aiplatform.init`` share it), so the call is skipped only when the most
+    recent initialization used the same project and location. Switching to
+    another configuration and back initializes again.
+
+    Args:
+        project_id: GCP project ID
+        location: GCP location
+
+    Example:
+        >>> init_vertexai("my-project", "us-central1")
+    """
+    global _sdk_config
+
+    config = (project_id, location)
+    if _sdk_config == config:
+        return
+
+    with _sdk_config_lock:
+        if _sdk_config != config:
+            vertexai.init(project=project_id, location=location)
+            _sdk_config = config
+
 
 class VertexAIClient:
     """
@@ -26,6 +190,10 @@ class VertexAIClient:
     This class provides a centralized interface for interacting with Vertex AI
     Gemini models, with automatic retry, error handling, and logging.
 
+    Construction only records configuration. ``vertexai.init`` and model
+    creation read credentials from disk, so they run on first use; async
+    callers run them on a worker thread so the event loop is never blocked.
+
     Example:
         >>> client = VertexAIClient()
         >>> response = await client.agenerate("What is PsyAI?")
@@ -39,6 +207,8 @@ class VertexAIClient:
         max_tokens: Optional[int] = None,
         project_id: Optional[str] = None,
         location: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        cache_responses: Optional[bool] = None,
         **kwargs: Any,
     ):
         """
@@ -50,44 +220,154 @@ class VertexAIClient:
             max_tokens: Max output tokens (defaults to settings.vertex_max_tokens)
             project_id: GCP project ID (defaults to settings.gcp_project_id)
             location: GCP location (defaults to settings.gcp_location)
+            max_concurrency: Max concurrent calls per batch
+                (defaults to settings.vertex_batch_max_concurrency)
+            cache_responses: Reuse responses for repeated prompts (defaults to
+                settings.vertex_response_cache_enabled, and on at temperature 0)
             **kwargs: Additional arguments passed to GenerationConfig
         """
         self.project_id = project_id or settings.gcp_project_id
         self.location = location or settings.gcp_location
         self.model_name = model_name or settings.vertex_model
-        self.temperature = temperature or settings.vertex_temperature
+        self.temperature = temperature if temperature is not None else settings.vertex_temperature
         self.max_tokens = max_tokens or settings.vertex_max_tokens
+        self.max_concurrency = max_concurrency or settings.vertex_batch_max_concurrency
+        if cache_responses is None:
+            cache_responses = settings.vertex_response_cache_enabled or self.temperature == 0
+        self.cache_responses = cache_responses
 
         if not self.project_id:
             raise ValueError("GCP project_id is required. Set gcp_project_id in config or environment.")
 
-        # Initialize Vertex AI
-        vertexai.init(project=self.project_id, location=self.location)
-
         # Create generation config
-        self.generation_config = GenerationConfig(
-            temperature=self.temperature,
-            max_output_tokens=self.max_tokens,
-            top_p=kwargs.get("top_p", settings.vertex_top_p),
-            top_k=kwargs.get("top_k", settings.vertex_top_k),
-        )
+        generation_params = {
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_tokens,
+            "top_p": kwargs.get("top_p", settings.vertex_top_p),
+            "top_k": kwargs.get("top_k", settings.vertex_top_k),
+        }
+        self.generation_config = GenerationConfig(**generation_params)
+        self._generation_params = generation_params
+        # Configs for per-call overrides, keyed by the overridden values
+        self._generation_configs: Dict[frozenset, Tuple[GenerationConfig, str]] = {}
+
+        # Vertex AI init and model creation are deferred to _ensure_initialized
+        self._model: Optional[GenerativeModel] = None
+        self._init_lock = threading.Lock()
+        # Models bound to a system instruction, created once per instruction
+        self._instruction_models: Dict[str, GenerativeModel] = {}
+
+        # count_tokens is an RPC; cache results in memory and optionally in Redis
+        self._token_counts = _get_token_count_cache()
+        self._response_cache = LRUCache(max_size=settings.vertex_response_cache_size)
+        self._generation_config_key = _config_key(generation_params)
+        self._token_count_store: Optional["RedisClient"] = None
+        if settings.vertex_token_count_redis_cache_enabled:
+            # Imported lazily: the storage layer pulls in the database models
+            from psyai.platform.storage_layer.cache import RedisClient
+
+            self._token_count_store = RedisClient()
+
+    def _resolve_generation_config(self, kwargs: Dict[str, Any]) -> Tuple[GenerationConfig, str]:
+        """
+        Get the generation config for a call and its cache key form.
 
-        # Initialize the model
-        self._model = self._create_model()
+        Calls without overrides reuse the client's config. Overrides
+        (temperature, max_tokens, top_p, top_k) are merged into a config
+        that is built once per distinct set of values.
 
-        logger.info(
-            "vertexai_client_initialized",
-            project=self.project_id,
-            location=self.location,
-            model=self.model_name,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-        )
+        Args:
+            kwargs: Call arguments (an explicit ``generation_config`` wins)
+
+        Returns:
+            Tuple of (GenerationConfig, serialized config for cache keys)
+        """
+        config = kwargs.get("generation_config")
+        if config is not None:
+            return config, _config_key(config)
+
+        overrides = {
+            param: kwargs[name] for name, param in _GENERATION_OVERRIDES.items() if name in kwargs
+        }
+        if not overrides:
+            return self.generation_config, self._generation_config_key
+
+        key = frozenset(overrides.items())
+        resolved = self._generation_configs.get(key)
+        if resolved is None:
+            params = {**self._generation_params, **overrides}
+            resolved = (GenerationConfig(**params), _config_key(params))
+            self._generation_configs[key] = resolved
+        return resolved
+
+    def _response_cache_key(
+        self, prompt: str, config_key: str, kwargs: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Build the response cache key for a call, if it should be cached.
+
+        Args:
+            prompt: Input prompt
+            config_key: Serialized generation config of the call
+            kwargs: Call arguments (``cache`` overrides cache_responses)
+
+        Returns:
+            Cache key string, or None if the call bypasses the cache
+        """
+        use_cache = kwargs.get("cache")
+        if not (self.cache_responses if use_cache is None else use_cache):
+            return None
+        return make_cache_key(self.model_name, config_key, prompt)
+
+    def _ensure_initialized(self) -> GenerativeModel:
+        """
+        Initialize Vertex AI and create the model on first use.
+
+        Thread-safe; the blocking work runs at most once per client.
+
+        Returns:
+            GenerativeModel instance
+
+        Raises:
+            LLMError: If model creation fails
+        """
+        if self._model is None:
+            with self._init_lock:
+                if self._model is None:
+                    init_vertexai(self.project_id, self.location)
+                    self._model = self._create_model()
+
+                    logger.info(
+                        "vertexai_client_initialized",
+                        project=self.project_id,
+                        location=self.location,
+                        model=self.model_name,
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                    )
+        return self._model
+
+    async def _aensure_initialized(self) -> GenerativeModel:
+        """
+        Initialize the client without blocking the event loop.
+
+        Returns:
+            GenerativeModel instance
+
+        Raises:
+            LLMError: If model creation fails
+        """
+        if self._model is None:
+            await asyncio.to_thread(self._ensure_initialized)
+        return self._model
 
-    def _create_model(self) -> GenerativeModel:
+    def _create_model(self, system_instruction: Optional[str] = None) -> GenerativeModel:
         """
         Create the Vertex AI model instance.
 
+        Args:
+            system_instruction: Optional system instruction bound to the model
+
         Returns:
             GenerativeModel instance
 
@@ -98,6 +378,7 @@ class VertexAIClient:
             model = GenerativeModel(
                 model_name=self.model_name,
                 generation_config=self.generation_config,
+                system_instruction=system_instruction,
             )
             return model
         except Exception as e:
@@ -106,24 +387,41 @@ class VertexAIClient:
 
     @property
     def model(self) -> GenerativeModel:
-        """Get the underlying model instance."""
-        return self._model
+        """Get the underlying model instance, initializing the client if needed."""
+        return self._ensure_initialized()
 
-    def start_chat(self, history: Optional[List[Dict[str, str]]] = None) -> ChatSession:
+    def start_chat(
+        self,
+        history: Optional[List[Content]] = None,
+        system_instruction: Optional[str] = None,
+    ) -> ChatSession:
         """
         Start a chat session.
 
+        The system instruction is sent as the request's system field rather
+        than as a chat turn, so it is the same fixed prefix on every message.
+
         Args:
             history: Optional chat history
+            system_instruction: Optional system instruction for the session
 
         Returns:
             ChatSession instance
 
         Example:
-            >>> chat = client.start_chat()
+            >>> chat = client.start_chat(system_instruction="You are helpful")
             >>> response = chat.send_message("Hello!")
         """
-        return self._model.start_chat(history=history or [])
+        model = self.model
+        if system_instruction:
+            model = self._instruction_models.get(system_instruction)
+            if model is None:
+                with self._init_lock:
+                    model = self._instruction_models.get(system_instruction)
+                    if model is None:
+                        model = self._create_model(system_instruction)
+                        self._instruction_models[system_instruction] = model
+        return model.start_chat(history=history or [])
 
     @retry_sync(
         max_attempts=3,
@@ -140,7 +438,8 @@ class VertexAIClient:
 
         Args:
             prompt: Input prompt
-            **kwargs: Additional generation arguments
+            **kwargs: Additional generation arguments (``cache=True/False``
+                overrides cache_responses for this call)
 
         Returns:
             Generated response
@@ -150,12 +449,20 @@ class VertexAIClient:
             LLMRateLimitError: If rate limit is hit
             LLMTimeoutError: If request times out
         """
+        generation_config, config_key = self._resolve_generation_config(kwargs)
+        cache_key = self._response_cache_key(prompt, config_key, kwargs)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("vertexai_response_cache_hit")
+                return cached
+
         try:
             logger.debug("vertexai_generate_start", prompt_length=len(prompt))
 
-            response = self._model.generate_content(
+            response = self.model.generate_content(
                 prompt,
-                generation_config=kwargs.get("generation_config", self.generation_config),
+                generation_config=generation_config,
             )
 
             result = response.text
@@ -166,20 +473,12 @@ class VertexAIClient:
                 response_length=len(result),
             )
 
+            if cache_key is not None:
+                self._response_cache.set(cache_key, result)
             return result
 
         except Exception as e:
-            error_msg = str(e).lower()
-
-            if "quota" in error_msg or "rate limit" in error_msg or "429" in error_msg:
-                logger.warning("vertexai_rate_limit", error=str(e))
-                raise LLMRateLimitError(str(e))
-            elif "timeout" in error_msg or "timed out" in error_msg:
-                logger.warning("vertexai_timeout", error=str(e))
-                raise LLMTimeoutError(str(e))
-            else:
-                logger.error("vertexai_generate_error", error=str(e))
-                raise LLMError(f"Vertex AI generation failed: {str(e)}")
+            raise _translate_error(e, "vertexai_generate_error")
 
     @retry_async(
         max_attempts=3,
@@ -196,7 +495,8 @@ class VertexAIClient:
 
         Args:
             prompt: Input prompt
-            **kwargs: Additional generation arguments
+            **kwargs: Additional generation arguments (``cache=True/False``
+                overrides cache_responses for this call)
 
         Returns:
             Generated response
@@ -206,12 +506,21 @@ class VertexAIClient:
             LLMRateLimitError: If rate limit is hit
             LLMTimeoutError: If request times out
         """
+        generation_config, config_key = self._resolve_generation_config(kwargs)
+        cache_key = self._response_cache_key(prompt, config_key, kwargs)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("vertexai_response_cache_hit")
+                return cached
+
         try:
             logger.debug("vertexai_agenerate_start", prompt_length=len(prompt))
 
-            response = await self._model.generate_content_async(
+            model = await self._aensure_initialized()
+            response = await model.generate_content_async(
                 prompt,
-                generation_config=kwargs.get("generation_config", self.generation_config),
+                generation_config=generation_config,
             )
 
             result = response.text
@@ -222,20 +531,138 @@ class VertexAIClient:
                 response_length=len(result),
             )
 
+            if cache_key is not None:
+                self._response_cache.set(cache_key, result)
             return result
 
         except Exception as e:
-            error_msg = str(e).lower()
-
-            if "quota" in error_msg or "rate limit" in error_msg or "429" in error_msg:
-                logger.warning("vertexai_rate_limit", error=str(e))
-                raise LLMRateLimitError(str(e))
-            elif "timeout" in error_msg or "timed out" in error_msg:
-                logger.warning("vertexai_timeout", error=str(e))
-                raise LLMTimeoutError(str(e))
-            else:
-                logger.error("vertexai_agenerate_error", error=str(e))
-                raise LLMError(f"Vertex AI generation failed: {str(e)}")
+            raise _translate_error(e, "vertexai_agenerate_error")
+
+    @retry_sync(
+        max_attempts=3,
+        exceptions=(LLMRateLimitError, LLMTimeoutError),
+        base_delay=2.0,
+    )
+    def generate_response(
+        self,
+        contents: Any,
+        tools: Optional[List[Tool]] = None,
+        **kwargs: Any,
+    ) -> GenerationResponse:
+        """
+        Generate a full model response synchronously.
+
+        Unlike generate, the raw response is returned so callers can read
+        function calls as well as text. Responses are not cached.
+
+        Args:
+            contents: Prompt string or list of Content (multi-turn requests)
+            tools: Optional tools (function declarations) the model may call
+            **kwargs: Additional generation arguments
+
+        Returns:
+            GenerationResponse
+
+        Raises:
+            LLMError: If generation fails
+            LLMRateLimitError: If rate limit is hit
+            LLMTimeoutError: If request times out
+        """
+        try:
+            return self.model.generate_content(
+                contents,
+                generation_config=self._resolve_generation_config(kwargs)[0],
+                tools=tools,
+            )
+        except Exception as e:
+            raise _translate_error(e, "vertexai_generate_response_error")
+
+    @retry_async(
+        max_attempts=3,
+        exceptions=(LLMRateLimitError, LLMTimeoutError),
+        base_delay=2.0,
+    )
+    async def agenerate_response(
+        self,
+        contents: Any,
+        tools: Optional[List[Tool]] = None,
+        **kwargs: Any,
+    ) -> GenerationResponse:
+        """
+        Generate a full model response asynchronously.
+
+        Args:
+            contents: Prompt string or list of Content (multi-turn requests)
+            tools: Optional tools (function declarations) the model may call
+            **kwargs: Additional generation arguments
+
+        Returns:
+            GenerationResponse
+
+        Raises:
+            LLMError: If generation fails
+            LLMRateLimitError: If rate limit is hit
+            LLMTimeoutError: If request times out
+        """
+        try:
+            model = await self._aensure_initialized()
+            return await model.generate_content_async(
+                contents,
+                generation_config=self._resolve_generation_config(kwargs)[0],
+                tools=tools,
+            )
+        except Exception as e:
+            raise _translate_error(e, "vertexai_agenerate_response_error")
+
+    async def astream(
+        self,
+        prompt: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response asynchronously, chunk by chunk.
+
+        The first chunk arrives after time-to-first-token instead of after
+        the whole completion. Streams are not retried, since chunks may
+        already have been consumed when an error occurs.
+
+        Args:
+            prompt: Input prompt
+            **kwargs: Additional generation arguments
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            LLMError: If generation fails
+            LLMRateLimitError: If rate limit is hit
+            LLMTimeoutError: If request times out
+
+        Example:
+            >>> async for chunk in client.astream("Tell me about PsyAI"):
+            ...     print(chunk, end="")
+        """
+        logger.debug("vertexai_astream_start", prompt_length=len(prompt))
+
+        response_length = 0
+        try:
+            model = await self._aensure_initialized()
+            stream = await model.generate_content_async(
+                prompt,
+                generation_config=self._resolve_generation_config(kwargs)[0],
+                stream=True,
+            )
+            async for text in iter_stream_text(stream):
+                response_length += len(text)
+                yield text
+        except Exception as e:
+            raise _translate_error(e, "vertexai_astream_error")
+
+        logger.info(
+            "vertexai_astream_complete",
+            prompt_length=len(prompt),
+            response_length=response_length,
+        )
 
     def batch_generate(
         self,
@@ -245,6 +672,10 @@ class VertexAIClient:
         """
         Generate responses for multiple prompts in batch.
 
+        Calls run on a thread pool with at most max_concurrency in flight, so
+        the batch takes about as long as its slowest calls rather than the
+        sum of all of them. Results are returned in prompt order.
+
         Args:
             prompts: List of input prompts
             **kwargs: Additional arguments
@@ -258,10 +689,9 @@ class VertexAIClient:
         try:
             logger.info("vertexai_batch_generate_start", batch_size=len(prompts))
 
-            results = []
-            for prompt in prompts:
-                result = self.generate(prompt, **kwargs)
-                results.append(result)
+            workers = max(1, min(self.max_concurrency, len(prompts)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda p: self.generate(p, **kwargs), prompts))
 
             logger.info(
                 "vertexai_batch_generate_complete",
@@ -283,6 +713,9 @@ class VertexAIClient:
         """
         Generate responses for multiple prompts in batch asynchronously.
 
+        Requests are issued concurrently with at most max_concurrency in
+        flight. Results are returned in prompt order.
+
         Args:
             prompts: List of input prompts
             **kwargs: Additional arguments
@@ -296,10 +729,13 @@ class VertexAIClient:
         try:
             logger.info("vertexai_abatch_generate_start", batch_size=len(prompts))
 
-            results = []
-            for prompt in prompts:
-                result = await self.agenerate(prompt, **kwargs)
-                results.append(result)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def generate_one(prompt: str) -> str:
+                async with semaphore:
+                    return await self.agenerate(prompt, **kwargs)
+
+            results = await asyncio.gather(*[generate_one(prompt) for prompt in prompts])
 
             logger.info(
                 "vertexai_abatch_generate_complete",
@@ -317,6 +753,11 @@ class VertexAIClient:
         """
         Count the number of tokens in a text.
 
+        Uses the shared local tokenizer when available and falls back to the
+        count_tokens RPC otherwise. Results are cached per model and text in
+        a process-wide cache, so clients that differ only in generation
+        settings share counts.
+
         Args:
             text: Input text
 
@@ -326,33 +767,67 @@ class VertexAIClient:
         Raises:
             LLMError: If token counting fails
         """
+        cache_key = make_cache_key(self.model_name, text)
+        cached = self._token_counts.get(cache_key)
+        if cached is not None:
+            return cached
+
+        store_key = f"tok:{cache_key}"
+        if self._token_count_store is not None:
+            try:
+                stored = self._token_count_store.get(store_key)
+            except Exception as e:
+                logger.warning("vertexai_token_count_cache_get_failed", error=str(e))
+                stored = None
+            if stored is not None:
+                self._token_counts.set(cache_key, int(stored))
+                return int(stored)
+
         try:
-            result = self._model.count_tokens(text)
-            return result.total_tokens
+            tokenizer = _get_tokenizer(self.model_name)
+            counter = tokenizer if tokenizer is not None else self.model
+            total_tokens = counter.count_tokens(text).total_tokens
         except Exception as e:
             logger.error("vertexai_token_count_error", error=str(e))
             raise LLMError(f"Token counting failed: {str(e)}")
 
+        self._token_counts.set(cache_key, total_tokens)
+        if self._token_count_store is not None:
+            try:
+                self._token_count_store.set(store_key, total_tokens, ttl=_TOKEN_COUNT_TTL)
+            except Exception as e:
+                logger.warning("vertexai_token_count_cache_set_failed", error=str(e))
+
+        return total_tokens
 
-# Singleton instance
-_client: Optional[VertexAIClient] = None
+
+# One shared instance per (model_name, temperature, max_tokens, project_id, location)
+_clients: Dict[
+    Tuple[str, Optional[float], Optional[int], Optional[str], Optional[str]], VertexAIClient
+] = {}
+_clients_lock = threading.Lock()
 
 
 def get_vertexai_client(
     model_name: Optional[str] = None,
     temperature: Optional[float] = None,
     max_tokens: Optional[int] = None,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None,
     force_new: bool = False,
 ) -> VertexAIClient:
     """
     Get or create a Vertex AI client instance.
 
-    By default, returns a singleton instance. Set force_new=True to create a new instance.
+    Returns the shared instance for the requested configuration, creating it
+    on first use. Set force_new=True to replace it with a new instance.
 
     Args:
         model_name: Model name (defaults to settings.vertex_model)
         temperature: Model temperature (defaults to settings.vertex_temperature)
         max_tokens: Max tokens (defaults to settings.vertex_max_tokens)
+        project_id: GCP project ID (defaults to settings.gcp_project_id)
+        location: GCP location (defaults to settings.gcp_location)
         force_new: Force creation of new instance
 
     Returns:
@@ -362,13 +837,67 @@ def get_vertexai_client(
         >>> client = get_vertexai_client()
         >>> response = await client.agenerate("Hello!")
     """
-    global _client
+    key = (model_name or settings.vertex_model, temperature, max_tokens, project_id, location)
+
+    client = None if force_new else _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if force_new or client is None:
+            client = VertexAIClient(
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                project_id=project_id,
+                location=location,
+            )
+            _clients[key] = client
+
+    return client
+
+
+async def aget_vertexai_client(
+    model_name: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None,
+    force_new: bool = False,
+) -> VertexAIClient:
+    """
+    Get or create a Vertex AI client from async code.
+
+    Client creation and Vertex AI initialization run on a worker thread so
+    credential loading does not block the event loop.
+
+    Args:
+        model_name: Model name (defaults to settings.vertex_model)
+        temperature: Model temperature (defaults to settings.vertex_temperature)
+        max_tokens: Max tokens (defaults to settings.vertex_max_tokens)
+        project_id: GCP project ID (defaults to settings.gcp_project_id)
+        location: GCP location (defaults to settings.gcp_location)
+        force_new: Force creation of new instance
+
+    Returns:
+        Initialized VertexAIClient instance
+
+    Example:
+        >>> client = await aget_vertexai_client()
+        >>> response = await client.agenerate("Hello!")
+    """
 
-    if force_new or _client is None:
-        _client = VertexAIClient(
+    def create() -> VertexAIClient:
+        client = get_vertexai_client(
             model_name=model_name,
             temperature=temperature,
             max_tokens=max_tokens,
+            project_id=project_id,
+            location=location,
+            force_new=force_new,
         )
+        client._ensure_initialized()
+        return client
 
-    return _client
+    return await asyncio.to_thread(create)
@@ -4,9 +4,12 @@ Vertex AI GenAI Evaluation Service integration.
 This module provides evaluation capabilities using Vertex AI's Gen AI Evaluation Service.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 
-from google.cloud import aiplatform
 from vertexai.preview.evaluation import (
     EvalTask,
     MetricPromptTemplateExamples,
@@ -15,13 +18,55 @@ from vertexai.preview.evaluation import (
 from psyai.core.config import settings
 from psyai.core.exceptions import LLMError
 from psyai.core.logging import get_logger
+from psyai.core.utils import LRUCache, make_cache_key
+from psyai.platform.vertexai_integration.client import init_vertexai
 
 logger = get_logger(__name__)
 
+# Metric names mapped to the service's pointwise metric templates, resolved once
+_METRIC_REGISTRY: Dict[str, Any] = {
+    name.lower(): getattr(MetricPromptTemplateExamples.Pointwise, name)
+    for name in dir(MetricPromptTemplateExamples.Pointwise)
+    if name.isupper()
+}
+
+
+@lru_cache(maxsize=64)
+def _resolve_metrics(metrics: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+    """
+    Split a metric list into the built-in metrics and their templates.
+
+    Cached per metric list, since evaluations reuse the same few lists.
+
+    Args:
+        metrics: Metric names
+
+    Returns:
+        Tuple of (names with a built-in template, their templates)
+    """
+    known = tuple(metric for metric in metrics if metric in _METRIC_REGISTRY)
+    return known, tuple(_METRIC_REGISTRY[metric] for metric in known)
+
+
+def _summary(metrics: List[str]) -> str:
+    """
+    Build the summary line for an evaluation.
+
+    Args:
+        metrics: Metrics evaluated
+
+    Returns:
+        Summary string
+    """
+    return f"Evaluated with metrics: {', '.join(metrics)}"
+
 
 class EvaluationResult:
     """Result from an evaluation."""
 
+    # Batches create one result per input, so skip the per-instance __dict__
+    __slots__ = ("metrics", "summary", "details")
+
     def __init__(
         self,
         metrics: Dict[str, float],
@@ -65,6 +110,7 @@ class VertexEvaluator:
         self,
         project_id: Optional[str] = None,
         location: Optional[str] = None,
+        cache_results: Optional[bool] = None,
     ):
         """
         Initialize Vertex AI evaluator.
@@ -72,20 +118,27 @@ class VertexEvaluator:
         Args:
             project_id: GCP project ID (defaults to settings.gcp_project_id)
             location: GCP location (defaults to settings.gcp_location)
+            cache_results: Reuse scores for repeated inputs and metrics (defaults
+                to settings.vertex_eval_cache_enabled)
         """
         self.project_id = project_id or settings.gcp_project_id
         self.location = location or settings.gcp_location
+        if cache_results is None:
+            cache_results = settings.vertex_eval_cache_enabled
+        self.cache_results = cache_results
+        self._result_cache = LRUCache(max_size=settings.vertex_eval_cache_size)
 
         if not self.project_id:
             raise ValueError("GCP project_id is required")
 
-        # Initialize AI Platform
-        aiplatform.init(project=self.project_id, location=self.location)
+        # Initialize AI Platform (skipped if already set up for this project and location)
+        init_vertexai(self.project_id, self.location)
 
         logger.info(
             "vertex_evaluator_initialized",
             project=self.project_id,
             location=self.location,
+            cache_results=cache_results,
         )
 
     def evaluate(
@@ -115,43 +168,18 @@ class VertexEvaluator:
             LLMError: If evaluation fails
         """
         try:
-            logger.debug("vertex_evaluation_start", metrics=metrics)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_evaluation_start", metrics=metrics)
 
             # Use default metrics if none specified
             if metrics is None:
                 metrics = settings.vertex_eval_metrics
 
-            # Build evaluation input
-            eval_data = {
-                "prompt": prompt,
-                "response": response,
-            }
-
-            if context:
-                eval_data["context"] = context
-            if reference:
-                eval_data["reference"] = reference
-
-            # Run evaluation
-            # Note: This is a simplified implementation
-            # Actual implementation would use Vertex AI Evaluation API
-            eval_scores = {}
-
-            for metric in metrics:
-                # Placeholder - actual implementation would call Vertex AI API
-                eval_scores[metric] = 0.0
-
-            summary = f"Evaluated with metrics: {', '.join(metrics)}"
-
-            result = EvaluationResult(
-                metrics=eval_scores,
-                summary=summary,
-                details={"input": eval_data},
-            )
+            result = self._score(prompt, response, context, reference, metrics, _summary(metrics))
 
             logger.info(
                 "vertex_evaluation_complete",
-                metrics_count=len(eval_scores),
+                metrics_count=len(result.metrics),
             )
 
             return result
@@ -187,41 +215,21 @@ class VertexEvaluator:
             LLMError: If evaluation fails
         """
         try:
-            logger.debug("vertex_evaluation_async_start", metrics=metrics)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_evaluation_async_start", metrics=metrics)
 
             # Use default metrics if none specified
             if metrics is None:
                 metrics = settings.vertex_eval_metrics
 
-            # Build evaluation input
-            eval_data = {
-                "prompt": prompt,
-                "response": response,
-            }
-
-            if context:
-                eval_data["context"] = context
-            if reference:
-                eval_data["reference"] = reference
-
-            # Run evaluation
-            eval_scores = {}
-
-            for metric in metrics:
-                # Placeholder - actual implementation would call Vertex AI API
-                eval_scores[metric] = 0.0
-
-            summary = f"Evaluated with metrics: {', '.join(metrics)}"
-
-            result = EvaluationResult(
-                metrics=eval_scores,
-                summary=summary,
-                details={"input": eval_data},
+            # The evaluation service client is synchronous, so keep it off the event loop
+            result = await asyncio.to_thread(
+                self._score, prompt, response, context, reference, metrics, _summary(metrics)
             )
 
             logger.info(
                 "vertex_evaluation_async_complete",
-                metrics_count=len(eval_scores),
+                metrics_count=len(result.metrics),
             )
 
             return result
@@ -230,6 +238,133 @@ class VertexEvaluator:
             logger.error("vertex_evaluation_async_failed", error=str(e))
             raise LLMError(f"Evaluation failed: {str(e)}")
 
+    def _score(
+        self,
+        prompt: str,
+        response: str,
+        context: Optional[str],
+        reference: Optional[str],
+        metrics: List[str],
+        summary: str,
+    ) -> EvaluationResult:
+        """
+        Score one response.
+
+        Args:
+            prompt: The input prompt
+            response: The model's response
+            context: Optional context for groundedness checking
+            reference: Optional reference response for comparison
+            metrics: Metrics to evaluate
+            summary: Summary shared by every result with these metrics
+
+        Returns:
+            EvaluationResult with scores and summary
+        """
+        eval_input = {
+            "prompt": prompt,
+            "response": response,
+            "context": context,
+            "reference": reference,
+        }
+        return self._score_many([eval_input], metrics, summary)[0]
+
+    def _score_many(
+        self,
+        evaluations: List[Dict[str, Any]],
+        metrics: List[str],
+        summary: str,
+    ) -> List[EvaluationResult]:
+        """
+        Score several responses with a single evaluation task.
+
+        Every known metric for every response is computed by one
+        EvalTask.evaluate call. Metrics without a built-in template (such as
+        custom metrics) are scored 0.0, as is everything when
+        VERTEX_EVAL_ENABLED is off. With cache_results, inputs already scored
+        for the same metrics are served from memory and left out of the task.
+
+        Args:
+            evaluations: Evaluation inputs (each with prompt, response, etc.)
+            metrics: Metrics to evaluate
+            summary: Summary shared by every result with these metrics
+
+        Returns:
+            EvaluationResult per input, in input order
+        """
+        eval_rows = []
+        for eval_input in evaluations:
+            eval_data = {
+                "prompt": eval_input.get("prompt", ""),
+                "response": eval_input.get("response", ""),
+            }
+            if eval_input.get("context"):
+                eval_data["context"] = eval_input["context"]
+            if eval_input.get("reference"):
+                eval_data["reference"] = eval_input["reference"]
+            eval_rows.append(eval_data)
+
+        keys = [self._result_key(row, metrics) for row in eval_rows] if self.cache_results else []
+        scores: List[Dict[str, float]] = []
+        pending: List[int] = []
+        for i in range(len(eval_rows)):
+            cached = self._result_cache.get(keys[i]) if keys else None
+            if cached is not None:
+                scores.append(dict(cached))
+            else:
+                scores.append(dict.fromkeys(metrics, 0.0))
+                pending.append(i)
+        if len(pending) < len(eval_rows) and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("vertex_evaluation_cache_hits", hits=len(eval_rows) - len(pending))
+
+        known, templates = _resolve_metrics(tuple(metrics))
+        if known and pending and settings.vertex_eval_enabled:
+            rows = [eval_rows[i] for i in pending]
+            # The judge sees context ahead of the prompt, which groundedness checks against
+            dataset = {
+                "prompt": [
+                    f"{row['context']}\n\n{row['prompt']}" if "context" in row else row["prompt"]
+                    for row in rows
+                ],
+                "response": [row["response"] for row in rows],
+            }
+            if all("reference" in row for row in rows):
+                dataset["reference"] = [row["reference"] for row in rows]
+
+            task = EvalTask(dataset=dataset, metrics=list(templates))
+            table = task.evaluate().metrics_table
+            for metric in known:
+                for i, score in zip(pending, table[f"{metric}/score"]):
+                    scores[i][metric] = float(score)
+            if keys:
+                for i in pending:
+                    self._result_cache.set(keys[i], dict(scores[i]))
+
+        return [
+            EvaluationResult(metrics=row_scores, summary=summary, details={"input": eval_data})
+            for eval_data, row_scores in zip(eval_rows, scores)
+        ]
+
+    @staticmethod
+    def _result_key(eval_data: Dict[str, Any], metrics: List[str]) -> str:
+        """
+        Build the result cache key for an evaluation input.
+
+        Args:
+            eval_data: Evaluation input (prompt, response, context, reference)
+            metrics: Metrics evaluated
+
+        Returns:
+            Cache key string
+        """
+        return make_cache_key(
+            eval_data["prompt"],
+            eval_data["response"],
+            eval_data.get("context"),
+            eval_data.get("reference"),
+            *metrics,
+        )
+
     def batch_evaluate(
         self,
         evaluations: List[Dict[str, Any]],
@@ -239,6 +374,9 @@ class VertexEvaluator:
         """
         Evaluate multiple responses in batch.
 
+        Metric defaults and the summary are resolved once for the whole batch,
+        and all inputs are scored by a single evaluation task.
+
         Args:
             evaluations: List of evaluation inputs (each with prompt, response, etc.)
             metrics: List of metrics to evaluate
@@ -253,17 +391,11 @@ class VertexEvaluator:
         try:
             logger.info("vertex_batch_evaluation_start", batch_size=len(evaluations))
 
-            results = []
-            for eval_input in evaluations:
-                result = self.evaluate(
-                    prompt=eval_input.get("prompt", ""),
-                    response=eval_input.get("response", ""),
-                    context=eval_input.get("context"),
-                    reference=eval_input.get("reference"),
-                    metrics=metrics,
-                    **kwargs,
-                )
-                results.append(result)
+            if metrics is None:
+                metrics = settings.vertex_eval_metrics
+            summary = _summary(metrics)
+
+            results = self._score_many(evaluations, metrics, summary)
 
             logger.info(
                 "vertex_batch_evaluation_complete",
@@ -277,6 +409,62 @@ class VertexEvaluator:
             logger.error("vertex_batch_evaluation_failed", error=str(e))
             raise LLMError(f"Batch evaluation failed: {str(e)}")
 
+    def _evaluation_coros(
+        self,
+        evaluations: List[Dict[str, Any]],
+        metrics: Optional[List[str]],
+        kwargs: Dict[str, Any],
+    ) -> List[Awaitable[EvaluationResult]]:
+        """
+        Build one aevaluate coroutine per input for the concurrent batch methods.
+
+        Metric defaults are resolved once for the whole batch. A failed
+        evaluation resolves to a result with no metrics that carries the
+        LLMError as a dict in ``details["error"]`` instead of raising. The
+        semaphore is only added when the batch exceeds
+        settings.vertex_eval_concurrency.
+
+        Args:
+            evaluations: List of evaluation inputs
+            metrics: List of metrics to evaluate
+            kwargs: Additional evaluation parameters
+
+        Returns:
+            Awaitable per input, in input order
+        """
+        if metrics is None:
+            metrics = settings.vertex_eval_metrics
+
+        semaphore = (
+            asyncio.Semaphore(settings.vertex_eval_concurrency)
+            if len(evaluations) > settings.vertex_eval_concurrency
+            else None
+        )
+
+        async def evaluate_one(eval_input: Dict[str, Any]) -> EvaluationResult:
+            coro = self.aevaluate(
+                prompt=eval_input.get("prompt", ""),
+                response=eval_input.get("response", ""),
+                context=eval_input.get("context"),
+                reference=eval_input.get("reference"),
+                metrics=metrics,
+                **kwargs,
+            )
+            try:
+                if semaphore is None:
+                    return await coro
+                async with semaphore:
+                    return await coro
+            except Exception as e:
+                error = e if isinstance(e, LLMError) else LLMError(f"Evaluation failed: {str(e)}")
+                return EvaluationResult(
+                    metrics={},
+                    summary=error.message,
+                    details={"input": eval_input, "error": error.to_dict()},
+                )
+
+        return [evaluate_one(eval_input) for eval_input in evaluations]
+
     async def abatch_evaluate(
         self,
         evaluations: List[Dict[str, Any]],
@@ -286,6 +474,13 @@ class VertexEvaluator:
         """
         Evaluate multiple responses in batch asynchronously.
 
+        Metric defaults are resolved once for the whole batch, and evaluations
+        run concurrently with at most settings.vertex_eval_concurrency in
+        flight. A failed evaluation does not fail the batch: its result has
+        no metrics and carries the LLMError as a dict in ``details["error"]``.
+        Results are returned in input order; use aiter_evaluate to consume
+        them as they complete.
+
         Args:
             evaluations: List of evaluation inputs
             metrics: List of metrics to evaluate
@@ -300,30 +495,58 @@ class VertexEvaluator:
         try:
             logger.info("vertex_abatch_evaluation_start", batch_size=len(evaluations))
 
-            results = []
-            for eval_input in evaluations:
-                result = await self.aevaluate(
-                    prompt=eval_input.get("prompt", ""),
-                    response=eval_input.get("response", ""),
-                    context=eval_input.get("context"),
-                    reference=eval_input.get("reference"),
-                    metrics=metrics,
-                    **kwargs,
-                )
-                results.append(result)
+            results = await asyncio.gather(*self._evaluation_coros(evaluations, metrics, kwargs))
 
             logger.info(
                 "vertex_abatch_evaluation_complete",
                 batch_size=len(evaluations),
                 results_count=len(results),
+                failed_count=sum("error" in result.details for result in results),
             )
 
-            return results
+            return list(results)
 
         except Exception as e:
             logger.error("vertex_abatch_evaluation_failed", error=str(e))
             raise LLMError(f"Batch evaluation failed: {str(e)}")
 
+    async def aiter_evaluate(
+        self,
+        evaluations: List[Dict[str, Any]],
+        metrics: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[EvaluationResult]:
+        """
+        Evaluate multiple responses concurrently, yielding results as they complete.
+
+        Runs like abatch_evaluate, but lets the caller store or aggregate each
+        result while the rest are still running. Results arrive in completion
+        order; ``details["input"]`` identifies the input of each. Pending
+        evaluations are cancelled if the caller stops iterating early.
+
+        Args:
+            evaluations: List of evaluation inputs
+            metrics: List of metrics to evaluate
+            **kwargs: Additional evaluation parameters
+
+        Yields:
+            EvaluationResult per input, in completion order
+
+        Example:
+            >>> async for result in evaluator.aiter_evaluate(evaluations):
+            ...     await store(result)
+        """
+        tasks = [
+            asyncio.ensure_future(coro)
+            for coro in self._evaluation_coros(evaluations, metrics, kwargs)
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
 
 class CustomMetricEvaluator(VertexEvaluator):
     """
@@ -350,9 +573,10 @@ class CustomMetricEvaluator(VertexEvaluator):
         self,
         project_id: Optional[str] = None,
         location: Optional[str] = None,
+        cache_results: Optional[bool] = None,
     ):
         """Initialize custom metric evaluator."""
-        super().__init__(project_id=project_id, location=location)
+        super().__init__(project_id=project_id, location=location, cache_results=cache_results)
         self.custom_metrics: Dict[str, Dict[str, Any]] = {}
 
     def add_custom_metric(
@@ -382,6 +606,7 @@ class CustomMetricEvaluator(VertexEvaluator):
 
 # Singleton instance
 _evaluator: Optional[VertexEvaluator] = None
+_evaluator_lock = threading.Lock()
 
 
 def get_vertex_evaluator(
@@ -402,7 +627,12 @@ def get_vertex_evaluator(
     """
     global _evaluator
 
-    if force_new or _evaluator is None:
-        _evaluator = VertexEvaluator()
+    evaluator = None if force_new else _evaluator
+    if evaluator is not None:
+        return evaluator
 
-    return _evaluator
+    # Concurrent first calls must not each build an evaluator
+    with _evaluator_lock:
+        if force_new or _evaluator is None:
+            _evaluator = VertexEvaluator()
+        return _evaluator
@@ -2,20 +2,22 @@
 RAG components using Vertex AI.
 
 This module provides embeddings and vector search functionality.
+
+The embedding model SDK is only loaded once the embedding service is used.
 """
 
-from psyai.platform.vertexai_integration.rag.embeddings import (
-    VertexEmbeddingService,
-    get_vertex_embedding_service,
-)
-from psyai.platform.vertexai_integration.rag.vectorstore import (
-    Document,
-    VertexVectorStoreManager,
-)
+from psyai.core.utils.lazy import lazy_exports
+
+_EMBEDDINGS = "psyai.platform.vertexai_integration.rag.embeddings"
+_VECTORSTORE = "psyai.platform.vertexai_integration.rag.vectorstore"
+
+_LAZY_IMPORTS = {
+    "Document": _VECTORSTORE,
+    "VertexEmbeddingService": _EMBEDDINGS,
+    "VertexVectorStoreManager": _VECTORSTORE,
+    "get_vertex_embedding_service": _EMBEDDINGS,
+}
+
+__all__ = list(_LAZY_IMPORTS)
 
-__all__ = [
-    "Document",
-    "VertexEmbeddingService",
-    "VertexVectorStoreManager",
-    "get_vertex_embedding_service",
-]
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
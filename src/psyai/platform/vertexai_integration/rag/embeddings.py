@@ -4,21 +4,69 @@ Embedding service for RAG using Vertex AI.
 This module provides embedding generation using Vertex AI text embeddings API.
 """
 
-from typing import List, Optional
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
+from google.cloud import storage
 from vertexai.language_models import TextEmbeddingModel
 
 from psyai.core.config import settings
 from psyai.core.exceptions import LLMError
 from psyai.core.logging import get_logger
+from psyai.core.utils.cache import LRUCache, make_cache_key
+from psyai.core.utils.similarity import l2_normalize_inplace
+
+try:
+    # Faster batch job JSONL encoding and parsing (pip install psyai[fast-json])
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+if TYPE_CHECKING:
+    from psyai.platform.storage_layer.cache import DiskEmbeddingCache, RedisEmbeddingCache
 
 logger = get_logger(__name__)
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Dimensions learned per model, so each model is probed at most once
+_embedding_dimensions: Dict[str, int] = {}
+
+# Dimensions of well-known models, used without calling the model
+_KNOWN_DIMENSIONS: Dict[str, int] = {
+    "textembedding-gecko@001": 768,
+    "textembedding-gecko@003": 768,
+    "textembedding-gecko-multilingual@001": 768,
+    "text-embedding-004": 768,
+    "text-embedding-005": 768,
+    "text-multilingual-embedding-002": 768,
+    "gemini-embedding-001": 3072,
+}
+
 
 class VertexEmbeddingService:
     """
     Service for generating embeddings using Vertex AI.
 
+    Embeddings are L2-normalized once when they are computed (unless
+    VERTEX_EMBEDDING_NORMALIZE is off), so downstream cosine similarity is a
+    plain dot product and cached vectors never need renormalizing.
+
+    Vectors are held internally as float32 numpy arrays. The ``*_array``
+    methods return them directly (read-only); the list-returning methods
+    keep the LangChain-compatible interface.
+
+    Concurrent aembed_query calls are coalesced: uncached queries arriving
+    within max_batch_delay_ms of each other are embedded together in one
+    request (up to max_batch_size), so N concurrent queries cost one
+    round trip instead of N.
+
     Example:
         >>> service = VertexEmbeddingService()
         >>> embeddings = await service.aembed_documents(["Hello world", "Goodbye"])
@@ -28,17 +76,67 @@ class VertexEmbeddingService:
     def __init__(
         self,
         model_name: Optional[str] = None,
+        cache_embeddings: bool = True,
+        cache_size: Optional[int] = None,
+        redis_cache: Optional["RedisEmbeddingCache"] = None,
+        normalize: Optional[bool] = None,
+        max_batch_size: Optional[int] = None,
+        max_batch_delay_ms: Optional[float] = None,
     ):
         """
         Initialize Vertex AI embedding service.
 
         Args:
             model_name: Optional model name override
+            cache_embeddings: Whether to cache query embeddings in memory
+            cache_size: Max cached query embeddings (defaults to settings)
+            redis_cache: Optional shared Redis cache used as a second level
+                (created automatically when VERTEX_EMBEDDING_REDIS_CACHE_ENABLED;
+                otherwise a disk cache is used when VERTEX_EMBEDDING_CACHE_DIR is set)
+            normalize: L2-normalize embeddings (defaults to settings)
+            max_batch_size: Max queries coalesced into one request (1 disables batching)
+            max_batch_delay_ms: How long a query waits for others to join its batch
 
         Raises:
             LLMError: If initialization fails
         """
         self.model_name = model_name or settings.vertex_embedding_model
+        self.max_batch_size = max_batch_size or settings.vertex_embedding_query_batch_size
+        self.max_batch_delay_ms = (
+            max_batch_delay_ms
+            if max_batch_delay_ms is not None
+            else settings.vertex_embedding_query_batch_delay_ms
+        )
+        self.cache_embeddings = cache_embeddings
+        self.normalize = settings.vertex_embedding_normalize if normalize is None else normalize
+
+        # Warmed-up queries are pinned here and never evicted
+        self._pinned: Dict[str, np.ndarray] = {}
+
+        # Repeated queries (and retries) skip the embedding round trip
+        self._cache = LRUCache(max_size=cache_size or settings.vertex_embedding_cache_size)
+
+        # Second level shared across processes and restarts
+        shared_cache: Optional[Union["RedisEmbeddingCache", "DiskEmbeddingCache"]] = redis_cache
+        if shared_cache is None and cache_embeddings:
+            if settings.vertex_embedding_redis_cache_enabled:
+                # Imported lazily: the storage layer pulls in the database models
+                from psyai.platform.storage_layer.cache import RedisEmbeddingCache
+
+                shared_cache = RedisEmbeddingCache(model_name=self.model_name)
+            elif settings.vertex_embedding_cache_dir:
+                from psyai.platform.storage_layer.cache import DiskEmbeddingCache
+
+                shared_cache = DiskEmbeddingCache(
+                    settings.vertex_embedding_cache_dir,
+                    model_name=self.model_name,
+                    quantize=settings.vertex_embedding_cache_quantize,
+                )
+        self._shared_cache = shared_cache
+
+        # Query batcher, started on first aembed_query in the running loop
+        self._query_queue: Optional[asyncio.Queue] = None
+        self._query_worker: Optional[asyncio.Task] = None
 
         try:
             self._model = TextEmbeddingModel.from_pretrained(self.model_name)
@@ -49,6 +147,8 @@ class VertexEmbeddingService:
         logger.info(
             "vertex_embedding_service_initialized",
             model=self.model_name,
+            cache_enabled=cache_embeddings,
+            shared_cache=type(shared_cache).__name__ if shared_cache is not None else None,
         )
 
     @property
@@ -56,34 +156,274 @@ class VertexEmbeddingService:
         """Get the underlying model instance."""
         return self._model
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+    def _get_cache_key(self, text: str) -> str:
         """
-        Generate embeddings for multiple documents.
+        Generate cache key for a query text.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Cache key string
+        """
+        return make_cache_key(self.model_name, text)
+
+    def _get_cached_embedding(self, text: str) -> Optional[np.ndarray]:
+        """
+        Get query embedding from cache.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Cached embedding or None
+        """
+        pinned = self._pinned.get(text)
+        if pinned is not None:
+            return pinned
+
+        if not self.cache_embeddings:
+            return None
+
+        cached = self._cache.get(self._get_cache_key(text))
+        # Hits are served in microseconds, so skip building a disabled debug event
+        if cached is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("vertex_embedding_cache_hit", text_length=len(text))
+        return cached
+
+    def _cache_embedding(self, text: str, embedding: np.ndarray) -> None:
+        """
+        Cache a query embedding.
+
+        Args:
+            text: Query text
+            embedding: Embedding vector
+        """
+        if self.cache_embeddings:
+            self._cache.set(self._get_cache_key(text), embedding)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get query embedding cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses and hit_rate
+        """
+        return {**self._cache.stats(), "pinned": len(self._pinned)}
+
+    def clear_cache(self) -> None:
+        """Clear the query embedding cache, including warmed-up queries."""
+        self._cache.clear()
+        self._pinned.clear()
+        logger.info("vertex_embedding_cache_cleared")
+
+    def warmup(self, queries: List[str]) -> int:
+        """
+        Precompute and pin embeddings for known hot queries.
+
+        Pinned queries are answered from memory by embed_query/aembed_query
+        without touching the LRU or the API. Failures are logged, not raised,
+        so a warmup problem never blocks service start.
+
+        Args:
+            queries: Queries to embed
+
+        Returns:
+            Number of queries pinned
+
+        Example:
+            >>> service.warmup(["What is PsyAI?"])
+            1
+        """
+        pending = [query for query in dict.fromkeys(queries) if query not in self._pinned]
+        if not pending:
+            return 0
+
+        try:
+            embeddings = self.embed_documents_array(pending)
+        except LLMError as e:
+            logger.warning("vertex_embedding_warmup_failed", error=str(e))
+            return 0
+
+        self._pinned.update(zip(pending, embeddings))
+        logger.info("vertex_embedding_warmup_complete", count=len(pending))
+        return len(pending)
+
+    async def awarmup(self, queries: List[str]) -> int:
+        """
+        Precompute and pin embeddings for known hot queries asynchronously.
+
+        Args:
+            queries: Queries to embed
+
+        Returns:
+            Number of queries pinned
+
+        Example:
+            >>> await service.awarmup(["What is PsyAI?"])
+            1
+        """
+        pending = [query for query in dict.fromkeys(queries) if query not in self._pinned]
+        if not pending:
+            return 0
+
+        try:
+            embeddings = await self.aembed_documents_array(pending)
+        except LLMError as e:
+            logger.warning("vertex_embedding_warmup_failed", error=str(e))
+            return 0
+
+        self._pinned.update(zip(pending, embeddings))
+        logger.info("vertex_embedding_warmup_complete", count=len(pending))
+        return len(pending)
+
+    def _postprocess(self, vectors: Sequence[Sequence[float]]) -> np.ndarray:
+        """
+        Convert freshly computed embeddings into a read-only float32 matrix.
+
+        The API's repeated float fields are copied exactly once, here.
+
+        Args:
+            vectors: Raw embedding vectors from the API
+
+        Returns:
+            Matrix with one embedding per row, normalized if enabled
+        """
+        matrix = np.array(vectors, dtype=np.float32)
+        if matrix.size:
+            _embedding_dimensions[self.model_name] = matrix.shape[1]
+        if self.normalize:
+            l2_normalize_inplace(matrix)
+        # Rows are shared through the caches, so callers must not mutate them
+        matrix.flags.writeable = False
+        return matrix
+
+    def _stack(self, texts: List[str], found: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Assemble looked-up embeddings into a matrix in input order.
+
+        Args:
+            texts: Texts in output order
+            found: Embedding per distinct text
+
+        Returns:
+            Matrix with one embedding per text
+        """
+        if not texts:
+            return np.empty((0, settings.vertex_embedding_dimension), dtype=np.float32)
+        return np.stack([found[text] for text in texts])
+
+    def _add_blanks(
+        self, texts: Iterable[str], found: Dict[str, np.ndarray], dimension: int
+    ) -> None:
+        """
+        Map blank texts to a zero vector without calling the API.
+
+        Args:
+            texts: Distinct texts of the request
+            found: Embedding per text, updated in place
+            dimension: Embedding dimension
+        """
+        zero = np.zeros(dimension, dtype=np.float32)
+        zero.flags.writeable = False
+        for text in texts:
+            if text not in found:
+                found[text] = zero
+
+    def _chunk(self, texts: List[str], batch_size: Optional[int]) -> List[List[str]]:
+        """
+        Split texts into request-sized chunks.
+
+        When more than one chunk is needed, texts are grouped by length so
+        a few long documents do not pad or slow every request; callers map
+        results back by text, so input order is unaffected.
+
+        Args:
+            texts: Texts to split
+            batch_size: Max texts per chunk (defaults to settings)
+
+        Returns:
+            List of chunks
+        """
+        size = batch_size or settings.vertex_embedding_batch_size
+        if len(texts) > size:
+            texts = sorted(texts, key=len)
+        return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+    def embed_documents_array(
+        self,
+        texts: List[str],
+        *,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Generate embeddings for multiple documents as a float32 matrix.
+
+        Texts are sent in chunks of at most batch_size per request, with up to
+        concurrency requests in flight at once. Duplicate texts are embedded
+        once, and blank texts map to a zero vector without an API call.
 
         Args:
             texts: List of document texts
+            batch_size: Max texts per request (defaults to settings)
+            concurrency: Max concurrent requests (defaults to settings)
 
         Returns:
-            List of embedding vectors
+            Read-only float32 matrix with one embedding per text
 
         Raises:
             LLMError: If embedding generation fails
 
         Example:
-            >>> embeddings = service.embed_documents(["doc1", "doc2"])
-            >>> print(len(embeddings))  # 2
-            >>> print(len(embeddings[0]))  # embedding dimension
+            >>> embeddings = service.embed_documents_array(["doc1", "doc2"])
+            >>> embeddings.shape  # (2, embedding dimension)
         """
         try:
-            logger.debug("vertex_embedding_documents", count=len(texts))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_embedding_documents", count=len(texts))
+
+            # Each distinct non-blank text is looked up and embedded once
+            distinct = dict.fromkeys(texts)
+            unique = [text for text in distinct if text.strip()]
+            found = self._shared_cache.get_many(unique) if self._shared_cache else {}
+            missing = [text for text in unique if text not in found]
+
+            if missing:
+
+                def embed_chunk(chunk: List[str]) -> np.ndarray:
+                    embeddings_response = self._model.get_embeddings(chunk)
+                    return self._postprocess([emb.values for emb in embeddings_response])
+
+                chunks = self._chunk(missing, batch_size)
+                if len(chunks) == 1:
+                    results = [embed_chunk(chunks[0])]
+                else:
+                    workers = min(concurrency or settings.vertex_embedding_concurrency, len(chunks))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        results = list(executor.map(embed_chunk, chunks))
+                computed = {
+                    text: values
+                    for chunk, chunk_values in zip(chunks, results)
+                    for text, values in zip(chunk, chunk_values)
+                }
+                found.update(computed)
+                if self._shared_cache:
+                    self._shared_cache.set_many(computed)
+
+            if len(unique) < len(distinct):
+                dimension = (
+                    next(iter(found.values())).shape[0] if found else self.get_embedding_dimension()
+                )
+                self._add_blanks(distinct, found, dimension)
 
-            embeddings_response = self._model.get_embeddings(texts)
-            embeddings = [emb.values for emb in embeddings_response]
+            embeddings = self._stack(texts, found)
 
             logger.info(
                 "vertex_embeddings_generated",
                 count=len(texts),
-                dimension=len(embeddings[0]) if embeddings else 0,
+                computed=len(missing),
+                dimension=embeddings.shape[1],
             )
 
             return embeddings
@@ -92,12 +432,20 @@ class VertexEmbeddingService:
             logger.error("vertex_embedding_documents_failed", error=str(e))
             raise LLMError(f"Failed to embed documents: {str(e)}")
 
-    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+    def embed_documents(
+        self,
+        texts: List[str],
+        *,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[List[float]]:
         """
-        Generate embeddings for multiple documents asynchronously.
+        Generate embeddings for multiple documents.
 
         Args:
             texts: List of document texts
+            batch_size: Max texts per request (defaults to settings)
+            concurrency: Max concurrent requests (defaults to settings)
 
         Returns:
             List of embedding vectors
@@ -106,18 +454,85 @@ class VertexEmbeddingService:
             LLMError: If embedding generation fails
 
         Example:
-            >>> embeddings = await service.aembed_documents(["doc1", "doc2"])
+            >>> embeddings = service.embed_documents(["doc1", "doc2"])
+            >>> print(len(embeddings))  # 2
+            >>> print(len(embeddings[0]))  # embedding dimension
+        """
+        return self.embed_documents_array(
+            texts, batch_size=batch_size, concurrency=concurrency
+        ).tolist()
+
+    async def aembed_documents_array(
+        self,
+        texts: List[str],
+        *,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Generate embeddings for multiple documents as a float32 matrix asynchronously.
+
+        Texts are sent in chunks of at most batch_size per request, with at
+        most concurrency requests in flight to stay under the quota.
+
+        Args:
+            texts: List of document texts
+            batch_size: Max texts per request (defaults to settings)
+            concurrency: Max concurrent requests (defaults to settings)
+
+        Returns:
+            Read-only float32 matrix with one embedding per text
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> embeddings = await service.aembed_documents_array(["doc1", "doc2"])
         """
         try:
-            logger.debug("vertex_embedding_documents_async", count=len(texts))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_embedding_documents_async", count=len(texts))
+
+            # Each distinct non-blank text is looked up and embedded once
+            distinct = dict.fromkeys(texts)
+            unique = [text for text in distinct if text.strip()]
+            found = await self._shared_cache.aget_many(unique) if self._shared_cache else {}
+            missing = [text for text in unique if text not in found]
+
+            if missing:
+                semaphore = asyncio.Semaphore(concurrency or settings.vertex_embedding_concurrency)
+
+                async def embed_chunk(chunk: List[str]) -> np.ndarray:
+                    async with semaphore:
+                        embeddings_response = await self._model.get_embeddings_async(chunk)
+                    return self._postprocess([emb.values for emb in embeddings_response])
 
-            embeddings_response = await self._model.get_embeddings_async(texts)
-            embeddings = [emb.values for emb in embeddings_response]
+                chunks = self._chunk(missing, batch_size)
+                results = await asyncio.gather(*(embed_chunk(chunk) for chunk in chunks))
+                computed = {
+                    text: values
+                    for chunk, chunk_values in zip(chunks, results)
+                    for text, values in zip(chunk, chunk_values)
+                }
+                found.update(computed)
+                if self._shared_cache:
+                    await self._shared_cache.aset_many(computed)
+
+            if len(unique) < len(distinct):
+                dimension = (
+                    next(iter(found.values())).shape[0]
+                    if found
+                    else await self.aget_embedding_dimension()
+                )
+                self._add_blanks(distinct, found, dimension)
+
+            embeddings = self._stack(texts, found)
 
             logger.info(
                 "vertex_embeddings_generated_async",
                 count=len(texts),
-                dimension=len(embeddings[0]) if embeddings else 0,
+                computed=len(missing),
+                dimension=embeddings.shape[1],
             )
 
             return embeddings
@@ -126,6 +541,80 @@ class VertexEmbeddingService:
             logger.error("vertex_embedding_documents_async_failed", error=str(e))
             raise LLMError(f"Failed to embed documents: {str(e)}")
 
+    async def aembed_documents(
+        self,
+        texts: List[str],
+        *,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for multiple documents asynchronously.
+
+        Args:
+            texts: List of document texts
+            batch_size: Max texts per request (defaults to settings)
+            concurrency: Max concurrent requests (defaults to settings)
+
+        Returns:
+            List of embedding vectors
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> embeddings = await service.aembed_documents(["doc1", "doc2"])
+        """
+        embeddings = await self.aembed_documents_array(
+            texts, batch_size=batch_size, concurrency=concurrency
+        )
+        return embeddings.tolist()
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        """
+        Generate embedding for a single query as a float32 vector.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Read-only float32 embedding vector
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> embedding = service.embed_query_array("What is PsyAI?")
+            >>> embedding.shape  # (embedding dimension,)
+        """
+        cached = self._get_cached_embedding(text)
+        if cached is not None:
+            return cached
+
+        if self._shared_cache:
+            shared = self._shared_cache.get_many([text]).get(text)
+            if shared is not None:
+                self._cache_embedding(text, shared)
+                return shared
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_embedding_query", text_length=len(text))
+
+            embeddings_response = self._model.get_embeddings([text])
+            embedding = self._postprocess([embeddings_response[0].values])[0]
+            self._cache_embedding(text, embedding)
+            if self._shared_cache:
+                self._shared_cache.set_many({text: embedding})
+
+            logger.info("vertex_query_embedded", dimension=len(embedding))
+
+            return embedding
+
+        except Exception as e:
+            logger.error("vertex_embedding_query_failed", error=str(e))
+            raise LLMError(f"Failed to embed query: {str(e)}")
+
     def embed_query(self, text: str) -> List[float]:
         """
         Generate embedding for a single query.
@@ -143,18 +632,56 @@ class VertexEmbeddingService:
             >>> embedding = service.embed_query("What is PsyAI?")
             >>> print(len(embedding))  # embedding dimension
         """
+        return self.embed_query_array(text).tolist()
+
+    async def aembed_query_array(self, text: str) -> np.ndarray:
+        """
+        Generate embedding for a single query as a float32 vector asynchronously.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Read-only float32 embedding vector
+
+        Raises:
+            LLMError: If embedding generation fails
+
+        Example:
+            >>> embedding = await service.aembed_query_array("What is PsyAI?")
+        """
+        cached = self._get_cached_embedding(text)
+        if cached is not None:
+            return cached
+
+        if self._shared_cache:
+            shared = (await self._shared_cache.aget_many([text])).get(text)
+            if shared is not None:
+                self._cache_embedding(text, shared)
+                return shared
+
         try:
-            logger.debug("vertex_embedding_query", text_length=len(text))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_embedding_query_async", text_length=len(text))
 
-            embeddings_response = self._model.get_embeddings([text])
-            embedding = embeddings_response[0].values
+            if self.max_batch_size > 1:
+                # The batcher caches what it computes
+                future = asyncio.get_running_loop().create_future()
+                await self._get_query_queue().put((text, future))
+                embedding = await future
+            else:
+                embeddings_response = await self._model.get_embeddings_async([text])
+                embedding = self._postprocess([embeddings_response[0].values])[0]
+                self._cache_embedding(text, embedding)
+                if self._shared_cache:
+                    await self._shared_cache.aset_many({text: embedding})
 
-            logger.info("vertex_query_embedded", dimension=len(embedding))
+            logger.info("vertex_query_embedded_async", dimension=len(embedding))
 
             return embedding
 
         except Exception as e:
-            logger.error("vertex_embedding_query_failed", error=str(e))
+            logger.error("vertex_embedding_query_async_failed", error=str(e))
             raise LLMError(f"Failed to embed query: {str(e)}")
 
     async def aembed_query(self, text: str) -> List[float]:
@@ -173,24 +700,256 @@ class VertexEmbeddingService:
         Example:
             >>> embedding = await service.aembed_query("What is PsyAI?")
         """
+        return (await self.aembed_query_array(text)).tolist()
+
+    def _get_query_queue(self) -> asyncio.Queue:
+        """Get the query queue, starting its worker in the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        # Restart if the worker died or belongs to a previous loop (e.g. a second asyncio.run)
+        if (
+            self._query_worker is None
+            or self._query_worker.done()
+            or self._query_worker.get_loop() is not loop
+        ):
+            self._query_queue = asyncio.Queue()
+            self._query_worker = loop.create_task(self._run_query_batcher(self._query_queue))
+        return self._query_queue
+
+    async def _run_query_batcher(self, queue: asyncio.Queue) -> None:
+        """Collect queued queries into batches and embed each batch in one request."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await queue.get()]
+            deadline = loop.time() + self.max_batch_delay_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = list(dict.fromkeys(text for text, _ in batch))
+            try:
+                embeddings_response = await self._model.get_embeddings_async(texts)
+                computed = dict(
+                    zip(texts, self._postprocess([emb.values for emb in embeddings_response]))
+                )
+                if self._shared_cache:
+                    await self._shared_cache.aset_many(computed)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            logger.debug("vertex_query_batch_embedded", batch_size=len(batch))
+
+            for text, embedding in computed.items():
+                self._cache_embedding(text, embedding)
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(computed[text])
+
+    def _should_use_batch(self, count: int) -> bool:
+        """
+        Check whether a workload qualifies for batch prediction.
+
+        Args:
+            count: Number of inputs
+
+        Returns:
+            True if batch mode is enabled and the workload is large enough
+        """
+        return (
+            settings.vertex_batch_mode_enabled
+            and bool(settings.vertex_batch_gcs_prefix)
+            and count >= settings.vertex_batch_min_requests
+        )
+
+    def batch_embed_offline_array(
+        self,
+        texts: List[str],
+        gcs_prefix: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Generate embeddings through a Vertex AI batch prediction job as a float32 matrix.
+
+        Batch prediction is billed at a discount and is not subject to the
+        online rate limits, at the cost of minutes-to-hours of latency. Use it
+        for corpus ingestion and offline evaluation, not request paths.
+        Falls back to embed_documents when batch mode is disabled or the
+        workload is below VERTEX_BATCH_MIN_REQUESTS.
+
+        Args:
+            texts: List of document texts
+            gcs_prefix: GCS prefix for job input/output (defaults to settings)
+
+        Returns:
+            Read-only float32 matrix with one embedding per text, in input order
+
+        Raises:
+            LLMError: If the batch job fails
+
+        Example:
+            >>> embeddings = service.batch_embed_offline_array(corpus_chunks)
+            >>> embeddings.shape  # (len(corpus_chunks), embedding dimension)
+        """
+        gcs_prefix = gcs_prefix or settings.vertex_batch_gcs_prefix
+        if not gcs_prefix or not self._should_use_batch(len(texts)):
+            return self.embed_documents_array(texts)
+
+        job_prefix = f"{gcs_prefix.rstrip('/')}/embeddings-{uuid.uuid4().hex}"
+
         try:
-            logger.debug("vertex_embedding_query_async", text_length=len(text))
+            input_uri = self._upload_batch_input(texts, f"{job_prefix}/input.jsonl")
 
-            embeddings_response = await self._model.get_embeddings_async([text])
-            embedding = embeddings_response[0].values
+            logger.info(
+                "vertex_batch_embedding_submitted",
+                count=len(texts),
+                input_uri=input_uri,
+            )
 
-            logger.info("vertex_query_embedded_async", dimension=len(embedding))
+            # BatchPredictionJob.create blocks until the job reaches a final state
+            job = self._model.batch_predict(
+                dataset=input_uri,
+                destination_uri_prefix=f"{job_prefix}/output",
+            )
 
-            return embedding
+            embeddings_by_text: Dict[str, List[float]] = {}
+            for blob in job.iter_outputs():
+                for line in blob.download_as_bytes().splitlines():
+                    if not line.strip():
+                        continue
+                    record = _json_loads(line)
+                    content = record["instance"]["content"]
+                    values = record["predictions"][0]["embeddings"]["values"]
+                    embeddings_by_text[content] = values
+
+            missing = [text for text in texts if text not in embeddings_by_text]
+            if missing:
+                raise LLMError(f"Batch job returned no embedding for {len(missing)} inputs")
+
+            logger.info(
+                "vertex_batch_embedding_completed",
+                count=len(texts),
+                job=job.resource_name,
+            )
 
+            return self._postprocess([embeddings_by_text[text] for text in texts])
+
+        except LLMError:
+            raise
         except Exception as e:
-            logger.error("vertex_embedding_query_async_failed", error=str(e))
-            raise LLMError(f"Failed to embed query: {str(e)}")
+            logger.error("vertex_batch_embedding_failed", error=str(e))
+            raise LLMError(f"Failed to run batch embedding job: {str(e)}")
+
+    def batch_embed_offline(
+        self,
+        texts: List[str],
+        gcs_prefix: Optional[str] = None,
+    ) -> List[List[float]]:
+        """
+        Generate embeddings through a Vertex AI batch prediction job.
+
+        Args:
+            texts: List of document texts
+            gcs_prefix: GCS prefix for job input/output (defaults to settings)
+
+        Returns:
+            List of embedding vectors, in input order
+
+        Raises:
+            LLMError: If the batch job fails
+
+        Example:
+            >>> embeddings = service.batch_embed_offline(corpus_chunks)
+        """
+        return self.batch_embed_offline_array(texts, gcs_prefix).tolist()
+
+    async def abatch_embed_offline_array(
+        self,
+        texts: List[str],
+        gcs_prefix: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Generate embeddings through a Vertex AI batch prediction job asynchronously.
+
+        Args:
+            texts: List of document texts
+            gcs_prefix: GCS prefix for job input/output (defaults to settings)
+
+        Returns:
+            Read-only float32 matrix with one embedding per text, in input order
+
+        Raises:
+            LLMError: If the batch job fails
+
+        Example:
+            >>> embeddings = await service.abatch_embed_offline_array(corpus_chunks)
+        """
+        gcs_prefix = gcs_prefix or settings.vertex_batch_gcs_prefix
+        if not gcs_prefix or not self._should_use_batch(len(texts)):
+            return await self.aembed_documents_array(texts)
+
+        # The SDK polls the job synchronously, so keep it off the event loop
+        return await asyncio.to_thread(self.batch_embed_offline_array, texts, gcs_prefix)
+
+    async def abatch_embed_offline(
+        self,
+        texts: List[str],
+        gcs_prefix: Optional[str] = None,
+    ) -> List[List[float]]:
+        """
+        Generate embeddings through a Vertex AI batch prediction job asynchronously.
+
+        Args:
+            texts: List of document texts
+            gcs_prefix: GCS prefix for job input/output (defaults to settings)
+
+        Returns:
+            List of embedding vectors, in input order
+
+        Raises:
+            LLMError: If the batch job fails
+
+        Example:
+            >>> embeddings = await service.abatch_embed_offline(corpus_chunks)
+        """
+        return (await self.abatch_embed_offline_array(texts, gcs_prefix)).tolist()
+
+    def _upload_batch_input(self, texts: List[str], uri: str) -> str:
+        """
+        Upload batch prediction input as JSONL to GCS.
+
+        Args:
+            texts: Texts to embed
+            uri: Destination gs:// URI
+
+        Returns:
+            The uploaded object URI
+        """
+        bucket_name, _, blob_name = uri[len("gs://") :].partition("/")
+        if orjson is not None:
+            payload = b"\n".join(orjson.dumps({"content": text}) for text in texts)
+        else:
+            payload = "\n".join(json.dumps({"content": text}) for text in texts).encode()
+
+        client = storage.Client(project=settings.gcp_project_id)
+        client.bucket(bucket_name).blob(blob_name).upload_from_string(
+            payload, content_type="application/jsonl"
+        )
+        return uri
 
     def get_embedding_dimension(self) -> int:
         """
         Get the dimension of the embeddings.
 
+        The dimension is looked up from embeddings already computed for the
+        model in this process and then from a table of well-known models;
+        only unknown models are probed with a test embedding, once.
+
         Returns:
             Embedding dimension
 
@@ -198,18 +957,62 @@ class VertexEmbeddingService:
             >>> dimension = service.get_embedding_dimension()
             >>> print(dimension)  # e.g., 768 for text-embedding-004
         """
+        dimension = self._known_dimension()
+        if dimension is not None:
+            return dimension
+
         try:
-            # Generate a test embedding to get dimension
-            test_embedding = self.embed_query("test")
-            return len(test_embedding)
+            # Unknown model: embed a probe text once per process
+            dimension = self.embed_query_array("test").shape[0]
         except Exception as e:
             logger.warning("vertex_embedding_dimension_check_failed", error=str(e))
             # Return configured dimension as fallback
             return settings.vertex_embedding_dimension
 
+        _embedding_dimensions[self.model_name] = dimension
+        return dimension
+
+    async def aget_embedding_dimension(self) -> int:
+        """
+        Get the dimension of the embeddings asynchronously.
+
+        Same lookup as get_embedding_dimension, but an unknown model is probed
+        with the async API so the event loop is never blocked.
+
+        Returns:
+            Embedding dimension
+
+        Example:
+            >>> dimension = await service.aget_embedding_dimension()
+        """
+        dimension = self._known_dimension()
+        if dimension is not None:
+            return dimension
+
+        try:
+            # Unknown model: embed a probe text once per process
+            dimension = (await self.aembed_query_array("test")).shape[0]
+        except Exception as e:
+            logger.warning("vertex_embedding_dimension_check_failed", error=str(e))
+            # Return configured dimension as fallback
+            return settings.vertex_embedding_dimension
+
+        _embedding_dimensions[self.model_name] = dimension
+        return dimension
+
+    def _known_dimension(self) -> Optional[int]:
+        """
+        Get the model's dimension without calling the model.
+
+        Returns:
+            Dimension seen in this process or listed for the model, or None
+        """
+        return _embedding_dimensions.get(self.model_name) or _KNOWN_DIMENSIONS.get(self.model_name)
+
 
 # Singleton instance
 _embedding_service: Optional[VertexEmbeddingService] = None
+_embedding_service_lock = threading.Lock()
 
 
 def get_vertex_embedding_service(
@@ -220,6 +1023,7 @@ def get_vertex_embedding_service(
     Get or create a Vertex AI embedding service instance.
 
     By default, returns a singleton instance. Set force_new=True to create a new instance.
+    New instances are warmed up with VERTEX_EMBEDDING_WARMUP_QUERIES.
 
     Args:
         model_name: Optional model name override
@@ -234,7 +1038,15 @@ def get_vertex_embedding_service(
     """
     global _embedding_service
 
-    if force_new or _embedding_service is None:
-        _embedding_service = VertexEmbeddingService(model_name=model_name)
+    service = None if force_new else _embedding_service
+    if service is not None:
+        return service
 
-    return _embedding_service
+    with _embedding_service_lock:
+        if force_new or _embedding_service is None:
+            service = VertexEmbeddingService(model_name=model_name)
+            if settings.vertex_embedding_warmup_queries:
+                service.warmup(settings.vertex_embedding_warmup_queries)
+            # Published only once warm, so other threads never see a cold instance
+            _embedding_service = service
+        return _embedding_service
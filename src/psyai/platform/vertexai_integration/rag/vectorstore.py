@@ -2,30 +2,192 @@
 Vector store abstraction for RAG using Vertex AI Vector Search.
 
 This module provides a unified interface for Vertex AI Vector Search.
+
+The Vertex AI SDK is imported when a manager is first created, so importing
+this module (e.g. for Document) does not load gRPC and the auth stack.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import functools
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from google.cloud import aiplatform
-from google.cloud.aiplatform import MatchingEngineIndex, MatchingEngineIndexEndpoint
+import numpy as np
 
 from psyai.core.config import settings
 from psyai.core.exceptions import VectorStoreError
 from psyai.core.logging import get_logger
-from psyai.platform.vertexai_integration.rag.embeddings import get_vertex_embedding_service
+from psyai.core.utils.similarity import l2_normalize_inplace, top_k_indices
+from psyai.platform.vertexai_integration.rag.local_index import LocalVectorIndex
+
+if TYPE_CHECKING:
+    from google.cloud.aiplatform import MatchingEngineIndex, MatchingEngineIndexEndpoint
+    from google.cloud.aiplatform_v1.types import IndexDatapoint
 
 logger = get_logger(__name__)
 
+# Vector Search handles shared by every manager in the process
+_resources: Dict[Tuple[Any, ...], Any] = {}
+_resources_lock = threading.Lock()
+
+# Worker pool for blocking Vector Search calls made from async methods
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _shared_resource(cls: type, **kwargs: str) -> Any:
+    """
+    Return the process-wide Vector Search handle for a resource, creating it once.
+
+    Constructing a handle fetches the resource and, for public endpoints,
+    opens a match client, so sharing handles lets every manager reuse one
+    gRPC channel instead of paying a handshake per manager.
+
+    Args:
+        cls: MatchingEngineIndex or MatchingEngineIndexEndpoint
+        **kwargs: Constructor arguments naming the resource
+
+    Returns:
+        Shared resource handle
+    """
+    key = (cls, settings.gcp_project_id, settings.gcp_location, *kwargs.items())
+    resource = _resources.get(key)
+    if resource is None:
+        with _resources_lock:
+            resource = _resources.get(key)
+            if resource is None:
+                resource = cls(**kwargs)
+                _resources[key] = resource
+    return resource
+
+
+def _tokens(value: Any) -> List[str]:
+    """
+    Convert a metadata value to restrict tokens.
+
+    Args:
+        value: Metadata value (lists, tuples and sets give one token per item)
+
+    Returns:
+        Tokens (none for None)
+    """
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+def _restricts(metadata: Optional[Dict[str, Any]]) -> List["IndexDatapoint.Restriction"]:
+    """
+    Convert document metadata to Vector Search restricts.
+
+    Each key becomes a namespace; list values allow each of their items.
+
+    Args:
+        metadata: Document metadata
+
+    Returns:
+        Restricts for the datapoint
+    """
+    if not metadata:
+        return []
+
+    from google.cloud.aiplatform_v1.types import IndexDatapoint
+
+    return [
+        IndexDatapoint.Restriction(namespace=key, allow_list=_tokens(value))
+        for key, value in metadata.items()
+        if value is not None
+    ]
+
+
+def _metadata_filter(filter: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a local index predicate with the same semantics as Vector Search restricts.
+
+    A document matches when, for every filter key, its metadata holds at least
+    one of the allowed values.
+
+    Args:
+        filter: Metadata filter (key to value or list of allowed values)
+
+    Returns:
+        Predicate over document metadata
+    """
+    allowed = [(key, set(_tokens(value))) for key, value in filter.items()]
+
+    def matches(metadata: Dict[str, Any]) -> bool:
+        return all(not tokens.isdisjoint(_tokens(metadata.get(key))) for key, tokens in allowed)
+
+    return matches
+
+
+def _namespaces(filter: Dict[str, Any]) -> List[Any]:
+    """
+    Convert a metadata filter to Vector Search query namespaces.
+
+    Args:
+        filter: Metadata filter (key to value or list of allowed values)
+
+    Returns:
+        Namespaces matching the restricts written by add_texts
+    """
+    from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint import (
+        Namespace,
+    )
+
+    return [Namespace(name=key, allow_tokens=_tokens(value)) for key, value in filter.items()]
+
+
+async def _run_in_executor(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking Vector Search call on the shared worker pool.
+
+    The SDK has no async API, so async methods run its calls here rather
+    than on the event loop or the loop's default executor.
+
+    Args:
+        func: Blocking function
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The function's return value
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.vertex_vector_search_workers,
+                    thread_name_prefix="psyai-vector-search",
+                )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
 
 class Document:
     """
     Simple document class compatible with the interface.
 
+    Vector Search results keep just their (id, distance) pair and build the
+    metadata dict on first access, so callers that only read the content or
+    the score never allocate it.
+
     Attributes:
         page_content: The text content
         metadata: Additional metadata
     """
 
+    __slots__ = ("page_content", "_metadata", "_neighbor")
+
     def __init__(self, page_content: str, metadata: Optional[Dict[str, Any]] = None):
         """
         Initialize document.
@@ -35,7 +197,58 @@ class Document:
             metadata: Optional metadata dict
         """
         self.page_content = page_content
-        self.metadata = metadata or {}
+        self._metadata: Optional[Dict[str, Any]] = metadata or {}
+        self._neighbor: Optional[Tuple[str, float]] = None
+
+    @classmethod
+    def _from_neighbor(cls, page_content: str, doc_id: str, distance: float) -> "Document":
+        """
+        Create a search result whose metadata is built on first access.
+
+        Args:
+            page_content: Text content
+            doc_id: Datapoint ID
+            distance: Neighbor distance
+
+        Returns:
+            Document whose metadata will be {"id": doc_id, "distance": distance}
+        """
+        document = cls.__new__(cls)
+        document.page_content = page_content
+        document._metadata = None
+        document._neighbor = (doc_id, distance)
+        return document
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Additional metadata."""
+        if self._metadata is None:
+            doc_id, distance = self._neighbor
+            self._metadata = {"id": doc_id, "distance": distance}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]) -> None:
+        self._metadata = metadata
+
+
+_document_fields = attrgetter("page_content", "metadata")
+
+
+def _split_documents(documents: List[Document]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Split documents into texts and metadatas in a single pass.
+
+    Args:
+        documents: Documents to split
+
+    Returns:
+        Tuple of (texts, metadatas)
+    """
+    if not documents:
+        return [], []
+    texts, metadatas = zip(*map(_document_fields, documents))
+    return list(texts), list(metadatas)
 
 
 class VertexVectorStoreManager:
@@ -44,6 +257,11 @@ class VertexVectorStoreManager:
 
     Provides a unified interface similar to LangChain vector stores.
 
+    Vectors are L2-normalized once on the client (by the embedding service,
+    or here if it does not normalize), so the index should be created with
+    ``distance_measure_type=DOT_PRODUCT_DISTANCE``: the dot product then
+    equals cosine similarity without the index normalizing every vector.
+
     Example:
         >>> manager = VertexVectorStoreManager()
         >>> await manager.add_documents([
@@ -58,6 +276,10 @@ class VertexVectorStoreManager:
         index_endpoint_id: Optional[str] = None,
         deployed_index_id: Optional[str] = None,
         embedding_service: Optional[Any] = None,
+        local_index: bool = False,
+        quantize: Optional[bool] = None,
+        chunk_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """
         Initialize Vertex Vector Search manager.
@@ -67,6 +289,15 @@ class VertexVectorStoreManager:
             index_endpoint_id: Index endpoint ID
             deployed_index_id: Deployed index ID
             embedding_service: Optional embedding service (creates default if None)
+            local_index: Keep added documents in an in-process index and answer
+                searches from it while it holds at most VERTEX_LOCAL_INDEX_MAX_SIZE
+                vectors (avoids a Vector Search round trip for small corpora)
+            quantize: Store local index vectors as int8, 4x less memory
+                (defaults to VERTEX_LOCAL_INDEX_QUANTIZE)
+            chunk_size: Max texts per embedding request when adding texts
+                (defaults to VERTEX_EMBEDDING_BATCH_SIZE)
+            max_concurrency: Max concurrent embedding requests when adding texts
+                (defaults to VERTEX_EMBEDDING_CONCURRENCY)
 
         Raises:
             VectorStoreError: If initialization fails
@@ -75,32 +306,48 @@ class VertexVectorStoreManager:
         self.index_endpoint_id = index_endpoint_id or settings.vertex_index_endpoint_id
         self.deployed_index_id = deployed_index_id or settings.vertex_deployed_index_id
 
+        # Imported lazily: the Vertex AI SDK pulls in gRPC, protobuf and auth
+        from google.cloud.aiplatform import MatchingEngineIndex, MatchingEngineIndexEndpoint
+
+        from psyai.platform.vertexai_integration.client import init_vertexai
+
         # Get embedding service
         if embedding_service is None:
+            from psyai.platform.vertexai_integration.rag.embeddings import (
+                get_vertex_embedding_service,
+            )
+
             embedding_service = get_vertex_embedding_service()
 
         self.embedding_service = embedding_service
-
-        # Initialize AI Platform
-        aiplatform.init(
-            project=settings.gcp_project_id,
-            location=settings.gcp_location,
+        # Normalize here only when the service does not already do it
+        self._normalize = getattr(embedding_service, "normalize", False) is not True
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+
+        if quantize is None:
+            quantize = settings.vertex_local_index_quantize
+        self._local_index: Optional[LocalVectorIndex] = (
+            LocalVectorIndex(quantize=quantize) if local_index else None
         )
 
+        # Initialize AI Platform (skipped if already set up for this project and location)
+        init_vertexai(settings.gcp_project_id, settings.gcp_location)
+
         # Initialize index and endpoint (if configured)
-        self._index: Optional[MatchingEngineIndex] = None
-        self._index_endpoint: Optional[MatchingEngineIndexEndpoint] = None
+        self._index: Optional["MatchingEngineIndex"] = None
+        self._index_endpoint: Optional["MatchingEngineIndexEndpoint"] = None
 
         if self.index_id:
             try:
-                self._index = MatchingEngineIndex(index_name=self.index_id)
+                self._index = _shared_resource(MatchingEngineIndex, index_name=self.index_id)
             except Exception as e:
                 logger.warning("vertex_index_init_failed", error=str(e))
 
         if self.index_endpoint_id:
             try:
-                self._index_endpoint = MatchingEngineIndexEndpoint(
-                    index_endpoint_name=self.index_endpoint_id
+                self._index_endpoint = _shared_resource(
+                    MatchingEngineIndexEndpoint, index_endpoint_name=self.index_endpoint_id
                 )
             except Exception as e:
                 logger.warning("vertex_index_endpoint_init_failed", error=str(e))
@@ -109,8 +356,375 @@ class VertexVectorStoreManager:
             "vertex_vectorstore_manager_initialized",
             index_id=self.index_id,
             endpoint_id=self.index_endpoint_id,
+            local_index=local_index,
+            quantize=quantize,
         )
 
+    def _unit(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Return embeddings with unit-length rows.
+
+        Args:
+            embeddings: Embedding matrix or single vector
+
+        Returns:
+            The embeddings themselves if the service normalizes, else a normalized copy
+        """
+        if not self._normalize:
+            return embeddings
+        return l2_normalize_inplace(np.array(embeddings, dtype=np.float32))
+
+    def _add_to_local_index(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        """
+        Add embedded texts to the local index, if enabled and not full.
+
+        Args:
+            ids: Document IDs
+            embeddings: Embedding matrix (one row per text)
+            texts: Document texts
+            metadatas: Optional metadata dicts
+        """
+        if self._local_index is None or not ids:
+            return
+
+        if len(self._local_index) + len(ids) > settings.vertex_local_index_max_size:
+            logger.warning(
+                "vertex_local_index_full",
+                size=len(self._local_index),
+                max_size=settings.vertex_local_index_max_size,
+            )
+            self._local_index = None
+            return
+
+        self._local_index.add(ids, embeddings, texts, metadatas)
+
+    def _upsert_batches(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: Optional[List[Dict[str, Any]]],
+    ) -> Iterator[List["IndexDatapoint"]]:
+        """
+        Build Vector Search datapoints in upsert-sized batches.
+
+        Args:
+            ids: Document IDs
+            embeddings: Embedding matrix (one row per text)
+            metadatas: Optional metadata dicts (become restricts)
+
+        Yields:
+            Lists of at most VERTEX_UPSERT_BATCH_SIZE datapoints
+        """
+        from google.cloud.aiplatform_v1.types import IndexDatapoint
+
+        metadatas = metadatas or [None] * len(ids)
+        datapoints = (
+            IndexDatapoint(
+                datapoint_id=doc_id,
+                feature_vector=embedding.tolist(),
+                restricts=_restricts(metadata),
+            )
+            for doc_id, embedding, metadata in zip(ids, embeddings, metadatas)
+        )
+        while batch := list(islice(datapoints, settings.vertex_upsert_batch_size)):
+            yield batch
+
+    def _upsert(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        """
+        Upsert embedded texts to Vector Search, one request per batch.
+
+        Args:
+            ids: Document IDs
+            embeddings: Embedding matrix (one row per text)
+            metadatas: Optional metadata dicts
+        """
+        if self._index is None:
+            return
+
+        for batch in self._upsert_batches(ids, embeddings, metadatas):
+            self._index.upsert_datapoints(datapoints=batch)
+
+    async def _aupsert(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        """
+        Async: Upsert embedded texts to Vector Search with concurrent batches.
+
+        Args:
+            ids: Document IDs
+            embeddings: Embedding matrix (one row per text)
+            metadatas: Optional metadata dicts
+        """
+        if self._index is None:
+            return
+
+        semaphore = asyncio.Semaphore(settings.vertex_upsert_concurrency)
+
+        async def upsert(batch: List["IndexDatapoint"]) -> None:
+            async with semaphore:
+                await _run_in_executor(self._index.upsert_datapoints, datapoints=batch)
+
+        await asyncio.gather(
+            *(upsert(batch) for batch in self._upsert_batches(ids, embeddings, metadatas))
+        )
+
+    async def _aembed_and_upsert(
+        self,
+        texts: List[str],
+        ids: List[str],
+        metadatas: Optional[List[Dict[str, Any]]],
+    ) -> np.ndarray:
+        """
+        Async: Embed texts and upsert them to Vector Search.
+
+        Workloads larger than one upsert batch are pipelined: a producer
+        embeds one VERTEX_UPSERT_BATCH_SIZE slice at a time onto a bounded
+        queue while VERTEX_UPSERT_CONCURRENCY consumers upload earlier
+        slices, so embedding and upload latency overlap. Texts repeated
+        across slices are embedded once.
+
+        Args:
+            texts: Texts to embed
+            ids: Document IDs
+            metadatas: Optional metadata dicts
+
+        Returns:
+            Embedding matrix (one row per text, in input order)
+        """
+
+        async def embed(chunk: List[str]) -> np.ndarray:
+            embeddings = await self.embedding_service.aembed_documents_array(
+                chunk, batch_size=self.chunk_size, concurrency=self.max_concurrency
+            )
+            return self._unit(embeddings)
+
+        size = settings.vertex_upsert_batch_size
+        if self._index is None or len(texts) <= size:
+            embeddings = await embed(texts)
+            await self._aupsert(ids, embeddings, metadatas)
+            return embeddings
+
+        workers = settings.vertex_upsert_concurrency
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers)
+        parts: List[np.ndarray] = []
+        embedded: Dict[str, np.ndarray] = {}
+
+        async def produce() -> None:
+            for start in range(0, len(texts), size):
+                chunk = texts[start : start + size]
+                new = [text for text in dict.fromkeys(chunk) if text not in embedded]
+                if new:
+                    embedded.update(zip(new, await embed(new)))
+                embeddings = np.stack([embedded[text] for text in chunk])
+                parts.append(embeddings)
+                await queue.put((start, embeddings))
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while (item := await queue.get()) is not None:
+                start, embeddings = item
+                end = start + len(embeddings)
+                await self._aupsert(
+                    ids[start:end], embeddings, metadatas[start:end] if metadatas else None
+                )
+
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(consume()) for _ in range(workers))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failed stage must not leave the other blocked on the queue
+            for task in tasks:
+                task.cancel()
+
+        return np.concatenate(parts)
+
+    @staticmethod
+    def _scored_neighbors(neighbors: List[Any]) -> List[Tuple[Document, float]]:
+        """
+        Convert Vector Search neighbors to scored documents.
+
+        Args:
+            neighbors: Neighbors returned by find_neighbors for one query
+
+        Returns:
+            List of (document, distance) tuples; metadata "distance" holds it too
+        """
+        # Note: Actual implementation would retrieve document content
+        return [
+            (
+                Document._from_neighbor(f"Document {neighbor.id}", neighbor.id, neighbor.distance),
+                neighbor.distance,
+            )
+            for neighbor in neighbors
+        ]
+
+    def _search_local_index(
+        self, query_embedding: np.ndarray, k: int, filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        """
+        Answer a query from the local index.
+
+        Args:
+            query_embedding: Query embedding
+            k: Number of results to return
+            filter: Optional metadata filter, applied before ranking
+
+        Returns:
+            List of (document, cosine similarity) tuples; metadata "distance" holds it too
+        """
+        return [
+            (
+                Document(
+                    page_content=text,
+                    metadata={**metadata, "id": doc_id, "distance": score},
+                ),
+                score,
+            )
+            for doc_id, score, text, metadata in self._local_index.search(
+                query_embedding, k, where=_metadata_filter(filter) if filter else None
+            )
+        ]
+
+    def _find_neighbors(
+        self,
+        query_embeddings: np.ndarray,
+        k: int,
+        filter: Optional[Dict[str, Any]] = None,
+        full_datapoints: bool = False,
+    ) -> List[List[Any]]:
+        """
+        Query the deployed index for one or more embedded queries in one request.
+
+        Args:
+            query_embeddings: Query embedding matrix (one row per query)
+            k: Number of neighbors per query
+            filter: Optional metadata filter, sent as restrict namespaces
+            full_datapoints: Also return each neighbor's feature vector
+
+        Returns:
+            One list of neighbors per query
+
+        Raises:
+            VectorStoreError: If the index endpoint is not initialized
+        """
+        if not self._index_endpoint:
+            raise VectorStoreError("Index endpoint not initialized")
+
+        return self._index_endpoint.find_neighbors(
+            deployed_index_id=self.deployed_index_id,
+            queries=query_embeddings.tolist(),
+            num_neighbors=k,
+            filter=_namespaces(filter) if filter else None,
+            return_full_datapoint=full_datapoints,
+        )
+
+    @staticmethod
+    def _rerank(
+        query_embedding: np.ndarray, neighbors: List[Any], k: int
+    ) -> List[Tuple[Document, float]]:
+        """
+        Score approximate neighbors exactly against the query and keep the best k.
+
+        Scores are one matrix-vector product over the candidates' feature
+        vectors, and the top k are selected with argpartition rather than a
+        full sort.
+
+        Args:
+            query_embedding: Unit-length query embedding
+            neighbors: Neighbors returned with their feature vectors
+            k: Number of results to return
+
+        Returns:
+            List of (document, dot product) tuples, best first; metadata "distance" holds it too
+        """
+        if not neighbors:
+            return []
+
+        vectors = np.asarray([neighbor.feature_vector for neighbor in neighbors], dtype=np.float32)
+        scores = vectors @ query_embedding
+        results = []
+        for i in top_k_indices(scores, k):
+            neighbor, score = neighbors[i], float(scores[i])
+            results.append(
+                (Document._from_neighbor(f"Document {neighbor.id}", neighbor.id, score), score)
+            )
+        return results
+
+    def _scored_search(
+        self,
+        query_embedding: np.ndarray,
+        k: int,
+        filter: Optional[Dict[str, Any]] = None,
+        fetch_k: Optional[int] = None,
+    ) -> List[Tuple[Document, float]]:
+        """
+        Answer one embedded query from the local index or Vector Search.
+
+        Args:
+            query_embedding: Query embedding
+            k: Number of results to return
+            filter: Optional metadata filter
+            fetch_k: Vector Search candidates to rerank exactly (None = no rerank)
+
+        Returns:
+            List of (document, score) tuples
+        """
+        # An empty local index defers to Vector Search
+        if self._local_index:
+            return self._search_local_index(query_embedding, k, filter)
+
+        if fetch_k and fetch_k > k:
+            neighbors = self._find_neighbors(query_embedding[None, :], fetch_k, filter, True)
+            return self._rerank(query_embedding, neighbors[0], k)
+        return self._scored_neighbors(self._find_neighbors(query_embedding[None, :], k, filter)[0])
+
+    async def _ascored_search(
+        self,
+        query_embedding: np.ndarray,
+        k: int,
+        filter: Optional[Dict[str, Any]] = None,
+        fetch_k: Optional[int] = None,
+    ) -> List[Tuple[Document, float]]:
+        """
+        Async: Answer one embedded query from the local index or Vector Search.
+
+        Args:
+            query_embedding: Query embedding
+            k: Number of results to return
+            filter: Optional metadata filter
+            fetch_k: Vector Search candidates to rerank exactly (None = no rerank)
+
+        Returns:
+            List of (document, score) tuples
+        """
+        if self._local_index:
+            return self._search_local_index(query_embedding, k, filter)
+
+        # Vertex AI has no async version, so the request runs on the worker pool
+        if fetch_k and fetch_k > k:
+            neighbors = await _run_in_executor(
+                self._find_neighbors, query_embedding[None, :], fetch_k, filter, True
+            )
+            return self._rerank(query_embedding, neighbors[0], k)
+        results = await _run_in_executor(self._find_neighbors, query_embedding[None, :], k, filter)
+        return self._scored_neighbors(results[0])
+
     def add_texts(
         self,
         texts: List[str],
@@ -138,19 +752,23 @@ class VertexVectorStoreManager:
             ... )
         """
         try:
-            logger.debug("vertex_vectorstore_adding_texts", count=len(texts))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_vectorstore_adding_texts", count=len(texts))
 
             # Generate embeddings
-            embeddings = self.embedding_service.embed_documents(texts)
+            embeddings = self._unit(
+                self.embedding_service.embed_documents_array(
+                    texts, batch_size=self.chunk_size, concurrency=self.max_concurrency
+                )
+            )
 
             # Generate IDs if not provided
             if ids is None:
-                import uuid
-                ids = [str(uuid.uuid4()) for _ in texts]
+                ids = [uuid.uuid4().hex for _ in texts]
+
+            self._upsert(ids, embeddings, metadatas)
+            self._add_to_local_index(ids, embeddings, texts, metadatas)
 
-            # Build datapoints for upload
-            # Note: Actual implementation would use Vertex AI Vector Search API
-            # This is a simplified version
             logger.info("vertex_vectorstore_texts_added", count=len(texts))
 
             return ids
@@ -180,17 +798,17 @@ class VertexVectorStoreManager:
             VectorStoreError: If adding texts fails
         """
         try:
-            logger.debug("vertex_vectorstore_adding_texts_async", count=len(texts))
-
-            # Generate embeddings
-            embeddings = await self.embedding_service.aembed_documents(texts)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_vectorstore_adding_texts_async", count=len(texts))
 
             # Generate IDs if not provided
             if ids is None:
-                import uuid
-                ids = [str(uuid.uuid4()) for _ in texts]
+                ids = [uuid.uuid4().hex for _ in texts]
+
+            # Generate embeddings and upload them
+            embeddings = await self._aembed_and_upsert(texts, ids, metadatas)
+            self._add_to_local_index(ids, embeddings, texts, metadatas)
 
-            # Build datapoints for upload
             logger.info("vertex_vectorstore_texts_added_async", count=len(texts))
 
             return ids
@@ -217,8 +835,7 @@ class VertexVectorStoreManager:
         Raises:
             VectorStoreError: If adding documents fails
         """
-        texts = [doc.page_content for doc in documents]
-        metadatas = [doc.metadata for doc in documents]
+        texts, metadatas = _split_documents(documents)
         return self.add_texts(texts=texts, metadatas=metadatas, ids=ids)
 
     async def aadd_documents(
@@ -239,8 +856,7 @@ class VertexVectorStoreManager:
         Raises:
             VectorStoreError: If adding documents fails
         """
-        texts = [doc.page_content for doc in documents]
-        metadatas = [doc.metadata for doc in documents]
+        texts, metadatas = _split_documents(documents)
         return await self.aadd_texts(texts=texts, metadatas=metadatas, ids=ids)
 
     def similarity_search(
@@ -248,6 +864,7 @@ class VertexVectorStoreManager:
         query: str,
         k: int = 4,
         filter: Optional[Dict[str, Any]] = None,
+        fetch_k: Optional[int] = None,
     ) -> List[Document]:
         """
         Search for similar documents.
@@ -255,7 +872,10 @@ class VertexVectorStoreManager:
         Args:
             query: Query text
             k: Number of results to return
-            filter: Optional metadata filter
+            filter: Optional metadata filter (key to value or list of allowed values,
+                matched against the restricts written from document metadata)
+            fetch_k: Fetch this many Vector Search candidates and rerank them
+                exactly by dot product (useful with restrictive filters)
 
         Returns:
             List of similar documents
@@ -268,128 +888,267 @@ class VertexVectorStoreManager:
             >>> for doc in results:
             ...     print(doc.page_content)
         """
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter, fetch_k)]
+
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        fetch_k: Optional[int] = None,
+    ) -> List[Document]:
+        """
+        Search for similar documents asynchronously.
+
+        Args:
+            query: Query text
+            k: Number of results to return
+            filter: Optional metadata filter (key to value or list of allowed values,
+                matched against the restricts written from document metadata)
+            fetch_k: Fetch this many Vector Search candidates and rerank them
+                exactly by dot product (useful with restrictive filters)
+
+        Returns:
+            List of similar documents
+
+        Raises:
+            VectorStoreError: If search fails
+        """
+        scored = await self.asimilarity_search_with_score(query, k, filter, fetch_k)
+        return [doc for doc, _ in scored]
+
+    def _search_batch(
+        self, query_embeddings: np.ndarray, k: int, filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Answer several embedded queries with one Vector Search request.
+
+        Args:
+            query_embeddings: Query embedding matrix (one row per query)
+            k: Number of results per query
+            filter: Optional metadata filter applied to every query
+
+        Returns:
+            One list of documents per query
+
+        Raises:
+            VectorStoreError: If the index endpoint is not initialized
+        """
+        if self._local_index:
+            results = [self._search_local_index(query, k, filter) for query in query_embeddings]
+        else:
+            results = [
+                self._scored_neighbors(neighbors)
+                for neighbors in self._find_neighbors(query_embeddings, k, filter)
+            ]
+        return [[doc for doc, _ in scored] for scored in results]
+
+    def similarity_search_batch(
+        self,
+        queries: List[str],
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Document]]:
+        """
+        Search for documents similar to each of several queries.
+
+        Queries are embedded in one batch and sent in a single find_neighbors
+        request, so N queries cost one round trip instead of N.
+
+        Args:
+            queries: Query texts
+            k: Number of results per query
+            filter: Optional metadata filter applied to every query
+
+        Returns:
+            One list of similar documents per query, in query order
+
+        Raises:
+            VectorStoreError: If search fails
+
+        Example:
+            >>> results = manager.similarity_search_batch(["What is PsyAI?", "Who uses it?"])
+            >>> len(results)  # 2
+        """
+        if not queries:
+            return []
+
         try:
-            logger.debug("vertex_vectorstore_similarity_search", query_length=len(query), k=k)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_vectorstore_similarity_search_batch", count=len(queries), k=k)
 
-            # Generate query embedding
-            query_embedding = self.embedding_service.embed_query(query)
+            query_embeddings = self._unit(self.embedding_service.embed_documents_array(queries))
+            results = self._search_batch(query_embeddings, k, filter)
 
-            # Query the index
-            if not self._index_endpoint:
-                raise VectorStoreError("Index endpoint not initialized")
+            logger.info("vertex_vectorstore_search_batch_complete", queries=len(queries))
 
-            # Perform search
-            results = self._index_endpoint.find_neighbors(
-                deployed_index_id=self.deployed_index_id,
-                queries=[query_embedding],
-                num_neighbors=k,
-            )
+            return results
+
+        except Exception as e:
+            logger.error("vertex_vectorstore_search_batch_failed", error=str(e))
+            raise VectorStoreError(f"Similarity search failed: {str(e)}")
 
-            # Convert to Document objects
-            documents = []
-            for neighbor in results[0]:
-                # Note: Actual implementation would retrieve document content
-                documents.append(
-                    Document(
-                        page_content=f"Document {neighbor.id}",
-                        metadata={"id": neighbor.id, "distance": neighbor.distance},
-                    )
+    async def asimilarity_search_batch(
+        self,
+        queries: List[str],
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Document]]:
+        """
+        Search for documents similar to each of several queries asynchronously.
+
+        Args:
+            queries: Query texts
+            k: Number of results per query
+            filter: Optional metadata filter applied to every query
+
+        Returns:
+            One list of similar documents per query, in query order
+
+        Raises:
+            VectorStoreError: If search fails
+        """
+        if not queries:
+            return []
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "vertex_vectorstore_similarity_search_batch_async", count=len(queries), k=k
                 )
 
-            logger.info(
-                "vertex_vectorstore_search_complete",
-                results_count=len(documents),
+            query_embeddings = self._unit(
+                await self.embedding_service.aembed_documents_array(queries)
             )
+            results = await _run_in_executor(self._search_batch, query_embeddings, k, filter)
+
+            logger.info("vertex_vectorstore_search_batch_complete_async", queries=len(queries))
 
-            return documents
+            return results
 
         except Exception as e:
-            logger.error("vertex_vectorstore_search_failed", error=str(e))
+            logger.error("vertex_vectorstore_search_batch_async_failed", error=str(e))
             raise VectorStoreError(f"Similarity search failed: {str(e)}")
 
-    async def asimilarity_search(
+    def similarity_search_with_score(
         self,
         query: str,
         k: int = 4,
         filter: Optional[Dict[str, Any]] = None,
-    ) -> List[Document]:
+        fetch_k: Optional[int] = None,
+    ) -> List[Tuple[Document, float]]:
         """
-        Search for similar documents asynchronously.
+        Search for similar documents with similarity scores.
 
         Args:
             query: Query text
             k: Number of results to return
-            filter: Optional metadata filter
+            filter: Optional metadata filter (key to value or list of allowed values,
+                matched against the restricts written from document metadata)
+            fetch_k: Fetch this many Vector Search candidates and rerank them
+                exactly by dot product (useful with restrictive filters)
 
         Returns:
-            List of similar documents
+            List of (document, score) tuples
 
         Raises:
             VectorStoreError: If search fails
         """
         try:
-            logger.debug("vertex_vectorstore_similarity_search_async", query_length=len(query), k=k)
-
-            # Generate query embedding
-            query_embedding = await self.embedding_service.aembed_query(query)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_vectorstore_similarity_search", query_length=len(query), k=k)
 
-            # Query the index
-            if not self._index_endpoint:
-                raise VectorStoreError("Index endpoint not initialized")
-
-            # Perform search (Vertex AI doesn't have async version, so we use sync)
-            results = self._index_endpoint.find_neighbors(
-                deployed_index_id=self.deployed_index_id,
-                queries=[query_embedding],
-                num_neighbors=k,
-            )
-
-            # Convert to Document objects
-            documents = []
-            for neighbor in results[0]:
-                documents.append(
-                    Document(
-                        page_content=f"Document {neighbor.id}",
-                        metadata={"id": neighbor.id, "distance": neighbor.distance},
-                    )
-                )
+            # Generate query embedding (repeat queries hit the service's LRU cache)
+            query_embedding = self._unit(self.embedding_service.embed_query_array(query))
+            results = self._scored_search(query_embedding, k, filter, fetch_k)
 
             logger.info(
-                "vertex_vectorstore_search_complete_async",
-                results_count=len(documents),
+                "vertex_vectorstore_search_complete",
+                results_count=len(results),
+                local_index=bool(self._local_index),
             )
 
-            return documents
+            return results
 
         except Exception as e:
-            logger.error("vertex_vectorstore_search_async_failed", error=str(e))
+            logger.error("vertex_vectorstore_search_failed", error=str(e))
             raise VectorStoreError(f"Similarity search failed: {str(e)}")
 
-    def similarity_search_with_score(
+    async def asimilarity_search_with_score(
         self,
         query: str,
         k: int = 4,
         filter: Optional[Dict[str, Any]] = None,
+        fetch_k: Optional[int] = None,
     ) -> List[Tuple[Document, float]]:
         """
-        Search for similar documents with similarity scores.
+        Search for similar documents with similarity scores asynchronously.
 
         Args:
             query: Query text
             k: Number of results to return
-            filter: Optional metadata filter
+            filter: Optional metadata filter (key to value or list of allowed values,
+                matched against the restricts written from document metadata)
+            fetch_k: Fetch this many Vector Search candidates and rerank them
+                exactly by dot product (useful with restrictive filters)
 
         Returns:
             List of (document, score) tuples
+
+        Raises:
+            VectorStoreError: If search fails
+        """
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "vertex_vectorstore_similarity_search_async", query_length=len(query), k=k
+                )
+
+            # Generate query embedding (repeat queries hit the service's LRU cache)
+            query_embedding = self._unit(await self.embedding_service.aembed_query_array(query))
+            results = await self._ascored_search(query_embedding, k, filter, fetch_k)
+
+            logger.info(
+                "vertex_vectorstore_search_complete_async",
+                results_count=len(results),
+                local_index=bool(self._local_index),
+            )
+
+            return results
+
+        except Exception as e:
+            logger.error("vertex_vectorstore_search_async_failed", error=str(e))
+            raise VectorStoreError(f"Similarity search failed: {str(e)}")
+
+    def _remove_batches(self, ids: List[str]) -> List[List[str]]:
         """
-        docs = self.similarity_search(query, k, filter)
-        # Extract scores from metadata
-        return [(doc, doc.metadata.get("distance", 0.0)) for doc in docs]
+        Split datapoint IDs into remove-sized batches.
+
+        Args:
+            ids: Datapoint IDs
+
+        Returns:
+            Lists of at most VERTEX_REMOVE_BATCH_SIZE IDs
+        """
+        size = settings.vertex_remove_batch_size
+        return [ids[i : i + size] for i in range(0, len(ids), size)]
+
+    def _remove(self, batch: List[str]) -> None:
+        """
+        Remove one batch of datapoints from Vector Search.
+
+        Args:
+            batch: Datapoint IDs
+        """
+        self._index.remove_datapoints(datapoint_ids=batch)
 
     def delete(self, ids: List[str]) -> None:
         """
         Delete documents by IDs.
 
+        IDs are removed from Vector Search in batches of
+        VERTEX_REMOVE_BATCH_SIZE, up to VERTEX_REMOVE_CONCURRENCY at a time.
+
         Args:
             ids: List of document IDs to delete
 
@@ -397,13 +1156,55 @@ class VertexVectorStoreManager:
             VectorStoreError: If deletion fails
         """
         try:
-            logger.debug("vertex_vectorstore_deleting", count=len(ids))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_vectorstore_deleting", count=len(ids))
+
+            if self._local_index is not None:
+                self._local_index.remove(ids)
 
-            # Note: Actual implementation would use Vertex AI Vector Search API
-            # to remove datapoints
+            if self._index is not None and ids:
+                batches = self._remove_batches(ids)
+                if len(batches) == 1:
+                    self._remove(batches[0])
+                else:
+                    workers = min(settings.vertex_remove_concurrency, len(batches))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        list(executor.map(self._remove, batches))
 
             logger.info("vertex_vectorstore_deleted", count=len(ids))
 
         except Exception as e:
             logger.error("vertex_vectorstore_delete_failed", error=str(e))
             raise VectorStoreError(f"Delete failed: {str(e)}")
+
+    async def adelete(self, ids: List[str]) -> None:
+        """
+        Delete documents by IDs asynchronously.
+
+        Args:
+            ids: List of document IDs to delete
+
+        Raises:
+            VectorStoreError: If deletion fails
+        """
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("vertex_vectorstore_deleting_async", count=len(ids))
+
+            if self._local_index is not None:
+                self._local_index.remove(ids)
+
+            if self._index is not None and ids:
+                semaphore = asyncio.Semaphore(settings.vertex_remove_concurrency)
+
+                async def remove(batch: List[str]) -> None:
+                    async with semaphore:
+                        await _run_in_executor(self._remove, batch)
+
+                await asyncio.gather(*(remove(batch) for batch in self._remove_batches(ids)))
+
+            logger.info("vertex_vectorstore_deleted_async", count=len(ids))
+
+        except Exception as e:
+            logger.error("vertex_vectorstore_delete_async_failed", error=str(e))
+            raise VectorStoreError(f"Delete failed: {str(e)}")
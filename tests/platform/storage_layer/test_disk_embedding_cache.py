@@ -0,0 +1,65 @@
+"""Tests for disk embedding cache."""
+
+import numpy as np
+import pytest
+
+from psyai.platform.storage_layer.cache.disk_embedding_cache import DiskEmbeddingCache
+
+
+class TestDiskEmbeddingCache:
+    """Test DiskEmbeddingCache."""
+
+    def test_roundtrip_returns_hits_only(self, tmp_path):
+        """Test that stored vectors come back as float32 and misses are omitted."""
+        cache = DiskEmbeddingCache(str(tmp_path), model_name="m")
+        cache.set_many({"a": [0.5, -1.25], "b": [2.0, 3.0]})
+
+        result = cache.get_many(["a", "c"])
+
+        assert list(result) == ["a"]
+        assert result["a"].dtype == np.float32
+        assert result["a"].tolist() == [0.5, -1.25]
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that a new cache on the same directory sees earlier writes."""
+        DiskEmbeddingCache(str(tmp_path), model_name="m").set_many({"a": [1.0]})
+
+        reopened = DiskEmbeddingCache(str(tmp_path), model_name="m")
+
+        assert reopened.get_many(["a"])["a"].tolist() == [1.0]
+
+    def test_keys_include_model(self, tmp_path):
+        """Test that entries are namespaced by model."""
+        DiskEmbeddingCache(str(tmp_path), model_name="model-a").set_many({"a": [1.0]})
+
+        assert DiskEmbeddingCache(str(tmp_path), model_name="model-b").get_many(["a"]) == {}
+
+    def test_closed_database_is_a_miss(self, tmp_path):
+        """Test that database errors are treated as misses."""
+        cache = DiskEmbeddingCache(str(tmp_path), model_name="m")
+        cache.close()
+
+        assert cache.get_many(["a"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_async_roundtrip(self, tmp_path):
+        """Test the async wrappers."""
+        cache = DiskEmbeddingCache(str(tmp_path), model_name="m")
+        await cache.aset_many({"a": [1.0, 2.0]})
+
+        result = await cache.aget_many(["a"])
+
+        assert result["a"].tolist() == [1.0, 2.0]
+
+    def test_quantized_roundtrip(self, tmp_path):
+        """Test that int8 storage keeps vectors close and uses a separate table."""
+        vector = np.random.default_rng(0).normal(size=64).astype(np.float32)
+        vector /= np.linalg.norm(vector)
+        cache = DiskEmbeddingCache(str(tmp_path), model_name="m", quantize=True)
+        cache.set_many({"a": vector})
+
+        restored = cache.get_many(["a"])["a"]
+
+        assert restored.dtype == np.float32
+        assert float(restored @ vector) / float(np.linalg.norm(restored)) > 0.999
+        assert DiskEmbeddingCache(str(tmp_path), model_name="m").get_many(["a"]) == {}
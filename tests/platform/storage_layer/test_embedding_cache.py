@@ -0,0 +1,80 @@
+"""Tests for Redis embedding cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from psyai.platform.storage_layer.cache.embedding_cache import RedisEmbeddingCache
+
+
+@pytest.fixture
+def redis_client():
+    """Mock RedisClient with sync and async clients."""
+    client = MagicMock()
+    client.async_client = MagicMock()
+    return client
+
+
+class TestRedisEmbeddingCache:
+    """Test RedisEmbeddingCache."""
+
+    def test_encode_decode_roundtrip(self):
+        """Test float32 packing round trip."""
+        raw = RedisEmbeddingCache._encode([0.5, -1.25, 2.0])
+
+        assert len(raw) == 12
+        decoded = RedisEmbeddingCache._decode(raw)
+        assert decoded.dtype == np.float32
+        assert decoded.tolist() == [0.5, -1.25, 2.0]
+
+    def test_key_includes_model(self, redis_client):
+        """Test that keys are namespaced by model."""
+        cache = RedisEmbeddingCache(model_name="model-a", redis_client=redis_client)
+
+        assert cache._key("hello").startswith("emb:model-a:")
+        assert cache._key("hello") != cache._key("bye")
+
+    def test_get_many_returns_hits_only(self, redis_client):
+        """Test that misses are omitted from the result."""
+        cache = RedisEmbeddingCache(model_name="m", redis_client=redis_client)
+        redis_client.sync_client.mget.return_value = [
+            RedisEmbeddingCache._encode([1.0, 2.0]),
+            None,
+        ]
+
+        result = cache.get_many(["hit", "miss"])
+
+        assert list(result) == ["hit"]
+        assert result["hit"].tolist() == [1.0, 2.0]
+        redis_client.sync_client.mget.assert_called_once()
+
+    def test_get_many_swallows_errors(self, redis_client):
+        """Test that Redis failures are treated as misses."""
+        cache = RedisEmbeddingCache(model_name="m", redis_client=redis_client)
+        redis_client.sync_client.mget.side_effect = ConnectionError("down")
+
+        assert cache.get_many(["text"]) == {}
+
+    def test_set_many_uses_pipeline(self, redis_client):
+        """Test that writes are pipelined with the TTL."""
+        cache = RedisEmbeddingCache(model_name="m", redis_client=redis_client, ttl=60)
+        pipe = redis_client.sync_client.pipeline.return_value
+
+        cache.set_many({"a": [1.0], "b": [2.0]})
+
+        assert pipe.set.call_count == 2
+        assert pipe.set.call_args.kwargs["ex"] == 60
+        pipe.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_aget_many(self, redis_client):
+        """Test async lookup."""
+        cache = RedisEmbeddingCache(model_name="m", redis_client=redis_client)
+        redis_client.async_client.mget = AsyncMock(
+            return_value=[RedisEmbeddingCache._encode([3.0])]
+        )
+
+        result = await cache.aget_many(["text"])
+
+        assert result["text"].tolist() == [3.0]
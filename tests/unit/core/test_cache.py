@@ -0,0 +1,80 @@
+"""Tests for cache utilities."""
+
+import time
+
+import pytest
+
+from psyai.core.utils.cache import LRUCache, make_cache_key
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key function."""
+
+    def test_deterministic(self):
+        """Test that identical parts produce identical keys."""
+        assert make_cache_key("model", "text") == make_cache_key("model", "text")
+
+    def test_parts_are_separated(self):
+        """Test that part boundaries affect the key."""
+        assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+
+class TestLRUCache:
+    """Tests for LRUCache class."""
+
+    def test_get_set(self):
+        """Test storing and retrieving a value."""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", default=0) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted."""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = LRUCache(max_size=2, ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_stats(self):
+        """Test hit and miss accounting."""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats()["hits"] == 0
+
+    def test_invalid_max_size(self):
+        """Test that a non-positive max_size is rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(max_size=0)
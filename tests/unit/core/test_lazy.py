@@ -0,0 +1,38 @@
+"""Tests for lazy package exports."""
+
+import sys
+import types
+
+import pytest
+
+from psyai.core.utils.lazy import lazy_exports
+
+
+@pytest.fixture
+def package(monkeypatch):
+    """Throwaway package exporting json.dumps lazily."""
+    module = types.ModuleType("lazy_test_package")
+    module.__getattr__, module.__dir__ = lazy_exports(module.__name__, {"dumps": "json"})
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
+
+
+class TestLazyExports:
+    """Tests for lazy_exports."""
+
+    def test_export_is_imported_and_cached(self, package):
+        """Test that an export resolves on first access and is then a module attribute."""
+        import json
+
+        assert "dumps" not in vars(package)
+        assert package.dumps is json.dumps
+        assert vars(package)["dumps"] is json.dumps
+
+    def test_unknown_name_raises_attribute_error(self, package):
+        """Test that names outside the mapping raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'loads'"):
+            package.loads
+
+    def test_dir_lists_unresolved_exports(self, package):
+        """Test that dir() includes exports before they are imported."""
+        assert "dumps" in dir(package)
@@ -0,0 +1,80 @@
+"""Tests for retry utilities."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from psyai.core.exceptions import LLMRateLimitError
+from psyai.core.utils.retry import exponential_backoff, retry_async, retry_sync
+
+
+class TestExponentialBackoff:
+    """Tests for exponential_backoff function."""
+
+    def test_without_jitter(self):
+        """Test that delays double and are capped."""
+        assert exponential_backoff(0, jitter=False) == 1.0
+        assert exponential_backoff(2, jitter=False) == 4.0
+        assert exponential_backoff(10, max_delay=5.0, jitter=False) == 5.0
+
+
+class TestRetrySync:
+    """Tests for retry_sync decorator."""
+
+    @patch("psyai.core.utils.retry.time.sleep")
+    def test_honors_retry_after(self, mock_sleep):
+        """Test that the error's retry_after raises the backoff delay."""
+        calls = []
+
+        @retry_sync(max_attempts=2, exceptions=LLMRateLimitError, jitter=False)
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise LLMRateLimitError("429", retry_after=7.5)
+            return "ok"
+
+        assert flaky() == "ok"
+        mock_sleep.assert_called_once_with(7.5)
+
+    @patch("psyai.core.utils.retry.time.sleep")
+    def test_retry_after_can_be_ignored(self, mock_sleep):
+        """Test that respect_retry_after=False uses plain backoff."""
+
+        @retry_sync(
+            max_attempts=2,
+            exceptions=LLMRateLimitError,
+            jitter=False,
+            respect_retry_after=False,
+        )
+        def always_fails():
+            raise LLMRateLimitError("429", retry_after=30.0)
+
+        with pytest.raises(LLMRateLimitError):
+            always_fails()
+        mock_sleep.assert_called_once_with(1.0)
+
+
+class TestRetryAsync:
+    """Tests for retry_async decorator."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_capped(self):
+        """Test that retry_after never exceeds max_delay."""
+        calls = []
+
+        @retry_async(
+            max_attempts=2,
+            exceptions=LLMRateLimitError,
+            max_delay=10.0,
+            jitter=False,
+        )
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise LLMRateLimitError("429", retry_after=120.0)
+            return "ok"
+
+        with patch("psyai.core.utils.retry.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            assert await flaky() == "ok"
+
+        mock_sleep.assert_awaited_once_with(10.0)
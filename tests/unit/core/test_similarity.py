@@ -0,0 +1,113 @@
+"""Tests for vector similarity utilities."""
+
+import numpy as np
+import pytest
+
+from psyai.core.utils.similarity import (
+    cosine_similarities,
+    cosine_similarity,
+    dequantize_int8,
+    l2_normalize_inplace,
+    quantize_int8,
+    top_k_indices,
+)
+
+
+class TestCosineSimilarity:
+    """Tests for cosine_similarity function."""
+
+    def test_matches_definition(self):
+        """Test that the result matches dot / (|a| * |b|)."""
+        a = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+        b = np.array([-2.0, 0.5, 4.0], dtype=np.float32)
+
+        expected = np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+
+        assert cosine_similarity(a, b) == pytest.approx(expected, rel=1e-6)
+
+    def test_zero_vector(self):
+        """Test that a zero vector has similarity 0."""
+        assert cosine_similarity(np.zeros(3), np.ones(3)) == 0.0
+
+
+class TestCosineSimilarities:
+    """Tests for cosine_similarities function."""
+
+    def test_matches_pairwise(self):
+        """Test that batch scores equal the pairwise scores."""
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=8)
+        matrix = rng.normal(size=(5, 8))
+        matrix[2] = 0.0
+
+        scores = cosine_similarities(query, matrix)
+
+        assert scores.shape == (5,)
+        assert scores == pytest.approx([cosine_similarity(query, row) for row in matrix])
+
+    def test_precomputed_row_norms(self):
+        """Test that precomputed squared row norms give the same scores."""
+        rng = np.random.default_rng(1)
+        query = rng.normal(size=8)
+        matrix = rng.normal(size=(5, 8))
+
+        row_norms_sq = (matrix**2).sum(axis=1)
+
+        assert cosine_similarities(query, matrix, row_norms_sq) == pytest.approx(
+            cosine_similarities(query, matrix)
+        )
+
+
+class TestQuantizeInt8:
+    """Tests for quantize_int8 function."""
+
+    def test_round_trip_preserves_cosine(self):
+        """Test that dequantized rows stay close to the originals."""
+        rng = np.random.default_rng(0)
+        matrix = rng.normal(size=(4, 64)).astype(np.float32)
+
+        quantized, scales = quantize_int8(matrix)
+        restored = quantized * scales[:, None]
+
+        assert quantized.dtype == np.int8
+        assert np.abs(quantized).max() == 127
+        for original, approx in zip(matrix, restored):
+            assert cosine_similarity(original, approx) > 0.999
+
+
+class TestTopKIndices:
+    """Tests for top_k_indices function."""
+
+    def test_matches_full_sort(self):
+        """Test that the selection equals the head of a full descending sort."""
+        scores = np.random.default_rng(0).normal(size=100)
+
+        assert top_k_indices(scores, 5).tolist() == np.argsort(-scores)[:5].tolist()
+        assert top_k_indices(scores, 500).tolist() == np.argsort(-scores).tolist()
+        assert top_k_indices(scores, 0).tolist() == []
+
+
+class TestL2NormalizeInplace:
+    """Tests for l2_normalize_inplace function."""
+
+    def test_normalizes_rows_in_place(self):
+        """Test that rows become unit length and zero rows stay zero."""
+        matrix = np.array([[3.0, 4.0], [0.0, 0.0], [0.0, -2.0]], dtype=np.float32)
+
+        result = l2_normalize_inplace(matrix)
+
+        assert result is matrix
+        assert matrix.ravel().tolist() == pytest.approx([0.6, 0.8, 0.0, 0.0, 0.0, -1.0])
+
+
+class TestDequantizeInt8:
+    """Tests for dequantize_int8 function."""
+
+    def test_inverts_quantize(self):
+        """Test that dequantizing restores rows up to rounding error."""
+        matrix = np.random.default_rng(0).normal(size=(3, 16)).astype(np.float32)
+
+        restored = dequantize_int8(*quantize_int8(matrix))
+
+        assert restored.dtype == np.float32
+        assert np.abs(restored - matrix).max() <= np.abs(matrix).max() / 127
@@ -34,6 +34,18 @@ class TestLangChainClient:
 
         assert client1 is client2
 
+    @patch("psyai.platform.langchain_integration.client.ChatOpenAI")
+    def test_get_langchain_client_per_configuration(self, mock_chat_openai):
+        """Test that each configuration gets its own shared client."""
+        from psyai.platform.langchain_integration import get_langchain_client
+
+        gpt4 = get_langchain_client(model_name="gpt-4", temperature=0.5, max_tokens=100)
+        gpt4o = get_langchain_client(model_name="gpt-4o", temperature=0.5, max_tokens=100)
+
+        assert gpt4.model_name == "gpt-4"
+        assert gpt4o.model_name == "gpt-4o"
+        assert get_langchain_client(model_name="gpt-4", temperature=0.5, max_tokens=100) is gpt4
+
     @patch("psyai.platform.langchain_integration.client.ChatOpenAI")
     def test_generate_success(self, mock_chat_openai):
         """Test successful text generation."""
@@ -71,6 +83,128 @@ class TestLangChainClient:
         assert response == "This is a test response"
         mock_llm.ainvoke.assert_called_once()
 
+    @patch("psyai.platform.langchain_integration.client.ChatOpenAI")
+    def test_generate_maps_typed_rate_limit_error(self, mock_chat_openai):
+        """Test that SDK rate-limit errors map by type and keep Retry-After."""
+        import httpx
+        from openai import RateLimitError
+
+        from psyai.core.exceptions import LLMRateLimitError
+        from psyai.platform.langchain_integration import LangChainClient
+
+        response = httpx.Response(
+            429,
+            headers={"retry-after": "3"},
+            request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"),
+        )
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = RateLimitError(
+            "Too many requests", response=response, body=None
+        )
+        mock_chat_openai.return_value = mock_llm
+
+        client = LangChainClient(model_name="gpt-4", temperature=0.5, max_tokens=100)
+
+        with patch("psyai.core.utils.retry.time.sleep"):
+            with pytest.raises(LLMRateLimitError) as exc_info:
+                client.generate("Test prompt")
+
+        assert exc_info.value.retry_after == 3.0
+
+    @patch("psyai.platform.langchain_integration.client.ChatOpenAI")
+    def test_generate_uses_response_cache(self, mock_chat_openai):
+        """Test that repeated prompts are served from the response cache."""
+        from psyai.platform.langchain_integration import LangChainClient
+
+        mock_response = Mock()
+        mock_response.content = "cached answer"
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = mock_response
+        mock_chat_openai.return_value = mock_llm
+
+        client = LangChainClient(
+            model_name="gpt-4", temperature=0.5, max_tokens=100, cache_responses=True
+        )
+        first = client.generate("Same prompt")
+        second = client.generate("Same prompt")
+        client.generate("Same prompt", stop=["\n"])
+
+        assert first == second == "cached answer"
+        assert mock_llm.invoke.call_count == 2
+
+    @patch("psyai.platform.langchain_integration.client.ChatOpenAI")
+    @pytest.mark.asyncio
+    async def test_abatch_generate_only_sends_uncached(self, mock_chat_openai):
+        """Test that batch generation skips cached prompts and keeps order."""
+        from psyai.platform.langchain_integration import LangChainClient
+
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=Mock(content="answer a"))
+        mock_llm.abatch = AsyncMock(return_value=[Mock(content="answer b")])
+        mock_chat_openai.return_value = mock_llm
+
+        client = LangChainClient(
+            model_name="gpt-4", temperature=0.5, max_tokens=100, cache_responses=True
+        )
+        await client.agenerate("a")
+        results = await client.abatch_generate(["a", "b"])
+
+        assert results == ["answer a", "answer b"]
+        sent = mock_llm.abatch.call_args.args[0]
+        assert [[message.content for message in messages] for messages in sent] == [["b"]]
+
+    @patch("psyai.platform.langchain_integration.client.ChatOpenAI")
+    @pytest.mark.asyncio
+    async def test_abatch_generate_deduplicates_prompts(self, mock_chat_openai):
+        """Test that repeated prompts are sent once and scattered back in order."""
+        from psyai.platform.langchain_integration import LangChainClient
+
+        mock_llm = Mock()
+        mock_llm.abatch = AsyncMock(return_value=[Mock(content="A"), Mock(content="B")])
+        mock_chat_openai.return_value = mock_llm
+
+        client = LangChainClient(model_name="gpt-4", temperature=0.5, max_tokens=100)
+        results = await client.abatch_generate(["a", "b", "a", "a"])
+
+        assert results == ["A", "B", "A", "A"]
+        sent = mock_llm.abatch.call_args.args[0]
+        assert [messages[0].content for messages in sent] == ["a", "b"]
+
+    @patch("psyai.platform.langchain_integration.client.ChatOpenAI")
+    @pytest.mark.asyncio
+    async def test_astream_yields_chunks(self, mock_chat_openai):
+        """Test that astream yields response chunks as they arrive."""
+        from psyai.platform.langchain_integration import LangChainClient
+
+        async def fake_stream(messages, stop=None, **kwargs):
+            for text in ["Hel", "lo", ""]:
+                yield Mock(content=text)
+
+        mock_llm = Mock()
+        mock_llm.astream = fake_stream
+        mock_chat_openai.return_value = mock_llm
+
+        client = LangChainClient(model_name="gpt-4", temperature=0.5, max_tokens=100)
+        chunks = [chunk async for chunk in client.astream("Say hello")]
+
+        assert chunks == ["Hel", "lo"]
+
+    @patch("psyai.platform.langchain_integration.client._get_encoding")
+    @patch("psyai.platform.langchain_integration.client.ChatOpenAI")
+    def test_get_num_tokens_is_cached(self, mock_chat_openai, mock_get_encoding):
+        """Test that token counts use the shared encoding and are memoized."""
+        from psyai.platform.langchain_integration import LangChainClient
+
+        encoding = Mock()
+        encoding.encode.return_value = [1, 2, 3]
+        mock_get_encoding.return_value = encoding
+
+        client = LangChainClient(model_name="gpt-4", temperature=0.5, max_tokens=100)
+
+        assert client.get_num_tokens("system prompt") == 3
+        assert client.get_num_tokens("system prompt") == 3
+        encoding.encode.assert_called_once_with("system prompt")
+
 
 class TestChains:
     """Tests for chain builders."""
@@ -106,6 +240,70 @@ class TestChains:
         assert chain is not None
         mock_get_client.assert_called_once()
 
+    @patch("psyai.platform.langchain_integration.chains.base.get_langchain_client")
+    def test_chains_are_cached_per_client(self, mock_get_client):
+        """Test that identical chain arguments reuse the built chain."""
+        from psyai.platform.langchain_integration import create_simple_chain
+
+        mock_get_client.return_value = Mock(llm=Mock())
+        first = create_simple_chain("Define {term}")
+        second = create_simple_chain("Define {term}")
+
+        mock_get_client.return_value = Mock(llm=Mock())
+        rebuilt = create_simple_chain("Define {term}")
+
+        assert first is second
+        assert rebuilt is not first
+
+    @patch("psyai.platform.langchain_integration.chains.base.get_langchain_client")
+    def test_chat_prompt_shared_across_models(self, mock_get_client):
+        """Test that chains for different models reuse the same compiled prompt."""
+        from psyai.platform.langchain_integration import create_chat_chain
+
+        mock_get_client.return_value = Mock(llm=Mock())
+        gpt4 = create_chat_chain("Be concise.", "Explain {topic}", model_name="gpt-4")
+
+        mock_get_client.return_value = Mock(llm=Mock())
+        gpt4o = create_chat_chain("Be concise.", "Explain {topic}", model_name="gpt-4o")
+
+        assert gpt4 is not gpt4o
+        assert gpt4.first is gpt4o.first
+        assert gpt4.last is gpt4o.last
+
+    @pytest.mark.asyncio
+    async def test_run_map_reduce(self):
+        """Test that map outputs are batched and joined for the reduce step."""
+        from psyai.platform.langchain_integration import run_map_reduce
+
+        map_chain = Mock()
+        map_chain.abatch = AsyncMock(return_value=["one", "two"])
+        reduce_chain = Mock()
+        reduce_chain.ainvoke = AsyncMock(return_value="combined")
+
+        result = await run_map_reduce(
+            {"map": map_chain, "reduce": reduce_chain},
+            [{"text": "a"}, {"text": "b"}],
+            max_concurrency=2,
+        )
+
+        assert result == "combined"
+        assert map_chain.abatch.call_args.kwargs["config"] == {"max_concurrency": 2}
+        reduce_chain.ainvoke.assert_called_once_with({"summaries": "one\n\ntwo"})
+
+    @pytest.mark.asyncio
+    async def test_create_parallel_chain_with_combine(self):
+        """Test that list branches are combined in order."""
+        from langchain_core.runnables import RunnableLambda
+
+        from psyai.platform.langchain_integration import create_parallel_chain
+
+        chain = create_parallel_chain(
+            [RunnableLambda(lambda d: f"a{d['x']}"), RunnableLambda(lambda d: "b")],
+            combine="|".join,
+        )
+
+        assert await chain.ainvoke({"x": "1"}) == "a1|b"
+
     @patch("psyai.platform.langchain_integration.chains.base.get_langchain_client")
     def test_base_chain_builder(self, mock_get_client):
         """Test BaseChainBuilder fluent interface."""
@@ -153,7 +351,7 @@ class TestConversationalChains:
         )
 
         assert chain is not None
-        assert hasattr(chain, "memory")
+        assert type(chain).__name__ == "RunnableWithMessageHistory"
 
     def test_create_conversational_chain_invalid_memory_type(self):
         """Test that invalid memory type raises error."""
@@ -171,6 +369,21 @@ class TestConversationalChains:
         assert memory is not None
         assert len(memory.messages) == 0
 
+    def test_session_histories_are_bounded(self):
+        """Test that the least recently used session history is dropped."""
+        from psyai.core.utils import LRUCache
+        from psyai.platform.langchain_integration.chains import conversational
+
+        with patch.object(conversational, "_session_histories", LRUCache(max_size=2)):
+            first = conversational._get_session_history("a")
+            first.add_user_message("Hello!")
+            assert conversational._get_session_history("a") is first
+
+            conversational._get_session_history("b")
+            conversational._get_session_history("c")
+
+            assert conversational._get_session_history("a").messages == []
+
     @patch("psyai.platform.langchain_integration.chains.conversational.get_langchain_client")
     def test_conversation_manager(self, mock_get_client):
         """Test ConversationManager."""
@@ -201,10 +414,148 @@ class TestConversationalChains:
         history = manager.get_history()
         assert isinstance(history, list)
 
+    @patch("psyai.platform.langchain_integration.chains.conversational.get_langchain_client")
+    def test_add_context_pins_after_system_message(self, mock_get_client):
+        """Test that added context stays in the prompt prefix, not the history."""
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+
+        from psyai.platform.langchain_integration import ConversationManager
+
+        mock_get_client.return_value = Mock(llm=GenericFakeChatModel(messages=iter([])))
+
+        manager = ConversationManager(session_id="test-123", system_message="Be {brief}")
+        manager.add_context("The user prefers technical explanations")
+
+        messages = manager.prompt.format_messages(history=[], input="Hi")
+
+        assert [m.content for m in messages[:2]] == [
+            "Be {brief}",
+            "The user prefers technical explanations",
+        ]
+        assert manager.get_history() == []
+
+    @patch("psyai.platform.langchain_integration.chains.conversational.get_langchain_client")
+    @pytest.mark.asyncio
+    async def test_summary_threshold_compacts_history(self, mock_get_client):
+        """Test that long histories are compacted into a summary message."""
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage, SystemMessage
+
+        from psyai.platform.langchain_integration import ConversationManager
+
+        replies = iter([AIMessage(content=f"reply {i}") for i in range(5)])
+        mock_get_client.return_value = Mock(llm=GenericFakeChatModel(messages=replies))
+
+        manager = ConversationManager(session_id="test-summary", summary_threshold=3)
+        await manager.send_message("first")
+        assert len(manager.get_history()) == 2
+
+        await manager.send_message("second")
+        history = manager.get_history()
+        assert len(history) == 1
+        assert isinstance(history[0], SystemMessage)
+        assert history[0].content == "reply 2"
+
+    @patch("psyai.platform.langchain_integration.chains.conversational.get_langchain_client")
+    @pytest.mark.asyncio
+    async def test_summary_memory_folds_in_only_dropped_turns(self, mock_get_client):
+        """Test that summary memory stores its summary and summarizes incrementally."""
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage, SystemMessage
+        from langchain_core.runnables import RunnableLambda
+
+        from psyai.platform.langchain_integration import create_conversational_chain
+
+        # Each turn past the window summarizes once before replying
+        texts = ["reply 1", "reply 2"]
+        for i in range(1, 4):
+            texts += [f"summary {i}", f"reply {i + 2}"]
+        fake = GenericFakeChatModel(messages=iter([AIMessage(content=t) for t in texts]))
+        prompts = []
+        llm = RunnableLambda(lambda prompt: prompts.append(prompt.to_string()) or prompt) | fake
+        mock_get_client.return_value = Mock(llm=llm)
+
+        chain = create_conversational_chain(memory_type="summary", max_messages=1)
+        config = {"configurable": {"session_id": "test-summary-memory"}}
+        for i in range(1, 6):
+            await chain.ainvoke({"input": f"message {i}"}, config=config)
+
+        summaries = [p for p in prompts if p.startswith("Progressively summarize")]
+        assert len(summaries) == 3
+        assert "message 1" not in summaries[1]
+        assert "Current summary:\nsummary 1" in summaries[1]
+        assert len({len(p) for p in summaries[1:]}) == 1
+
+        history = chain.get_session_history("test-summary-memory").messages
+        assert isinstance(history[0], SystemMessage)
+        assert [m.content for m in history] == [
+            "summary 3",
+            "message 4",
+            "reply 4",
+            "message 5",
+            "reply 5",
+        ]
+
+    @patch("psyai.platform.langchain_integration.chains.conversational.get_langchain_client")
+    @pytest.mark.asyncio
+    async def test_stream_message_saves_turn(self, mock_get_client):
+        """Test that a streamed reply is yielded in chunks and saved to history."""
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage
+
+        from psyai.platform.langchain_integration import ConversationManager
+
+        replies = iter([AIMessage(content="Hello there")])
+        mock_get_client.return_value = Mock(llm=GenericFakeChatModel(messages=replies))
+
+        manager = ConversationManager(session_id="test-stream")
+        chunks = [chunk async for chunk in manager.stream_message("Hi")]
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == "Hello there"
+        assert [m.content for m in manager.get_history()] == ["Hi", "Hello there"]
+
+    @patch("psyai.platform.langchain_integration.chains.conversational.get_langchain_client")
+    @pytest.mark.asyncio
+    async def test_send_message_reuses_cached_reply(self, mock_get_client):
+        """Test that resending the last message skips the LLM and the duplicate turn."""
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage
+
+        from psyai.platform.langchain_integration import ConversationManager
+
+        replies = iter([AIMessage(content="Hello!"), AIMessage(content="Hello again!")])
+        mock_get_client.return_value = Mock(llm=GenericFakeChatModel(messages=replies))
+
+        manager = ConversationManager(session_id="test-reply-cache")
+        manager.clear_history()
+
+        assert await manager.send_message("Hi") == "Hello!"
+        assert await manager.send_message("Hi") == "Hello!"
+        assert [m.content for m in manager.get_history()] == ["Hi", "Hello!"]
+
+        manager.clear_reply_cache()
+        assert await manager.send_message("Hi") == "Hello again!"
+        assert len(manager.get_history()) == 4
+        assert manager._reply_cache.stats()["size"] == 1
+
 
 class TestEmbeddingService:
     """Tests for embedding service."""
 
+    def setup_method(self):
+        """Drop shared provider models and use the HuggingFaceEmbeddings path."""
+        from psyai.platform.langchain_integration.rag import embeddings
+
+        embeddings._embeddings_models.clear()
+        embeddings._embedding_dimensions.clear()
+        self._st_patcher = patch.object(embeddings, "_load_sentence_transformer", return_value=None)
+        self._st_patcher.start()
+
+    def teardown_method(self):
+        """Restore the sentence-transformers loader."""
+        self._st_patcher.stop()
+
     @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
     def test_embedding_service_initialization(self, mock_hf_embeddings):
         """Test embedding service initializes correctly."""
@@ -225,6 +576,239 @@ class TestEmbeddingService:
         assert service.provider == "openai"
         mock_openai_embeddings.assert_called_once()
 
+    @patch("psyai.platform.langchain_integration.rag.embeddings.OpenAIEmbeddings")
+    def test_openai_models_share_http_clients(self, mock_openai_embeddings):
+        """Test that OpenAI embeddings reuse one pair of pooled HTTP clients."""
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        EmbeddingService(provider="openai", model_name="text-embedding-3-small")
+        EmbeddingService(provider="openai", model_name="text-embedding-3-large")
+
+        first, second = [call.kwargs for call in mock_openai_embeddings.call_args_list]
+        assert first["http_client"] is second["http_client"]
+        assert first["http_async_client"] is second["http_async_client"]
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    @pytest.mark.asyncio
+    async def test_sync_only_provider_runs_on_worker_pool(self, mock_hf_embeddings):
+        """Test that providers without native async run on the service's threads."""
+        import threading
+
+        from langchain_core.embeddings import Embeddings
+
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        threads = []
+
+        class SyncEmbeddings(Embeddings):
+            def embed_documents(self, texts):
+                threads.append(threading.current_thread().name)
+                return [[1.0] for _ in texts]
+
+            def embed_query(self, text):
+                return [1.0]
+
+        mock_hf_embeddings.return_value = SyncEmbeddings()
+
+        with EmbeddingService(provider="huggingface", max_batch_size=1) as service:
+            await service.aembed_documents(["a", "b"])
+
+        assert service._executor is None
+        assert threads and threads[0].startswith("psyai-embedding")
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    def test_sentence_transformers_fast_path(self, mock_hf_embeddings):
+        """Test that HuggingFace models are encoded by sentence-transformers directly."""
+        import numpy as np
+
+        from psyai.platform.langchain_integration.rag import EmbeddingService, embeddings
+
+        mock_model = Mock()
+        mock_model.encode.return_value = np.array([[3.0, 4.0], [0.0, 2.0]], dtype=np.float32)
+
+        with patch.object(embeddings, "_load_sentence_transformer", return_value=mock_model):
+            service = EmbeddingService(provider="huggingface")
+        matrix = service.embed_documents_array(["a", "b"])
+
+        mock_hf_embeddings.assert_not_called()
+        assert mock_model.encode.call_args.args[0] == ["a", "b"]
+        assert matrix.ravel().tolist() == pytest.approx([0.6, 0.8, 0.0, 1.0])
+
+    def test_sentence_transformer_half_precision_on_cuda(self):
+        """Test that models loaded onto CUDA are cast to float16."""
+        import sys
+
+        from psyai.platform.langchain_integration.rag import embeddings
+
+        self._st_patcher.stop()
+        fake_module = Mock()
+        with patch.dict(sys.modules, {"sentence_transformers": fake_module}):
+            gpu_model = embeddings._load_sentence_transformer("m", "cuda")
+            cpu_model = embeddings._load_sentence_transformer("m", "cpu")
+        self._st_patcher.start()
+
+        fake_module.SentenceTransformer.assert_any_call("m", device="cuda")
+        assert gpu_model is fake_module.SentenceTransformer.return_value.half.return_value
+        assert cpu_model is fake_module.SentenceTransformer.return_value
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    def test_embedding_model_shared_across_services(self, mock_hf_embeddings):
+        """Test that services with the same provider and model share one model."""
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        first = EmbeddingService(provider="huggingface", model_name="m")
+        second = EmbeddingService(provider="huggingface", model_name="m")
+        EmbeddingService(provider="huggingface", model_name="other")
+
+        assert first.embeddings is second.embeddings
+        assert mock_hf_embeddings.call_count == 2
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    @pytest.mark.asyncio
+    async def test_aembed_query_coalesces_concurrent_queries(self, mock_hf_embeddings):
+        """Test that concurrent queries are embedded in a single batched call."""
+        import asyncio
+
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        mock_embeddings_instance = Mock()
+        mock_embeddings_instance.aembed_documents = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] for t in texts]
+        )
+        mock_hf_embeddings.return_value = mock_embeddings_instance
+
+        service = EmbeddingService(provider="huggingface", max_batch_delay_ms=50, normalize=False)
+        results = await asyncio.gather(
+            service.aembed_query("a"),
+            service.aembed_query("bb"),
+            service.aembed_query("ccc"),
+        )
+
+        assert results == [[1.0], [2.0], [3.0]]
+        mock_embeddings_instance.aembed_documents.assert_awaited_once_with(["a", "bb", "ccc"])
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.settings")
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    @pytest.mark.asyncio
+    async def test_aembed_documents_splits_into_batches(self, mock_hf_embeddings, mock_settings):
+        """Test that documents are embedded in sub-batches and kept in order."""
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        mock_settings.embedding_batch_size = 2
+        mock_settings.embedding_max_concurrency = 2
+        mock_settings.embedding_cache_size = 100
+        mock_settings.embedding_normalize = False
+        mock_embeddings_instance = Mock()
+        mock_embeddings_instance.aembed_documents = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] for t in texts]
+        )
+        mock_hf_embeddings.return_value = mock_embeddings_instance
+
+        service = EmbeddingService(provider="huggingface", max_batch_size=1, normalize=False)
+        embeddings = await service.aembed_documents(["a", "bb", "ccc", "dddd", "eeeee"])
+
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert mock_embeddings_instance.aembed_documents.await_count == 3
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.settings")
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    @pytest.mark.asyncio
+    async def test_aembed_documents_buckets_by_length(self, mock_hf_embeddings, mock_settings):
+        """Test that HuggingFace batches group texts of similar length."""
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        mock_settings.embedding_batch_size = 2
+        mock_settings.embedding_max_concurrency = 1
+        mock_settings.embedding_cache_size = 100
+        mock_embeddings_instance = Mock()
+        mock_embeddings_instance.aembed_documents = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] for t in texts]
+        )
+        mock_hf_embeddings.return_value = mock_embeddings_instance
+
+        service = EmbeddingService(provider="huggingface", max_batch_size=1, normalize=False)
+        embeddings = await service.aembed_documents(["x" * 50, "a", "y" * 40, "bb"])
+
+        calls = mock_embeddings_instance.aembed_documents.await_args_list
+        batches = [call.args[0] for call in calls]
+        assert batches == [["a", "bb"], ["y" * 40, "x" * 50]]
+        assert embeddings == [[50.0], [1.0], [40.0], [2.0]]
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    def test_embed_documents_only_embeds_uncached(self, mock_hf_embeddings):
+        """Test that cached texts skip the provider and results keep input order."""
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        mock_embeddings_instance = Mock()
+        mock_embeddings_instance.embed_query.return_value = [0.5]
+        mock_embeddings_instance.embed_documents.side_effect = lambda texts: [
+            [float(len(t))] for t in texts
+        ]
+        mock_hf_embeddings.return_value = mock_embeddings_instance
+
+        service = EmbeddingService(provider="huggingface", normalize=False)
+        service.embed_query("query")
+        service.embed_query("query")
+        embeddings = service.embed_documents(["a", "query", "ccc"])
+
+        assert embeddings == [[1.0], [0.5], [3.0]]
+        mock_embeddings_instance.embed_query.assert_called_once_with("query")
+        mock_embeddings_instance.embed_documents.assert_called_once_with(["a", "ccc"])
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    def test_embed_documents_dedupes_texts(self, mock_hf_embeddings):
+        """Test that repeated texts are embedded once even with caching off."""
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        mock_embeddings_instance = Mock()
+        mock_embeddings_instance.embed_documents.side_effect = lambda texts: [
+            [float(len(t))] for t in texts
+        ]
+        mock_hf_embeddings.return_value = mock_embeddings_instance
+
+        service = EmbeddingService(provider="huggingface", cache_embeddings=False, normalize=False)
+        embeddings = service.embed_documents(["header", "a", "header", "a", "bb"])
+
+        assert embeddings == [[6.0], [1.0], [6.0], [1.0], [2.0]]
+        mock_embeddings_instance.embed_documents.assert_called_once_with(["header", "a", "bb"])
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    def test_embed_documents_array_returns_float32(self, mock_hf_embeddings):
+        """Test that the array API returns a read-only float32 matrix."""
+        import numpy as np
+
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        mock_embeddings_instance = Mock()
+        mock_embeddings_instance.embed_documents.return_value = [[1.0, 0.0], [0.0, 1.0]]
+        mock_hf_embeddings.return_value = mock_embeddings_instance
+
+        service = EmbeddingService(provider="huggingface")
+        matrix = service.embed_documents_array(["a", "b"])
+
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (2, 2)
+        assert not matrix.flags.writeable
+        assert service.get_embedding_dimension() == 2
+
+    @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
+    def test_embedding_dimension_probed_once(self, mock_hf_embeddings):
+        """Test that known models skip the probe and unknown ones are probed once."""
+        from psyai.platform.langchain_integration.rag import EmbeddingService
+
+        mock_embeddings_instance = Mock()
+        mock_embeddings_instance.embed_query.return_value = [0.1, 0.2, 0.3]
+        mock_hf_embeddings.return_value = mock_embeddings_instance
+
+        known = EmbeddingService(provider="huggingface", model_name="BAAI/bge-base-en-v1.5")
+        first = EmbeddingService(provider="huggingface", model_name="custom")
+        second = EmbeddingService(provider="huggingface", model_name="custom")
+
+        assert known.get_embedding_dimension() == 768
+        assert first.get_embedding_dimension() == 3
+        assert second.get_embedding_dimension() == 3
+        mock_embeddings_instance.embed_query.assert_called_once_with("test")
+
     def test_embedding_service_invalid_provider(self):
         """Test that invalid provider raises error."""
         from psyai.core.exceptions import LLMError
@@ -246,7 +830,8 @@ class TestEmbeddingService:
         service = EmbeddingService(provider="huggingface")
         embedding = service.embed_query("test query")
 
-        assert embedding == [0.1, 0.2, 0.3]
+        # Embeddings are L2-normalized by default
+        assert embedding == pytest.approx([v / 0.14**0.5 for v in (0.1, 0.2, 0.3)])
         mock_embeddings_instance.embed_query.assert_called_once_with("test query")
 
     @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
@@ -266,7 +851,7 @@ class TestEmbeddingService:
         embeddings = service.embed_documents(["doc1", "doc2"])
 
         assert len(embeddings) == 2
-        assert embeddings[0] == [0.1, 0.2, 0.3]
+        assert embeddings[0] == pytest.approx([v / 0.14**0.5 for v in (0.1, 0.2, 0.3)])
         mock_embeddings_instance.embed_documents.assert_called_once()
 
     @patch("psyai.platform.langchain_integration.rag.embeddings.HuggingFaceEmbeddings")
@@ -351,3 +936,159 @@ class TestVectorStoreManager:
         assert len(results) == 2
         assert results[0].page_content == "doc1"
         mock_vectorstore_instance.similarity_search.assert_called_once()
+
+    def test_memory_store_ranks_by_cosine(self):
+        """Test that the in-process store returns the closest documents first."""
+        import numpy as np
+
+        from psyai.platform.langchain_integration.rag import VectorStoreManager
+
+        vectors = {"cats": [1.0, 0.0], "dogs": [0.8, 0.6], "cars": [0.0, 1.0]}
+        mock_embedding_service = Mock()
+        mock_embedding_service.embed_documents_array.side_effect = lambda texts: np.array(
+            [vectors[t] for t in texts], dtype=np.float32
+        )
+        mock_embedding_service.embed_query_array.return_value = np.array(
+            [1.0, 0.1], dtype=np.float32
+        )
+
+        manager = VectorStoreManager(store_type="memory", embedding_service=mock_embedding_service)
+        manager.add_texts(
+            ["cats", "dogs", "cars"],
+            metadatas=[{"kind": "animal"}, {"kind": "animal"}, {"kind": "vehicle"}],
+        )
+
+        results = manager.similarity_search("kittens", k=2)
+        filtered = manager.similarity_search("kittens", k=2, filter={"kind": "vehicle"})
+
+        assert [doc.page_content for doc in results] == ["cats", "dogs"]
+        assert [doc.page_content for doc in filtered] == ["cars"]
+
+    @pytest.mark.asyncio
+    async def test_memory_store_add_nothing(self):
+        """Test that empty adds to the memory store are no-ops."""
+        from psyai.platform.langchain_integration.rag import VectorStoreManager
+
+        mock_embedding_service = Mock()
+        mock_embedding_service.aembed_documents_array = AsyncMock()
+
+        manager = VectorStoreManager(store_type="memory", embedding_service=mock_embedding_service)
+
+        assert manager._vectorstore.add_texts([]) == []
+        assert await manager._vectorstore.aadd_texts([]) == []
+        mock_embedding_service.embed_documents_array.assert_not_called()
+        mock_embedding_service.aembed_documents_array.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_abatch_similarity_search(self):
+        """Test that queries are embedded in one call and searched per vector."""
+        import numpy as np
+
+        from psyai.platform.langchain_integration.rag import VectorStoreManager
+
+        vectors = {
+            "cats": [1.0, 0.0],
+            "cars": [0.0, 1.0],
+            "kittens": [0.9, 0.1],
+            "trucks": [0.1, 0.9],
+        }
+        mock_embedding_service = Mock()
+        mock_embedding_service.embed_documents_array.side_effect = lambda texts: np.array(
+            [vectors[t] for t in texts], dtype=np.float32
+        )
+        mock_embedding_service.aembed_documents_array = AsyncMock(
+            side_effect=mock_embedding_service.embed_documents_array.side_effect
+        )
+
+        manager = VectorStoreManager(
+            store_type="memory", embedding_service=mock_embedding_service, quantize=False
+        )
+        manager.add_texts(["cats", "cars"])
+
+        results = await manager.abatch_similarity_search(["kittens", "trucks"], k=1)
+
+        assert [[doc.page_content for doc in docs] for docs in results] == [["cats"], ["cars"]]
+        mock_embedding_service.aembed_documents_array.assert_awaited_once_with(
+            ["kittens", "trucks"]
+        )
+
+    @patch("psyai.platform.langchain_integration.rag.vectorstore.get_embedding_service")
+    @patch("psyai.platform.langchain_integration.rag.vectorstore.Chroma")
+    @pytest.mark.asyncio
+    async def test_bulk_writer_batches_writes(self, mock_chroma, mock_get_embedding):
+        """Test that buffered writes reach the store in threshold-sized batches."""
+        from psyai.platform.langchain_integration.rag import VectorStoreManager
+
+        mock_vectorstore_instance = Mock()
+        mock_vectorstore_instance.aadd_texts = AsyncMock(
+            side_effect=lambda texts, **kwargs: kwargs["ids"]
+        )
+        mock_chroma.return_value = mock_vectorstore_instance
+
+        manager = VectorStoreManager(store_type="chroma")
+        manager.flush_threshold = 4
+
+        async with manager.bulk_writer():
+            for i in range(5):
+                await manager.aadd_texts([f"text {i}"], ids=[f"id-{i}"])
+            written_inside = mock_vectorstore_instance.aadd_texts.await_count
+
+        calls = mock_vectorstore_instance.aadd_texts.await_args_list
+        assert written_inside == 1
+        assert [call.kwargs["ids"] for call in calls] == [
+            ["id-0", "id-1", "id-2", "id-3"],
+            ["id-4"],
+        ]
+
+    def test_memory_store_quantized(self):
+        """Test that the in-process store can hold int8 vectors."""
+        import numpy as np
+
+        from psyai.platform.langchain_integration.rag import VectorStoreManager
+
+        mock_embedding_service = Mock()
+        mock_embedding_service.embed_documents_array.return_value = np.array(
+            [[1.0, 0.0], [0.0, 1.0]], dtype=np.float32
+        )
+        mock_embedding_service.embed_query_array.return_value = np.array(
+            [0.2, 1.0], dtype=np.float32
+        )
+
+        manager = VectorStoreManager(
+            store_type="memory", embedding_service=mock_embedding_service, quantize=True
+        )
+        manager.add_texts(["cats", "cars"])
+
+        results = manager.similarity_search("trucks", k=1)
+
+        assert manager.vectorstore._index._matrix.dtype == np.int8
+        assert [doc.page_content for doc in results] == ["cars"]
+
+    def test_mirror_similarity_search(self, tmp_path):
+        """Test that added texts are mirrored to the memory-mapped matrix."""
+        import numpy as np
+
+        from psyai.platform.langchain_integration.rag import VectorStoreManager
+
+        mock_embedding_service = Mock()
+        mock_embedding_service.embed_documents_array.return_value = np.array(
+            [[1.0, 0.0], [0.0, 1.0]], dtype=np.float32
+        )
+        mock_embedding_service.embed_query_array.return_value = np.array(
+            [0.2, 1.0], dtype=np.float32
+        )
+
+        with patch(
+            "psyai.platform.langchain_integration.rag.vectorstore.settings"
+        ) as mock_settings:
+            mock_settings.chroma_persist_directory = str(tmp_path)
+            mock_settings.memory_store_quantize = False
+            manager = VectorStoreManager(
+                store_type="memory", embedding_service=mock_embedding_service, mmap_mirror=True
+            )
+        manager.add_texts(["cats", "cars"], ids=["id-cats", "id-cars"])
+
+        results = manager.mirror_similarity_search("trucks", k=1)
+
+        assert results[0][0] == "id-cars"
+        assert (tmp_path / "psyai.f32").exists()
@@ -0,0 +1,144 @@
+"""Tests for the in-process vector index."""
+
+import numpy as np
+import pytest
+
+from psyai.platform.vertexai_integration.rag.local_index import LocalVectorIndex
+
+
+@pytest.fixture
+def index():
+    """Index with three orthogonal-ish documents."""
+    index = LocalVectorIndex()
+    index.add(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 3.0]],
+        texts=["alpha", "beta", "gamma"],
+        metadatas=[{"source": "doc1"}, {"source": "doc2"}, {"source": "doc3"}],
+    )
+    return index
+
+
+class TestLocalVectorIndex:
+    """Tests for LocalVectorIndex."""
+
+    def test_infers_dimension(self, index):
+        """Test that the dimension is taken from the first add."""
+        assert index.dimension == 3
+        assert len(index) == 3
+
+    def test_search_orders_by_cosine(self, index):
+        """Test that results are ranked by cosine similarity."""
+        results = index.search([0.1, 5.0, 0.0], k=2)
+
+        assert [doc_id for doc_id, _, _, _ in results] == ["b", "a"]
+        doc_id, score, text, metadata = results[0]
+        assert score == pytest.approx(0.9998, abs=1e-3)
+        assert text == "beta"
+        assert metadata == {"source": "doc2"}
+
+    def test_search_ignores_magnitude(self, index):
+        """Test that vector length does not affect similarity."""
+        results = index.search([0.0, 0.0, 0.5], k=1)
+
+        assert results[0][0] == "c"
+        assert results[0][1] == pytest.approx(1.0)
+
+    def test_search_empty(self):
+        """Test searching an empty index."""
+        assert LocalVectorIndex().search([1.0, 0.0], k=3) == []
+
+    def test_k_larger_than_index(self, index):
+        """Test that k is capped by the index size."""
+        assert len(index.search([1.0, 1.0, 1.0], k=10)) == 3
+
+    def test_search_where(self, index):
+        """Test that a metadata predicate restricts the candidates."""
+        results = index.search(
+            [0.0, 1.0, 0.1], k=1, where=lambda metadata: metadata["source"] != "doc2"
+        )
+
+        assert [doc_id for doc_id, _, _, _ in results] == ["c"]
+
+    @pytest.mark.parametrize("embeddings", [[], np.empty((0, 0)), np.empty((0, 8))])
+    def test_add_empty_is_a_no_op(self, embeddings):
+        """Test that adding no vectors leaves the index untouched."""
+        index = LocalVectorIndex()
+        index.add([], embeddings, [])
+
+        assert len(index) == 0
+        assert index.dimension is None
+
+    def test_dimension_mismatch(self, index):
+        """Test that mismatched embeddings are rejected."""
+        with pytest.raises(ValueError):
+            index.add(["d"], [[1.0, 0.0]], ["delta"])
+
+    def test_remove(self, index):
+        """Test removing vectors by ID."""
+        assert index.remove(["b", "missing"]) == 1
+        assert len(index) == 2
+        assert {doc_id for doc_id, _, _, _ in index.search([0.0, 1.0, 0.0], k=3)} == {"a", "c"}
+
+    def test_uses_numba_kernel_when_available(self, index):
+        """Test that float scoring goes through the compiled kernel if present."""
+        from unittest.mock import Mock, patch
+
+        kernel = Mock(side_effect=lambda matrix, query: matrix @ query)
+        module = "psyai.platform.vertexai_integration.rag.local_index"
+        with (
+            patch(f"{module}.simsimd", None),
+            patch(f"{module}._numba_scores_kernel", return_value=kernel),
+        ):
+            results = index.search([0.1, 5.0, 0.0], k=1)
+
+        assert results[0][0] == "b"
+        kernel.assert_called_once()
+
+    def test_growth_and_top_k(self):
+        """Test appends past the initial capacity and partial top-k ordering."""
+        index = LocalVectorIndex()
+        for i in range(40):
+            index.add([str(i)], [[1.0, i / 40]], [f"text {i}"])
+
+        results = index.search([1.0, 0.0], k=3)
+
+        assert len(index) == 40
+        assert [doc_id for doc_id, _, _, _ in results] == ["0", "1", "2"]
+        assert results[0][1] >= results[1][1] >= results[2][1]
+
+    def test_quantized_matches_float(self):
+        """Test that int8 storage preserves ranking and approximate scores."""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(50, 16)).tolist()
+        ids = [str(i) for i in range(50)]
+        texts = [f"text {i}" for i in ids]
+
+        exact = LocalVectorIndex()
+        exact.add(ids, vectors, texts)
+        quantized = LocalVectorIndex(quantize=True)
+        quantized.add(ids, vectors, texts)
+
+        query = vectors[7]
+        exact_results = exact.search(query, k=5)
+        quantized_results = quantized.search(query, k=5)
+
+        assert quantized._matrix.dtype == np.int8
+        assert quantized_results[0][0] == "7"
+        for exact_result, quantized_result in zip(exact_results, quantized_results):
+            assert quantized_result[1] == pytest.approx(exact_result[1], abs=0.02)
+
+    def test_quantized_self_match_is_exact(self):
+        """Test that a stored int8 row scores exactly 1.0 against itself."""
+        import numpy as np
+
+        index = LocalVectorIndex(quantize=True)
+        index.add(["a", "b"], [[0.3, -0.7, 0.2], [1.0, 0.5, 0.0]], ["alpha", "beta"])
+
+        stored = index._matrix[0].astype(np.float32)
+        results = index.search(stored, k=1)
+
+        assert results[0][0] == "a"
+        assert results[0][1] == pytest.approx(1.0, abs=1e-6)
@@ -0,0 +1,58 @@
+"""Tests for the memory-mapped embedding mirror."""
+
+import pytest
+
+from psyai.platform.langchain_integration.rag.mmap_mirror import MemmapVectorMirror
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    """Mirror with three orthogonal documents."""
+    mirror = MemmapVectorMirror(str(tmp_path / "collection"))
+    mirror.add(["a", "b", "c"], [[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 3.0]])
+    return mirror
+
+
+class TestMemmapVectorMirror:
+    """Tests for MemmapVectorMirror."""
+
+    def test_search_orders_by_cosine(self, mirror):
+        """Test that results are ranked by cosine similarity."""
+        results = mirror.search([0.1, 1.0, 0.5], k=2)
+
+        assert [doc_id for doc_id, _ in results] == ["b", "c"]
+        assert results[0][1] == pytest.approx(1.0 / (1.26**0.5), rel=1e-5)
+
+    def test_reopen_restores_vectors(self, mirror, tmp_path):
+        """Test that a mirror reopened from the same path sees earlier rows."""
+        reopened = MemmapVectorMirror(str(tmp_path / "collection"))
+
+        assert len(reopened) == 3
+        assert reopened.search([0.0, 0.0, 1.0], k=1)[0][0] == "c"
+
+    def test_remove_compacts_rows(self, mirror):
+        """Test that removed vectors are no longer returned."""
+        assert mirror.remove(["a", "missing"]) == 1
+        mirror.add(["d"], [[1.0, 1.0, 0.0]])
+
+        assert len(mirror) == 3
+        assert [doc_id for doc_id, _ in mirror.search([1.0, 0.0, 0.0], k=3)][0] == "d"
+
+    def test_readding_an_id_overwrites_its_row(self, mirror, tmp_path):
+        """Test that re-added IDs are updated in place rather than duplicated."""
+        mirror.add(["a", "d"], [[0.0, 0.0, 1.0], [0.0, 1.0, 1.0]])
+
+        results = mirror.search([0.0, 0.0, 1.0], k=5)
+
+        assert len(mirror) == 4
+        assert sorted(doc_id for doc_id, _ in results) == ["a", "b", "c", "d"]
+        assert {doc_id for doc_id, _ in results[:2]} == {"a", "c"}
+        assert len(MemmapVectorMirror(str(tmp_path / "collection"))) == 4
+
+    def test_add_empty_is_a_no_op(self, tmp_path):
+        """Test that adding no vectors creates nothing."""
+        mirror = MemmapVectorMirror(str(tmp_path / "empty"))
+        mirror.add([], [])
+
+        assert len(mirror) == 0
+        assert not (tmp_path / "empty.ids.json").exists()
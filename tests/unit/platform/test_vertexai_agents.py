@@ -0,0 +1,259 @@
+"""Tests for Vertex AI agent templates."""
+
+from typing import List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from vertexai.generative_models import Content, Part
+
+from psyai.platform.vertexai_integration.agents.base import (
+    ConversationalAgent,
+    FunctionCallingAgent,
+    _to_message,
+)
+
+MODULE = "psyai.platform.vertexai_integration.agents.base"
+
+
+class FakeChat:
+    """Chat session that appends each exchange to the history it was given."""
+
+    def __init__(self, history):
+        self.history = history
+
+    def send_message(self, content, **kwargs):
+        parts = content if isinstance(content, list) else [Part.from_text(content)]
+        reply = f"re: {parts[-1].text}"
+        self.history.append(Content(role="user", parts=parts))
+        self.history.append(Content(role="model", parts=[Part.from_text(reply)]))
+        return MagicMock(text=reply)
+
+    async def send_message_async(self, content, **kwargs):
+        return self.send_message(content, **kwargs)
+
+
+@pytest.fixture
+def client():
+    """Vertex AI client whose chat sessions are FakeChat instances."""
+    client = MagicMock()
+    client.start_chat.side_effect = lambda history=None, system_instruction=None: FakeChat(
+        history or []
+    )
+    with patch(f"{MODULE}.get_vertexai_client", return_value=client):
+        yield client
+
+
+class TestConversationalAgent:
+    """Tests for ConversationalAgent history handling."""
+
+    @pytest.mark.asyncio
+    async def test_session_starts_on_first_message(self, client):
+        """Test that no chat session is created until a message is sent."""
+        agent = ConversationalAgent()
+
+        assert agent.chat is None
+        assert agent.get_history() == []
+        client.start_chat.assert_not_called()
+
+        response = await agent.arun("hello")
+
+        assert response.content == "re: hello"
+        client.start_chat.assert_called_once()
+
+    def test_history_is_append_only_until_buffer_is_full(self, client):
+        """Test that the prefix is stable until the buffer overflows, then trimmed once."""
+        agent = ConversationalAgent(system_instruction="Be kind", max_turns=2, cache_buffer=2)
+
+        for i in range(4):
+            agent.run(f"m{i}")
+        history = agent.chat.history
+        assert len(history) == 2 * 4
+        assert history[0].parts[0].text == "m0"
+
+        agent.run("m4")
+
+        assert agent.chat.history is history
+        assert len(history) == 2 * 2
+        assert history[0].parts[0].text == "m3"
+
+    def test_get_history_converts_each_message_once(self, client):
+        """Test that get_history only converts messages from new exchanges."""
+        agent = ConversationalAgent(max_turns=0)
+        agent.run("hello")
+
+        with patch(f"{MODULE}._to_message", wraps=_to_message) as convert:
+            assert agent.get_history() == [
+                {"role": "user", "content": "hello"},
+                {"role": "model", "content": "re: hello"},
+            ]
+            agent.run("again")
+            agent.get_history()
+
+        assert convert.call_count == 2
+        assert len(agent.get_history()) == 4
+
+    def test_get_history_follows_trimming(self, client):
+        """Test that trimmed exchanges also leave get_history."""
+        agent = ConversationalAgent(max_turns=1, cache_buffer=1)
+        for i in range(3):
+            agent.run(f"m{i}")
+
+        assert [m["content"] for m in agent.get_history()] == ["m2", "re: m2"]
+
+    def test_system_instruction_is_not_a_chat_turn(self, client):
+        """Test that the instruction goes to the session, not into the history."""
+        agent = ConversationalAgent(system_instruction="Be kind")
+        agent.run("hello")
+
+        client.start_chat.assert_called_once_with(system_instruction="Be kind")
+        assert [m["content"] for m in agent.get_history()] == ["hello", "re: hello"]
+
+        agent.clear_history()
+
+        assert agent.get_history() == []
+
+    def test_context_is_sent_in_next_message_only(self, client):
+        """Test that added context rides along with the next user message once."""
+        agent = ConversationalAgent()
+        agent.add_context("User likes tea")
+
+        agent.run("What do I like?")
+        agent.run("Thanks")
+
+        history = agent.chat.history
+        assert [part.text for part in history[0].parts] == ["User likes tea", "What do I like?"]
+        assert [part.text for part in history[2].parts] == ["Thanks"]
+
+
+class TestFunctionCallingAgent:
+    """Tests for FunctionCallingAgent."""
+
+    def test_declaration_is_built_from_signature(self):
+        """Test that parameter types and required names come from the signature."""
+        from psyai.platform.vertexai_integration.agents.base import _declare_function
+
+        def search(query: str, limit: int = 5, tags: Optional[List[str]] = None) -> str:
+            """Search documents."""
+            return ""
+
+        declaration = _declare_function(search).to_dict()
+
+        assert declaration["name"] == "search"
+        assert declaration["description"] == "Search documents."
+        properties = declaration["parameters"]["properties"]
+        assert properties["query"]["type"] == "STRING"
+        assert properties["limit"]["type"] == "INTEGER"
+        assert properties["tags"]["type"] == "ARRAY"
+        assert declaration["parameters"]["required"] == ["query"]
+
+    def test_declaration_without_arguments_has_no_parameters(self):
+        """Test that zero-argument functions declare no parameter schema."""
+        from psyai.platform.vertexai_integration.agents.base import _declare_function
+
+        def now() -> str:
+            """Current time."""
+            return ""
+
+        assert _declare_function(now).to_dict() == {"name": "now", "description": "Current time."}
+
+    def test_function_calls_are_dispatched(self, client):
+        """Test that model function calls run locally and the result is sent back."""
+
+        def get_weather(location: str) -> str:
+            """Look up the weather."""
+            return f"Sunny in {location}"
+
+        call = MagicMock()
+        call.name = "get_weather"
+        call.args = {"location": "NYC"}
+        calling = MagicMock(candidates=[MagicMock(function_calls=[call])])
+        answer = MagicMock(text="It is sunny.", candidates=[MagicMock(function_calls=[])])
+        client.generate_response.side_effect = [calling, answer]
+
+        agent = FunctionCallingAgent(functions=[get_weather], system_instruction="Be brief")
+        response = agent.run("Weather in NYC?")
+
+        assert response.content == "It is sunny."
+        assert response.metadata["function_calls"] == [
+            {"name": "get_weather", "args": {"location": "NYC"}, "result": "Sunny in NYC"}
+        ]
+        contents = client.generate_response.call_args.args[0]
+        assert contents[0].parts[0].text == "Be brief\n\nWeather in NYC?"
+        assert contents[-1].parts[0].function_response.name == "get_weather"
+        assert client.generate_response.call_args.kwargs["tools"] is agent._tools
+
+    @pytest.mark.asyncio
+    async def test_round_limit_is_flagged(self, client):
+        """Test that a model that never stops calling functions yields a truncated response."""
+        from psyai.platform.vertexai_integration.agents.base import _MAX_FUNCTION_ROUNDS
+
+        def ping() -> str:
+            """Ping."""
+            return "pong"
+
+        call = MagicMock(args={})
+        call.name = "ping"
+
+        class CallingResponse:
+            candidates = [MagicMock(function_calls=[call])]
+
+            @property
+            def text(self):
+                raise ValueError("Response has no text, only function calls")
+
+        calling = CallingResponse()
+        client.generate_response.return_value = calling
+        client.agenerate_response = AsyncMock(return_value=calling)
+        agent = FunctionCallingAgent(functions=[ping])
+
+        with patch(f"{MODULE}.logger") as logger:
+            responses = [agent.run("Go"), await agent.arun("Go")]
+
+        for response in responses:
+            assert response.content == ""
+            assert response.metadata["truncated"] is True
+            assert len(response.metadata["function_calls"]) == _MAX_FUNCTION_ROUNDS
+        assert logger.warning.call_count == 2
+
+    @pytest.mark.parametrize(
+        "name, args, error",
+        [
+            ("missing", {}, "Unknown function: missing"),
+            ("divide", {"x": 1}, "missing 1 required positional argument"),
+            ("divide", {"x": 1, "y": 0}, "division by zero"),
+        ],
+    )
+    def test_failed_call_is_sent_back_as_error(self, client, name, args, error):
+        """Test that a failing tool call is reported to the model instead of raised."""
+
+        def divide(x: float, y: float) -> float:
+            """Divide x by y."""
+            return x / y
+
+        call = MagicMock(args=args)
+        call.name = name
+        calling = MagicMock(candidates=[MagicMock(function_calls=[call])])
+        answer = MagicMock(text="Sorry.", candidates=[MagicMock(function_calls=[])])
+        client.generate_response.side_effect = [calling, answer]
+
+        response = FunctionCallingAgent(functions=[divide]).run("Divide")
+
+        assert response.content == "Sorry."
+        (recorded,) = response.metadata["function_calls"]
+        assert error in recorded["error"]
+        sent = client.generate_response.call_args.args[0][-1].parts[0].function_response
+        assert error in sent.response["error"]
+
+
+class TestAgentResponse:
+    """Tests for AgentResponse."""
+
+    def test_slots_and_str(self):
+        """Test that responses have no per-instance dict and print as content."""
+        from psyai.platform.vertexai_integration.agents.base import AgentResponse
+
+        response = AgentResponse(content="hello")
+
+        assert str(response) == "hello"
+        assert response.metadata == {}
+        assert not hasattr(response, "__dict__")
@@ -0,0 +1,268 @@
+"""Tests for the Vertex AI client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from psyai.platform.vertexai_integration.client import VertexAIClient
+
+MODULE = "psyai.platform.vertexai_integration.client"
+
+
+@pytest.fixture
+def client():
+    """Client with Vertex AI initialization and model creation patched out."""
+    with patch(f"{MODULE}.vertexai.init"), patch(f"{MODULE}.GenerativeModel"):
+        yield VertexAIClient(project_id="test-project", max_concurrency=2)
+
+
+class TestBatchGenerate:
+    """Tests for batch_generate and abatch_generate."""
+
+    def test_batch_generate_keeps_order(self, client):
+        """Test that threaded batch results follow prompt order."""
+        with patch.object(client, "generate", side_effect=lambda prompt: prompt.upper()):
+            assert client.batch_generate(["a", "b", "c"]) == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_abatch_generate_is_concurrent_and_bounded(self, client):
+        """Test that async batches overlap calls up to max_concurrency."""
+        in_flight = []
+        peak = []
+
+        async def fake_agenerate(prompt):
+            in_flight.append(prompt)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(prompt)
+            return prompt.upper()
+
+        with patch.object(client, "agenerate", side_effect=fake_agenerate):
+            results = await client.abatch_generate(["a", "b", "c", "d"])
+
+        assert results == ["A", "B", "C", "D"]
+        assert max(peak) == 2
+
+
+class TestLazyInitialization:
+    """Tests for deferred Vertex AI initialization."""
+
+    def test_construction_does_not_initialize(self):
+        """Test that creating a client does no blocking setup until first use."""
+        with (
+            patch(f"{MODULE}._sdk_config", None),
+            patch(f"{MODULE}.vertexai.init") as init,
+            patch(f"{MODULE}.GenerativeModel") as model,
+        ):
+            client = VertexAIClient(project_id="test-project")
+            init.assert_not_called()
+
+            assert client.model is client.model
+
+        init.assert_called_once_with(project="test-project", location=client.location)
+        model.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_agenerate_initializes_off_loop(self, client):
+        """Test that agenerate runs initialization through asyncio.to_thread."""
+
+        model = MagicMock()
+        model.generate_content_async = AsyncMock(return_value=MagicMock(text="ok"))
+        client._create_model = MagicMock(return_value=model)
+
+        with patch(f"{MODULE}.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            assert await client.agenerate("hi") == "ok"
+            assert await client.agenerate("again") == "ok"
+
+        to_thread.assert_called_once_with(client._ensure_initialized)
+
+
+class TestInitVertexAI:
+    """Tests for init_vertexai."""
+
+    def test_skips_repeated_configuration(self):
+        """Test that only a change of project or location re-initializes the SDK."""
+        from psyai.platform.vertexai_integration.client import init_vertexai
+
+        with patch(f"{MODULE}._sdk_config", None), patch(f"{MODULE}.vertexai.init") as init:
+            init_vertexai("project-a", "us-central1")
+            init_vertexai("project-a", "us-central1")
+            init_vertexai("project-b", "us-central1")
+            init_vertexai("project-a", "us-central1")
+
+        assert [c.kwargs["project"] for c in init.call_args_list] == [
+            "project-a",
+            "project-b",
+            "project-a",
+        ]
+
+
+class TestGetVertexAIClient:
+    """Tests for the keyed get_vertexai_client cache."""
+
+    def setup_method(self):
+        """Start each test with an empty client cache."""
+        from psyai.platform.vertexai_integration import client as client_module
+
+        client_module._clients.clear()
+
+    def test_reuses_instance_per_configuration(self):
+        """Test that equal configurations share a client and different ones do not."""
+        from psyai.platform.vertexai_integration.client import get_vertexai_client
+
+        first = get_vertexai_client(temperature=0.2, project_id="test-project")
+        again = get_vertexai_client(temperature=0.2, project_id="test-project")
+        other = get_vertexai_client(temperature=0.9, project_id="test-project")
+
+        assert first is again
+        assert other is not first
+        assert (
+            get_vertexai_client(temperature=0.2, project_id="test-project", force_new=True)
+            is not first
+        )
+
+
+class TestStartChat:
+    """Tests for start_chat."""
+
+    def test_system_instruction_model_is_reused(self, client):
+        """Test that one model is created per distinct system instruction."""
+        with patch.object(client, "_create_model", wraps=client._create_model) as create:
+            client.start_chat(system_instruction="Be kind")
+            client.start_chat(system_instruction="Be kind")
+            client.start_chat(system_instruction="Be brief")
+
+        assert [c.args for c in create.call_args_list] == [(), ("Be kind",), ("Be brief",)]
+
+
+class TestErrorTranslation:
+    """Tests for mapping provider exceptions to PsyAI errors."""
+
+    def test_maps_by_exception_type(self):
+        """Test that provider exception classes select the error type."""
+        from google.api_core import exceptions as google_exceptions
+
+        from psyai.core.exceptions import LLMError, LLMRateLimitError, LLMTimeoutError
+        from psyai.platform.vertexai_integration.client import _translate_error
+
+        assert isinstance(
+            _translate_error(google_exceptions.ResourceExhausted("quota"), "e"),
+            LLMRateLimitError,
+        )
+        assert isinstance(
+            _translate_error(google_exceptions.DeadlineExceeded("slow"), "e"), LLMTimeoutError
+        )
+        error = _translate_error(ValueError("bad request"), "e")
+        assert type(error) is LLMError
+
+
+class TestAstream:
+    """Tests for astream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_text_chunks(self, client):
+        """Test that text chunks are yielded in order and empty chunks are skipped."""
+
+        def chunk(text):
+            part = MagicMock(text=text)
+            return MagicMock(text=text, candidates=[MagicMock(content=MagicMock(parts=[part]))])
+
+        async def stream():
+            for item in (chunk("Hel"), chunk("lo"), MagicMock(candidates=[])):
+                yield item
+
+        model = MagicMock()
+        model.generate_content_async = AsyncMock(return_value=stream())
+        client._create_model = MagicMock(return_value=model)
+
+        assert [text async for text in client.astream("hi")] == ["Hel", "lo"]
+        assert model.generate_content_async.call_args.kwargs["stream"] is True
+
+
+class TestCountTokens:
+    """Tests for count_tokens caching."""
+
+    def test_counts_are_shared_across_clients(self):
+        """Test that a second client with the same model reuses a cached count."""
+        from psyai.platform.vertexai_integration.client import _get_token_count_cache
+
+        _get_token_count_cache().clear()
+        tokenizer = MagicMock()
+        tokenizer.count_tokens.return_value = MagicMock(total_tokens=7)
+
+        with patch(f"{MODULE}._get_tokenizer", return_value=tokenizer):
+            first = VertexAIClient(project_id="test-project", temperature=0.1)
+            second = VertexAIClient(project_id="test-project", temperature=0.9)
+
+            assert first.count_tokens("hello") == 7
+            assert second.count_tokens("hello") == 7
+
+        tokenizer.count_tokens.assert_called_once_with("hello")
+
+
+class TestResponseCache:
+    """Tests for the prompt to response cache."""
+
+    @pytest.fixture
+    def model(self):
+        """Model that answers every prompt with a fixed response."""
+        model = MagicMock()
+        model.generate_content.return_value = MagicMock(text="answer")
+        model.generate_content_async = AsyncMock(return_value=MagicMock(text="answer"))
+        return model
+
+    def test_repeated_prompt_skips_rpc(self, client, model):
+        """Test that a cached prompt is answered without calling the model."""
+        client.cache_responses = True
+        client._create_model = MagicMock(return_value=model)
+
+        assert client.generate("hi") == "answer"
+        assert client.generate("hi") == "answer"
+        assert client.generate("other") == "answer"
+
+        assert model.generate_content.call_count == 2
+
+    def test_on_by_default_at_explicit_zero_temperature(self):
+        """Test that temperature=0 is kept rather than replaced by the default."""
+        with (
+            patch(f"{MODULE}.vertexai.init"),
+            patch(f"{MODULE}.GenerativeModel"),
+            patch(f"{MODULE}.settings.vertex_response_cache_enabled", False),
+            patch(f"{MODULE}.settings.vertex_temperature", 0.7),
+        ):
+            greedy = VertexAIClient(project_id="test-project", temperature=0)
+            default = VertexAIClient(project_id="test-project")
+
+        assert greedy.temperature == 0
+        assert greedy.cache_responses
+        assert default.temperature == 0.7
+        assert not default.cache_responses
+
+    @pytest.mark.asyncio
+    async def test_per_call_override(self, client, model):
+        """Test that cache=False bypasses an enabled cache."""
+        client.cache_responses = True
+        client._create_model = MagicMock(return_value=model)
+
+        await client.agenerate("hi")
+        await client.agenerate("hi")
+        await client.agenerate("hi", cache=False)
+
+        assert model.generate_content_async.await_count == 2
+
+
+class TestGenerationConfigOverrides:
+    """Tests for per-call generation config overrides."""
+
+    def test_overrides_build_one_config_per_value_set(self, client):
+        """Test that override configs are built once and no overrides reuse the default."""
+        default, default_key = client._resolve_generation_config({})
+        first, first_key = client._resolve_generation_config({"temperature": 0.0, "max_tokens": 10})
+        again, _ = client._resolve_generation_config({"max_tokens": 10, "temperature": 0.0})
+
+        assert default is client.generation_config
+        assert first is again
+        assert first is not default
+        assert first_key != default_key
+        assert '"max_output_tokens": 10' in first_key
@@ -0,0 +1,242 @@
+"""Tests for Vertex AI embedding service."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from psyai.platform.vertexai_integration.rag import embeddings as vertex_embeddings
+from psyai.platform.vertexai_integration.rag.embeddings import VertexEmbeddingService
+
+MODULE = "psyai.platform.vertexai_integration.rag.embeddings"
+
+
+@pytest.fixture
+def model():
+    """Mock TextEmbeddingModel returning one vector per text."""
+    model = MagicMock()
+    model.get_embeddings.side_effect = lambda texts, **kwargs: [
+        MagicMock(values=[float(len(text)), 1.0, 0.0]) for text in texts
+    ]
+    with patch(f"{MODULE}.TextEmbeddingModel.from_pretrained", return_value=model):
+        yield model
+
+
+@pytest.fixture(autouse=True)
+def clear_dimensions():
+    """Forget dimensions learned by earlier tests."""
+    vertex_embeddings._embedding_dimensions.clear()
+    yield
+    vertex_embeddings._embedding_dimensions.clear()
+
+
+class TestGetEmbeddingDimension:
+    """Tests for get_embedding_dimension."""
+
+    def test_known_model_is_not_probed(self, model):
+        """Test that well-known models are answered from the table."""
+        service = VertexEmbeddingService(model_name="text-embedding-004")
+
+        assert service.get_embedding_dimension() == 768
+        model.get_embeddings.assert_not_called()
+
+    def test_unknown_model_is_probed_once(self, model):
+        """Test that an unknown model is probed once per process."""
+        first = VertexEmbeddingService(model_name="custom-model", normalize=False)
+        second = VertexEmbeddingService(model_name="custom-model", normalize=False)
+
+        assert first.get_embedding_dimension() == 3
+        assert second.get_embedding_dimension() == 3
+        assert model.get_embeddings.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_probe_uses_async_api(self, model):
+        """Test that the async lookup probes an unknown model without the sync API."""
+        model.get_embeddings_async = AsyncMock(
+            side_effect=lambda texts, **kwargs: model.get_embeddings.side_effect(texts)
+        )
+        service = VertexEmbeddingService(model_name="custom-model", normalize=False)
+
+        assert await service.aget_embedding_dimension() == 3
+        assert await service.aget_embedding_dimension() == 3
+        model.get_embeddings_async.assert_awaited_once()
+        model.get_embeddings.assert_not_called()
+
+    def test_learned_from_computed_embeddings(self, model):
+        """Test that embedding documents records the dimension for free."""
+        service = VertexEmbeddingService(model_name="custom-model", normalize=False)
+        service.embed_documents(["hello"])
+
+        assert service.get_embedding_dimension() == 3
+        assert model.get_embeddings.call_count == 1
+
+
+class TestEmbedDocuments:
+    """Tests for chunked document embedding."""
+
+    def test_sync_chunks_keep_input_order(self, model):
+        """Test that concurrent chunks are reassembled in input order."""
+        service = VertexEmbeddingService(model_name="custom-model", normalize=False)
+        texts = ["a" * (i + 1) for i in range(7)]
+
+        embeddings = service.embed_documents(texts, batch_size=2, concurrency=3)
+
+        assert model.get_embeddings.call_count == 4
+        assert [row[0] for row in embeddings] == [float(i + 1) for i in range(7)]
+
+    def test_chunks_group_texts_by_length(self, model):
+        """Test that multi-chunk requests hold texts of similar length."""
+        service = VertexEmbeddingService(model_name="custom-model", normalize=False)
+        texts = ["aaaa", "a", "aaa", "aa"]
+
+        embeddings = service.embed_documents(texts, batch_size=2, concurrency=1)
+
+        sent = [call.args[0] for call in model.get_embeddings.call_args_list]
+        assert sent == [["a", "aa"], ["aaa", "aaaa"]]
+        assert [row[0] for row in embeddings] == [4.0, 1.0, 3.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_async_chunks_keep_input_order(self, model):
+        """Test that gathered chunks are reassembled in input order."""
+        model.get_embeddings_async = AsyncMock(
+            side_effect=lambda texts, **kwargs: model.get_embeddings(texts)
+        )
+        service = VertexEmbeddingService(model_name="custom-model", normalize=False)
+        texts = ["a" * (i + 1) for i in range(5)]
+
+        embeddings = await service.aembed_documents(texts + texts[:1], batch_size=2)
+
+        assert model.get_embeddings_async.call_count == 3
+        assert [row[0] for row in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0, 1.0]
+
+    def test_duplicates_and_blanks_are_not_sent(self, model):
+        """Test that each distinct non-blank text is embedded once and blanks are zero."""
+        service = VertexEmbeddingService(model_name="text-embedding-004", normalize=False)
+
+        embeddings = service.embed_documents(["a", "", "a", "  ", "bb"])
+
+        model.get_embeddings.assert_called_once_with(["a", "bb"])
+        assert [row[0] for row in embeddings] == [1.0, 0.0, 1.0, 0.0, 2.0]
+        assert embeddings[1] == [0.0, 0.0, 0.0]
+
+    def test_only_blanks_use_known_dimension(self, model):
+        """Test that an all-blank request makes no API call."""
+        service = VertexEmbeddingService(model_name="text-embedding-004")
+
+        embeddings = service.embed_documents_array(["", " "])
+
+        model.get_embeddings.assert_not_called()
+        assert embeddings.shape == (2, 768)
+        assert not embeddings.any()
+
+
+class TestQueryBatcher:
+    """Tests for coalescing concurrent aembed_query calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_request(self, model):
+        """Test that concurrent queries are embedded together and cached."""
+        model.get_embeddings_async = AsyncMock(
+            side_effect=lambda texts, **kwargs: model.get_embeddings.side_effect(texts)
+        )
+        service = VertexEmbeddingService(model_name="custom-model", normalize=False)
+
+        results = await asyncio.gather(*(service.aembed_query(t) for t in ["a", "bb", "a"]))
+
+        model.get_embeddings_async.assert_awaited_once_with(["a", "bb"])
+        assert [r[0] for r in results] == [1.0, 2.0, 1.0]
+        assert (await service.aembed_query("bb"))[0] == 2.0
+        model.get_embeddings_async.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self, model):
+        """Test that a failed request fails each query in its batch."""
+        from psyai.core.exceptions import LLMError
+
+        model.get_embeddings_async = AsyncMock(side_effect=RuntimeError("quota"))
+        service = VertexEmbeddingService(model_name="custom-model")
+
+        results = await asyncio.gather(
+            service.aembed_query("a"), service.aembed_query("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, LLMError) for r in results)
+        model.get_embeddings_async.assert_awaited_once()
+
+
+class TestBatchEmbedOffline:
+    """Tests for batch prediction embedding."""
+
+    def test_small_workload_falls_back_to_online_array(self, model):
+        """Test that below-threshold workloads return the online float32 matrix."""
+        service = VertexEmbeddingService(model_name="custom-model", normalize=False)
+
+        with patch(f"{MODULE}.settings.vertex_batch_gcs_prefix", None):
+            embeddings = service.batch_embed_offline_array(["a", "bb"])
+
+        assert embeddings.dtype == np.float32
+        assert embeddings[:, 0].tolist() == [1.0, 2.0]
+        model.batch_predict.assert_not_called()
+
+    @pytest.mark.parametrize("fast_json", [True, False])
+    def test_batch_job_round_trip(self, model, fast_json):
+        """Test JSONL upload and output parsing with and without orjson."""
+        uploaded = []
+        bucket = MagicMock()
+        bucket.blob.return_value.upload_from_string.side_effect = (
+            lambda payload, **kwargs: uploaded.append(payload)
+        )
+        output = MagicMock()
+        output.download_as_bytes.return_value = (
+            b'{"instance": {"content": "b"}, "predictions": [{"embeddings": {"values": [2, 0]}}]}\n'
+            b"\n"
+            b'{"instance": {"content": "a"}, "predictions": [{"embeddings": {"values": [1, 0]}}]}\n'
+        )
+        model.batch_predict.return_value.iter_outputs.return_value = [output]
+        service = VertexEmbeddingService(model_name="custom-model", normalize=False)
+        loads = vertex_embeddings._json_loads if fast_json else json.loads
+
+        with (
+            patch(f"{MODULE}.orjson", vertex_embeddings.orjson if fast_json else None),
+            patch(f"{MODULE}._json_loads", loads),
+            patch(f"{MODULE}.storage.Client") as client,
+            patch(f"{MODULE}.settings.vertex_batch_min_requests", 1),
+            patch(f"{MODULE}.settings.vertex_batch_mode_enabled", True),
+            patch(f"{MODULE}.settings.vertex_batch_gcs_prefix", "gs://bucket/p"),
+        ):
+            client.return_value.bucket.return_value = bucket
+            embeddings = service.batch_embed_offline_array(["a", "b"])
+
+        assert [json.loads(line) for line in uploaded[0].splitlines()] == [
+            {"content": "a"},
+            {"content": "b"},
+        ]
+        assert embeddings.tolist() == [[1.0, 0.0], [2.0, 0.0]]
+
+
+class TestGetVertexEmbeddingService:
+    """Tests for the get_vertex_embedding_service singleton."""
+
+    def test_concurrent_first_calls_share_one_instance(self, model):
+        """Test that racing first calls create a single service."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        barrier = threading.Barrier(8)
+
+        def first_call():
+            barrier.wait()
+            return vertex_embeddings.get_vertex_embedding_service()
+
+        with (
+            patch(f"{MODULE}._embedding_service", None),
+            patch(f"{MODULE}.VertexEmbeddingService", wraps=VertexEmbeddingService) as cls,
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            futures = [executor.submit(first_call) for _ in range(8)]
+            results = [future.result() for future in futures]
+
+        assert len({id(result) for result in results}) == 1
+        cls.assert_called_once()
@@ -0,0 +1,270 @@
+"""Tests for the Vertex AI evaluators."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from psyai.core.exceptions import LLMError
+from psyai.platform.vertexai_integration.evaluation.evaluators import (
+    EvaluationResult,
+    VertexEvaluator,
+)
+
+MODULE = "psyai.platform.vertexai_integration.evaluation.evaluators"
+
+
+class FakeEvalTask:
+    """EvalTask that scores each row by its position and records every task."""
+
+    created = []
+
+    def __init__(self, dataset, metrics):
+        self.dataset = dataset
+        self.metrics = metrics
+        FakeEvalTask.created.append(self)
+
+    def evaluate(self):
+        rows = len(self.dataset["prompt"])
+        table = {
+            f"{metric.metric_name}/score": [float(i + 1) for i in range(rows)]
+            for metric in self.metrics
+        }
+        return MagicMock(metrics_table=table)
+
+
+@pytest.fixture
+def evaluator():
+    """Evaluator with AI Platform initialization and the evaluation service patched out."""
+    FakeEvalTask.created = []
+    with patch(f"{MODULE}.init_vertexai"), patch(f"{MODULE}.EvalTask", FakeEvalTask):
+        yield VertexEvaluator(project_id="test-project")
+
+
+class TestEvaluationResult:
+    """Tests for EvaluationResult."""
+
+    def test_slots(self):
+        """Test that results have no per-instance dict."""
+        result = EvaluationResult(metrics={"fluency": 1.0}, summary="ok")
+
+        assert result.details == {}
+        assert not hasattr(result, "__dict__")
+
+
+class TestEvaluate:
+    """Tests for evaluate."""
+
+    def test_all_metrics_in_one_task(self, evaluator):
+        """Test that every known metric is scored by a single evaluation task."""
+        result = evaluator.evaluate(
+            prompt="What is AI?",
+            response="Artificial intelligence.",
+            context="AI means artificial intelligence.",
+            metrics=["coherence", "fluency", "groundedness", "helpfulness"],
+        )
+
+        assert len(FakeEvalTask.created) == 1
+        task = FakeEvalTask.created[0]
+        assert [m.metric_name for m in task.metrics] == ["coherence", "fluency", "groundedness"]
+        assert task.dataset["prompt"] == ["AI means artificial intelligence.\n\nWhat is AI?"]
+        assert result.metrics == {
+            "coherence": 1.0,
+            "fluency": 1.0,
+            "groundedness": 1.0,
+            "helpfulness": 0.0,
+        }
+
+    def test_metric_lists_are_resolved_once(self, evaluator):
+        """Test that templates for a metric list are looked up once and reused."""
+        from psyai.platform.vertexai_integration.evaluation.evaluators import _resolve_metrics
+
+        _resolve_metrics.cache_clear()
+        for _ in range(3):
+            evaluator.evaluate(prompt="p", response="r", metrics=["fluency", "custom"])
+
+        assert _resolve_metrics.cache_info().misses == 1
+        assert [m.metric_name for m in FakeEvalTask.created[-1].metrics] == ["fluency"]
+
+    def test_disabled_skips_service(self, evaluator):
+        """Test that no task runs when evaluation is disabled."""
+        with patch(f"{MODULE}.settings.vertex_eval_enabled", False):
+            result = evaluator.evaluate(prompt="p", response="r", metrics=["fluency"])
+
+        assert FakeEvalTask.created == []
+        assert result.metrics == {"fluency": 0.0}
+
+
+class TestResultCache:
+    """Tests for the evaluation result cache."""
+
+    def test_repeated_inputs_skip_the_service(self, evaluator):
+        """Test that cached inputs are served from memory and left out of the task."""
+        evaluator.cache_results = True
+        first = evaluator.evaluate(prompt="p", response="r", metrics=["fluency"])
+        first.metrics["fluency"] = -1.0
+
+        results = evaluator.batch_evaluate(
+            [{"prompt": "p", "response": "r"}, {"prompt": "p", "response": "other"}],
+            metrics=["fluency"],
+        )
+
+        assert len(FakeEvalTask.created) == 2
+        assert FakeEvalTask.created[1].dataset["response"] == ["other"]
+        assert [r.metrics for r in results] == [{"fluency": 1.0}, {"fluency": 1.0}]
+
+    def test_key_includes_metrics(self, evaluator):
+        """Test that other metrics for the same input are not cache hits."""
+        evaluator.cache_results = True
+        evaluator.evaluate(prompt="p", response="r", metrics=["fluency"])
+        evaluator.evaluate(prompt="p", response="r", metrics=["coherence"])
+
+        assert len(FakeEvalTask.created) == 2
+
+
+class TestAbatchEvaluate:
+    """Tests for abatch_evaluate."""
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_and_keeps_failures_in_place(self, evaluator):
+        """Test that evaluations overlap and a failure does not fail the batch."""
+        in_flight = []
+        peak = []
+
+        async def fake_aevaluate(prompt, response, **kwargs):
+            in_flight.append(prompt)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(prompt)
+            if prompt == "bad":
+                raise LLMError("quota exceeded")
+            return EvaluationResult(metrics={"fluency": 1.0}, summary=prompt)
+
+        evaluations = [{"prompt": p, "response": "r"} for p in ("a", "bad", "c")]
+        with patch.object(evaluator, "aevaluate", side_effect=fake_aevaluate):
+            results = await evaluator.abatch_evaluate(evaluations)
+
+        assert max(peak) == 3
+        assert [r.summary for r in results] == ["a", "quota exceeded", "c"]
+        assert results[1].metrics == {}
+        assert results[1].details["error"]["message"] == "quota exceeded"
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_and_resolves_metrics_once(self, evaluator):
+        """Test that large batches respect the limit and share the default metrics."""
+        in_flight = []
+        peak = []
+        seen_metrics = []
+
+        async def fake_aevaluate(prompt, response, metrics=None, **kwargs):
+            seen_metrics.append(metrics)
+            in_flight.append(prompt)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(prompt)
+            return EvaluationResult(metrics={}, summary=prompt)
+
+        evaluations = [{"prompt": str(i), "response": "r"} for i in range(5)]
+        with (
+            patch.object(evaluator, "aevaluate", side_effect=fake_aevaluate),
+            patch(f"{MODULE}.settings.vertex_eval_concurrency", 2),
+            patch(f"{MODULE}.settings.vertex_eval_metrics", ["fluency"]),
+        ):
+            results = await evaluator.abatch_evaluate(evaluations)
+
+        assert max(peak) == 2
+        assert [r.summary for r in results] == ["0", "1", "2", "3", "4"]
+        assert all(metrics == ["fluency"] for metrics in seen_metrics)
+
+
+class TestBatchEvaluate:
+    """Tests for batch_evaluate."""
+
+    def test_matches_single_evaluations(self, evaluator):
+        """Test that batch results equal evaluating each input on its own."""
+        evaluations = [
+            {"prompt": "p1", "response": "r1", "context": "c1"},
+            {"prompt": "p2", "response": "r2", "reference": "ref"},
+        ]
+
+        results = evaluator.batch_evaluate(evaluations, metrics=["fluency"])
+        singles = [evaluator.evaluate(metrics=["fluency"], **e) for e in evaluations]
+
+        assert [(r.summary, r.details) for r in results] == [
+            (r.summary, r.details) for r in singles
+        ]
+        assert [r.metrics for r in results] == [{"fluency": 1.0}, {"fluency": 2.0}]
+        assert len(FakeEvalTask.created) == 1 + len(evaluations)
+
+
+class TestAiterEvaluate:
+    """Tests for aiter_evaluate."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self, evaluator):
+        """Test that fast results arrive first and failures are yielded as results."""
+
+        async def fake_aevaluate(prompt, response, **kwargs):
+            await asyncio.sleep(float(prompt))
+            if prompt == "0.02":
+                raise ValueError("boom")
+            return EvaluationResult(metrics={}, summary=prompt, details={"input": prompt})
+
+        evaluations = [{"prompt": p, "response": "r"} for p in ("0.03", "0.01", "0.02")]
+        with patch.object(evaluator, "aevaluate", side_effect=fake_aevaluate):
+            results = [result async for result in evaluator.aiter_evaluate(evaluations)]
+
+        assert [r.summary for r in results] == ["0.01", "Evaluation failed: boom", "0.03"]
+        assert results[1].details["input"] == evaluations[2]
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_cancels_pending(self, evaluator):
+        """Test that evaluations still running are cancelled when iteration stops."""
+        cancelled = []
+
+        async def fake_aevaluate(prompt, response, **kwargs):
+            try:
+                await asyncio.sleep(float(prompt))
+            except asyncio.CancelledError:
+                cancelled.append(prompt)
+                raise
+            return EvaluationResult(metrics={}, summary=prompt)
+
+        evaluations = [{"prompt": p, "response": "r"} for p in ("0", "10")]
+        with patch.object(evaluator, "aevaluate", side_effect=fake_aevaluate):
+            results = evaluator.aiter_evaluate(evaluations)
+            first = await results.__anext__()
+            await results.aclose()
+            await asyncio.sleep(0)
+
+        assert first.summary == "0"
+        assert cancelled == ["10"]
+
+
+class TestGetVertexEvaluator:
+    """Tests for the get_vertex_evaluator singleton."""
+
+    def test_concurrent_first_calls_share_one_instance(self):
+        """Test that racing first calls initialize AI Platform once."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from psyai.platform.vertexai_integration.evaluation import evaluators
+
+        barrier = threading.Barrier(8)
+
+        def first_call():
+            barrier.wait()
+            return evaluators.get_vertex_evaluator()
+
+        with (
+            patch(f"{MODULE}._evaluator", None),
+            patch(f"{MODULE}.init_vertexai") as init,
+            patch(f"{MODULE}.settings.gcp_project_id", "test-project"),
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            futures = [executor.submit(first_call) for _ in range(8)]
+            results = [future.result() for future in futures]
+
+        assert len({id(result) for result in results}) == 1
+        init.assert_called_once()
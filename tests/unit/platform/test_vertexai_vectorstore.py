@@ -0,0 +1,520 @@
+"""Tests for the Vertex AI vector store manager."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from psyai.platform.vertexai_integration.rag import vectorstore
+from psyai.platform.vertexai_integration.rag.vectorstore import VertexVectorStoreManager
+
+MODULE = "psyai.platform.vertexai_integration.rag.vectorstore"
+INIT_VERTEXAI = "psyai.platform.vertexai_integration.client.init_vertexai"
+
+
+def _embed(texts):
+    """Embed each text as [len(text), 1.0]."""
+    return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def clear_resources():
+    """Forget Vector Search handles shared by earlier tests."""
+    vectorstore._resources.clear()
+    yield
+    vectorstore._resources.clear()
+
+
+@pytest.fixture
+def embedding_service():
+    """Embedding service returning one float32 row per text (treated as normalized)."""
+    service = MagicMock(normalize=True)
+    service.embed_documents_array.side_effect = lambda texts, **kwargs: _embed(texts)
+    service.aembed_documents_array = AsyncMock(side_effect=lambda texts, **kwargs: _embed(texts))
+    return service
+
+
+@pytest.fixture
+def index():
+    """Mock Vector Search index."""
+    index = MagicMock()
+    with (
+        patch(INIT_VERTEXAI),
+        patch("google.cloud.aiplatform.MatchingEngineIndex", return_value=index),
+    ):
+        yield index
+
+
+@pytest.fixture
+def manager(embedding_service, index):
+    """Manager with a configured index."""
+    return VertexVectorStoreManager(index_id="idx", embedding_service=embedding_service)
+
+
+class TestEmbedding:
+    """Tests for embedding added texts."""
+
+    @pytest.mark.asyncio
+    async def test_chunking_is_passed_to_embedding_service(self, embedding_service, index):
+        """Test that chunk_size and max_concurrency drive the concurrent embedding."""
+        manager = VertexVectorStoreManager(
+            index_id="idx", embedding_service=embedding_service, chunk_size=64, max_concurrency=4
+        )
+
+        await manager.aadd_texts(["a", "b"])
+        manager.add_texts(["c"])
+
+        embedding_service.aembed_documents_array.assert_awaited_once_with(
+            ["a", "b"], batch_size=64, concurrency=4
+        )
+        embedding_service.embed_documents_array.assert_called_once_with(
+            ["c"], batch_size=64, concurrency=4
+        )
+
+
+class TestAddDocuments:
+    """Tests for adding Document objects."""
+
+    @pytest.mark.asyncio
+    async def test_documents_are_split_into_texts_and_metadatas(self, manager, index):
+        """Test that content and metadata reach the embedding and upsert steps."""
+        from psyai.platform.vertexai_integration.rag.vectorstore import Document
+
+        documents = [Document("a", {"source": "doc1"}), Document("bb", {"source": "doc2"})]
+
+        manager.add_documents(documents, ids=["x", "y"])
+        await manager.aadd_documents(documents, ids=["x", "y"])
+        assert manager.add_documents([]) == []
+
+        manager.embedding_service.embed_documents_array.assert_any_call(
+            ["a", "bb"], batch_size=None, concurrency=None
+        )
+        datapoints = index.upsert_datapoints.call_args.kwargs["datapoints"]
+        assert [dp.restricts[0].allow_list[0] for dp in datapoints] == ["doc1", "doc2"]
+
+
+class TestUpsert:
+    """Tests for upserting added texts to Vector Search."""
+
+    def test_add_texts_upserts_in_batches(self, manager, index):
+        """Test that datapoints are sent in VERTEX_UPSERT_BATCH_SIZE chunks."""
+        texts = ["a" * (i + 1) for i in range(5)]
+
+        with patch(f"{MODULE}.settings.vertex_upsert_batch_size", 2):
+            ids = manager.add_texts(texts, ids=[f"id{i}" for i in range(5)])
+
+        batches = [c.kwargs["datapoints"] for c in index.upsert_datapoints.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        datapoints = [dp for batch in batches for dp in batch]
+        assert [dp.datapoint_id for dp in datapoints] == ids
+        assert list(datapoints[2].feature_vector) == [3.0, 1.0]
+
+    def test_metadata_becomes_restricts(self, manager, index):
+        """Test that metadata keys become restrict namespaces."""
+        manager.add_texts(["a"], metadatas=[{"source": "doc1", "tags": ["x", 2], "page": None}])
+
+        datapoint = index.upsert_datapoints.call_args.kwargs["datapoints"][0]
+        restricts = {r.namespace: list(r.allow_list) for r in datapoint.restricts}
+        assert restricts == {"source": ["doc1"], "tags": ["x", "2"]}
+
+    @pytest.mark.asyncio
+    async def test_unnormalized_service_is_normalized(self, embedding_service, index):
+        """Test that vectors are sent unit length when the service does not normalize."""
+        embedding_service.normalize = False
+        manager = VertexVectorStoreManager(index_id="idx", embedding_service=embedding_service)
+
+        manager.add_texts(["aaa"])
+        await manager.aadd_texts(["aaa"])
+
+        for c in index.upsert_datapoints.call_args_list:
+            vector = list(c.kwargs["datapoints"][0].feature_vector)
+            assert vector == pytest.approx([3 / 10**0.5, 1 / 10**0.5])
+
+    @pytest.mark.asyncio
+    async def test_aadd_texts_upserts_every_batch(self, manager, index):
+        """Test that the async path upserts each batch off the event loop."""
+        with patch(f"{MODULE}.settings.vertex_upsert_batch_size", 2):
+            ids = await manager.aadd_texts(["a", "bb", "ccc"])
+
+        batches = [c.kwargs["datapoints"] for c in index.upsert_datapoints.call_args_list]
+        assert sorted(dp.datapoint_id for batch in batches for dp in batch) == sorted(ids)
+        assert len(batches) == 2
+
+    @pytest.mark.asyncio
+    async def test_pipelined_upsert_keeps_order(self, embedding_service, index):
+        """Test that slices embedded and uploaded in a pipeline cover every text in order."""
+        manager = VertexVectorStoreManager(
+            index_id="idx", embedding_service=embedding_service, local_index=True
+        )
+        texts = ["a" * (i + 1) for i in range(5)]
+
+        with patch(f"{MODULE}.settings.vertex_upsert_batch_size", 2):
+            ids = await manager.aadd_texts(texts, metadatas=[{"n": i} for i in range(5)])
+
+        assert embedding_service.aembed_documents_array.await_count == 3
+        datapoints = [
+            dp for c in index.upsert_datapoints.call_args_list for dp in c.kwargs["datapoints"]
+        ]
+        assert {dp.datapoint_id: dp.restricts[0].allow_list[0] for dp in datapoints} == {
+            doc_id: str(i) for i, doc_id in enumerate(ids)
+        }
+        assert manager._local_index._ids == ids
+
+    @pytest.mark.asyncio
+    async def test_pipelined_duplicates_are_embedded_once(self, manager, embedding_service):
+        """Test that texts repeated in later slices reuse earlier embeddings."""
+        with patch(f"{MODULE}.settings.vertex_upsert_batch_size", 2):
+            await manager.aadd_texts(["a", "bb", "bb", "a", "ccc"])
+
+        sent = [c.args[0] for c in embedding_service.aembed_documents_array.await_args_list]
+        assert sent == [["a", "bb"], ["ccc"]]
+
+    @pytest.mark.asyncio
+    async def test_pipelined_upsert_failure(self, manager, index):
+        """Test that an upload failure stops the pipeline and is reported."""
+        from psyai.core.exceptions import VectorStoreError
+
+        index.upsert_datapoints.side_effect = RuntimeError("quota")
+
+        with (
+            patch(f"{MODULE}.settings.vertex_upsert_batch_size", 1),
+            patch(f"{MODULE}.settings.vertex_upsert_concurrency", 1),
+            pytest.raises(VectorStoreError, match="quota"),
+        ):
+            await manager.aadd_texts(["a", "b", "c", "d"])
+
+    def test_no_index_skips_upsert(self, embedding_service):
+        """Test that texts are only embedded when no index is configured."""
+        with (
+            patch(INIT_VERTEXAI),
+            patch(f"{MODULE}.settings.vertex_index_id", None),
+        ):
+            manager = VertexVectorStoreManager(embedding_service=embedding_service)
+
+        ids = manager.add_texts(["a", "b"])
+
+        assert len(set(ids)) == 2
+        assert all(len(doc_id) == 32 and "-" not in doc_id for doc_id in ids)
+
+
+class TestQueryEmbeddingCache:
+    """Tests for reusing query embeddings across searches."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_queries_are_embedded_once(self):
+        """Test that hot queries skip the embedding call in both search paths."""
+        from psyai.platform.vertexai_integration.rag.embeddings import VertexEmbeddingService
+
+        model = MagicMock()
+        model.get_embeddings.side_effect = lambda texts, **kwargs: [
+            MagicMock(values=[float(len(text)), 1.0]) for text in texts
+        ]
+        model.get_embeddings_async = AsyncMock(side_effect=model.get_embeddings.side_effect)
+        with (
+            patch(INIT_VERTEXAI),
+            patch(
+                "psyai.platform.vertexai_integration.rag.embeddings"
+                ".TextEmbeddingModel.from_pretrained",
+                return_value=model,
+            ),
+        ):
+            service = VertexEmbeddingService(model_name="custom-model")
+            manager = VertexVectorStoreManager(embedding_service=service, local_index=True)
+            manager.add_texts(["alpha", "beta"])
+
+            for _ in range(3):
+                manager.similarity_search("What is PsyAI?", k=1)
+                await manager.asimilarity_search("What is PsyAI?", k=1)
+
+        assert model.get_embeddings.call_count == 2
+        model.get_embeddings_async.assert_not_awaited()
+
+
+class TestReingestion:
+    """Tests for re-adding previously embedded texts."""
+
+    def test_disk_cache_skips_embedding_on_reingestion(self, tmp_path, index):
+        """Test that a fresh service reuses embeddings persisted by an earlier run."""
+        from psyai.platform.vertexai_integration.rag.embeddings import VertexEmbeddingService
+
+        model = MagicMock()
+        model.get_embeddings.side_effect = lambda texts, **kwargs: [
+            MagicMock(values=[float(len(text)), 1.0]) for text in texts
+        ]
+        with (
+            patch(
+                "psyai.platform.vertexai_integration.rag.embeddings"
+                ".TextEmbeddingModel.from_pretrained",
+                return_value=model,
+            ),
+            patch(
+                "psyai.platform.vertexai_integration.rag.embeddings"
+                ".settings.vertex_embedding_cache_dir",
+                str(tmp_path),
+            ),
+        ):
+            for _ in range(2):
+                service = VertexEmbeddingService(model_name="custom-model")
+                manager = VertexVectorStoreManager(index_id="idx", embedding_service=service)
+                manager.add_texts(["alpha", "beta"])
+
+        model.get_embeddings.assert_called_once()
+        assert index.upsert_datapoints.call_count == 2
+
+
+class TestLocalIndex:
+    """Tests for the in-process index option."""
+
+    def test_quantized_local_index(self, embedding_service, index):
+        """Test that quantize stores local vectors as int8 and still ranks correctly."""
+        manager = VertexVectorStoreManager(
+            embedding_service=embedding_service, local_index=True, quantize=True
+        )
+        embedding_service.embed_query_array.return_value = np.array([3.0, 1.0], np.float32)
+        manager.add_texts(["a", "ccc"], ids=["short", "long"])
+
+        results = manager.similarity_search("query", k=1)
+
+        assert manager._local_index.quantize
+        assert results[0].metadata["id"] == "long"
+        assert results[0].metadata["distance"] == pytest.approx(1.0, abs=0.01)
+
+    def test_add_no_texts(self, embedding_service, index):
+        """Test that an empty add leaves the local index usable."""
+        manager = VertexVectorStoreManager(embedding_service=embedding_service, local_index=True)
+
+        assert manager.add_texts([]) == []
+        assert manager._local_index is not None
+        assert len(manager._local_index) == 0
+
+
+class TestSimilaritySearch:
+    """Tests for searching the deployed index."""
+
+    @pytest.fixture
+    def endpoint(self):
+        """Mock index endpoint returning two neighbors."""
+        endpoint = MagicMock()
+        endpoint.find_neighbors.return_value = [
+            [MagicMock(id="d1", distance=0.9), MagicMock(id="d2", distance=0.5)]
+        ]
+        with patch("google.cloud.aiplatform.MatchingEngineIndexEndpoint", return_value=endpoint):
+            yield endpoint
+
+    @pytest.fixture
+    def search_manager(self, embedding_service, index, endpoint):
+        """Manager with a deployed index endpoint."""
+        embedding_service.embed_query_array.return_value = np.array([1.0, 0.0], np.float32)
+        embedding_service.aembed_query_array = AsyncMock(
+            return_value=np.array([1.0, 0.0], np.float32)
+        )
+        return VertexVectorStoreManager(
+            index_endpoint_id="ep",
+            deployed_index_id="dep",
+            embedding_service=embedding_service,
+        )
+
+    @pytest.mark.asyncio
+    async def test_neighbors_become_documents(self, search_manager, endpoint):
+        """Test that sync and async searches convert neighbors the same way."""
+        results = search_manager.similarity_search("query", k=2)
+        async_results = await search_manager.asimilarity_search("query", k=2)
+
+        for documents in (results, async_results):
+            assert [doc.metadata for doc in documents] == [
+                {"id": "d1", "distance": 0.9},
+                {"id": "d2", "distance": 0.5},
+            ]
+            assert documents[0].page_content == "Document d1"
+        assert endpoint.find_neighbors.call_args.kwargs == {
+            "deployed_index_id": "dep",
+            "queries": [[1.0, 0.0]],
+            "num_neighbors": 2,
+            "filter": None,
+            "return_full_datapoint": False,
+        }
+
+    @pytest.mark.asyncio
+    async def test_search_with_score_queries_once(self, search_manager, endpoint):
+        """Test that scored searches return neighbor distances from a single request."""
+        scored = search_manager.similarity_search_with_score("query", k=2)
+        async_scored = await search_manager.asimilarity_search_with_score("query", k=2)
+
+        for results in (scored, async_scored):
+            assert [(doc.metadata["id"], score) for doc, score in results] == [
+                ("d1", 0.9),
+                ("d2", 0.5),
+            ]
+        assert endpoint.find_neighbors.call_count == 2
+
+    def test_filter_is_sent_as_namespaces(self, search_manager, endpoint):
+        """Test that a metadata filter restricts the Vector Search query."""
+        search_manager.similarity_search("query", k=2, filter={"source": ["doc1", "doc2"]})
+
+        (namespace,) = endpoint.find_neighbors.call_args.kwargs["filter"]
+        assert namespace.name == "source"
+        assert namespace.allow_tokens == ["doc1", "doc2"]
+
+    @pytest.mark.asyncio
+    async def test_filter_applies_to_local_index(self, embedding_service, index):
+        """Test that the local index ranks only documents passing the filter."""
+        manager = VertexVectorStoreManager(embedding_service=embedding_service, local_index=True)
+        embedding_service.embed_query_array.return_value = np.array([3.0, 1.0], np.float32)
+        embedding_service.aembed_query_array = AsyncMock(
+            return_value=np.array([3.0, 1.0], np.float32)
+        )
+        manager.add_texts(
+            ["a", "ccc", "ccc"],
+            metadatas=[{"lang": "en"}, {"lang": "fr"}, {"lang": ["de", "en"]}],
+            ids=["en", "fr", "multi"],
+        )
+
+        results = manager.similarity_search("query", k=3, filter={"lang": "en"})
+        async_results = await manager.asimilarity_search("query", k=3, filter={"lang": "en"})
+
+        for documents in (results, async_results):
+            assert [doc.metadata["id"] for doc in documents] == ["multi", "en"]
+
+    @pytest.mark.asyncio
+    async def test_async_search_runs_off_the_event_loop(self, search_manager, endpoint):
+        """Test that the blocking find_neighbors call runs on the Vector Search pool."""
+        import threading
+
+        threads = []
+        neighbors = endpoint.find_neighbors.return_value
+        endpoint.find_neighbors.side_effect = lambda **kwargs: (
+            threads.append(threading.current_thread().name) or neighbors
+        )
+
+        await search_manager.asimilarity_search("query", k=2)
+        await search_manager.asimilarity_search_batch(["query"], k=2)
+
+        assert len(threads) == 2
+        assert all(name.startswith("psyai-vector-search") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_batch_search_uses_one_request(self, search_manager, endpoint):
+        """Test that several queries share one embedding call and one find_neighbors call."""
+        endpoint.find_neighbors.return_value = [
+            [MagicMock(id="d1", distance=0.9)],
+            [MagicMock(id="d2", distance=0.8)],
+        ]
+
+        results = search_manager.similarity_search_batch(["a", "bb"], k=1)
+        async_results = await search_manager.asimilarity_search_batch(["a", "bb"], k=1)
+
+        for batch in (results, async_results):
+            assert [[doc.metadata["id"] for doc in docs] for docs in batch] == [["d1"], ["d2"]]
+        assert endpoint.find_neighbors.call_count == 2
+        assert endpoint.find_neighbors.call_args.kwargs["queries"] == [[1.0, 1.0], [2.0, 1.0]]
+        assert search_manager.similarity_search_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_fetch_k_reranks_candidates(self, search_manager, endpoint):
+        """Test that over-fetched neighbors are rescored exactly and cut to k."""
+        endpoint.find_neighbors.return_value = [
+            [
+                MagicMock(id="d1", distance=0.9, feature_vector=[0.2, 0.9]),
+                MagicMock(id="d2", distance=0.8, feature_vector=[0.9, 0.1]),
+                MagicMock(id="d3", distance=0.7, feature_vector=[0.6, 0.8]),
+            ]
+        ]
+
+        scored = search_manager.similarity_search_with_score("query", k=2, fetch_k=3)
+        async_scored = await search_manager.asimilarity_search_with_score("query", k=2, fetch_k=3)
+
+        for results in (scored, async_scored):
+            assert [doc.metadata["id"] for doc, _ in results] == ["d2", "d3"]
+            assert [score for _, score in results] == pytest.approx([0.9, 0.6])
+        assert endpoint.find_neighbors.call_args.kwargs["num_neighbors"] == 3
+        assert endpoint.find_neighbors.call_args.kwargs["return_full_datapoint"] is True
+
+    def test_managers_share_endpoint_handle(self):
+        """Test that managers for the same endpoint reuse one handle and match client."""
+        with (
+            patch(INIT_VERTEXAI),
+            patch("google.cloud.aiplatform.MatchingEngineIndexEndpoint") as cls,
+        ):
+            cls.side_effect = lambda index_endpoint_name: MagicMock(name=index_endpoint_name)
+            first, second, other = (
+                VertexVectorStoreManager(index_endpoint_id=name, embedding_service=MagicMock())
+                for name in ("ep", "ep", "ep2")
+            )
+
+        assert first._index_endpoint is second._index_endpoint
+        assert other._index_endpoint is not first._index_endpoint
+        assert cls.call_count == 2
+
+    def test_document_has_slots(self):
+        """Test that documents carry no per-instance dict."""
+        from psyai.platform.vertexai_integration.rag.vectorstore import Document
+
+        assert not hasattr(Document("text"), "__dict__")
+
+    def test_neighbor_metadata_is_built_on_access(self):
+        """Test that search results build their metadata dict lazily, once."""
+        from psyai.platform.vertexai_integration.rag.vectorstore import Document
+
+        document = Document._from_neighbor("Document d1", "d1", 0.9)
+
+        assert document._metadata is None
+        assert document.metadata == {"id": "d1", "distance": 0.9}
+        assert document.metadata is document.metadata
+        document.metadata = {"source": "doc1"}
+        assert document.metadata == {"source": "doc1"}
+
+
+class TestDelete:
+    """Tests for removing datapoints."""
+
+    @pytest.mark.parametrize("batch_size, expected", [(1000, [3]), (2, [2, 1])])
+    def test_delete_removes_in_batches(self, manager, index, batch_size, expected):
+        """Test that IDs are removed in VERTEX_REMOVE_BATCH_SIZE chunks."""
+        with patch(f"{MODULE}.settings.vertex_remove_batch_size", batch_size):
+            manager.delete(["a", "b", "c"])
+
+        batches = [c.kwargs["datapoint_ids"] for c in index.remove_datapoints.call_args_list]
+        assert sorted(len(batch) for batch in batches) == sorted(expected)
+        assert sorted(doc_id for batch in batches for doc_id in batch) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_adelete_removes_every_batch(self, manager, index):
+        """Test that the async path removes each batch."""
+        with patch(f"{MODULE}.settings.vertex_remove_batch_size", 2):
+            await manager.adelete(["a", "b", "c"])
+
+        assert index.remove_datapoints.call_count == 2
+
+    def test_delete_failure(self, manager, index):
+        """Test that remove errors surface as VectorStoreError."""
+        from psyai.core.exceptions import VectorStoreError
+
+        index.remove_datapoints.side_effect = RuntimeError("not found")
+
+        with pytest.raises(VectorStoreError, match="not found"):
+            manager.delete(["a"])
+
+
+class TestImport:
+    """Tests for import cost."""
+
+    def test_module_import_does_not_load_vertex_sdk(self):
+        """Test that importing the vector store leaves the Vertex AI SDK unloaded."""
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import psyai.platform.vertexai_integration.rag.vectorstore\n"
+            "print('vertexai' in sys.modules, 'google.cloud.aiplatform' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        assert result.stdout.split() == ["False", "False"]